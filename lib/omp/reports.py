@@ -6,6 +6,31 @@ from lib.pipecad import *
 
 import pandas as pd
 
+from pipecad.JobRunner import Job
+from pipecad.JobDialog import RunJob
+
+class ReportJob(Job):
+    name = "Quick Report"
+
+    def __init__(self, theType, theRoot, theHeaders):
+        self.type = theType
+        self.root = theRoot
+        self.headers = theHeaders
+    # __init__
+
+    def Snapshot(self, theContext):
+        # Attribute reads go to the host, collect the rows on the main thread.
+        aCollection = PipeCad.CollectItem(self.type, self.root)
+        aTotal = len(aCollection)
+        aRows = []
+        for i in range(aTotal):
+            aRows.append([getattr(aCollection[i], aHeader) for aHeader in self.headers])
+            theContext.Progress(i + 1, aTotal, "Read %d/%d" % (i + 1, aTotal))
+        # for
+        return aRows
+    # Snapshot
+# ReportJob
+
 class ReportDialog(QDialog):
     def __init__(self, parent = None):
         QDialog.__init__(self, parent)
@@ -224,12 +249,14 @@ class ReportDialog(QDialog):
         self.tablePreview.setRowCount(0)
         self.tablePreview.setColumnCount(len(self.ColumnsHeaders))
         self.tablePreview.setHorizontalHeaderLabels(self.ColumnsHeaders)
-        aCollection = PipeCad.CollectItem(self.lstType.currentText, PipeCad.GetItem(self.txtHierarchy.text) )      
-        for i in range( len(aCollection) ):
-            aRow = self.tablePreview.rowCount
-            self.tablePreview.insertRow(aRow)
-            for j in range( len(self.ColumnsHeaders) ):           
-                self.tablePreview.setItem(aRow, j, QTableWidgetItem( getattr(aCollection[i] , self.ColumnsHeaders[j] ) ) )
+        aResult = RunJob(ReportJob(self.lstType.currentText, PipeCad.GetItem(self.txtHierarchy.text), list(self.ColumnsHeaders)), self)
+        if aResult.result is None:
+            return
+        # if
+        self.tablePreview.setRowCount(len(aResult.result))
+        for i, aValues in enumerate(aResult.result):
+            for j, aValue in enumerate(aValues):
+                self.tablePreview.setItem(i, j, QTableWidgetItem( aValue ) )
 
 # Singleton Instance.
 aReportDialog = ReportDialog(PipeCad)
@@ -0,0 +1,416 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Catalogue database service.
+# One QSqlDatabase connection per thread to catalogues/PipeStd.db, opened on
+# first use with the catalogue pragmas and after the schema migrations.
+# Statements are prepared once per connection and reused with bound values,
+# the counters in CATALOGUE_TIMING show what the queries cost. Small static
+# tables such as HEAD are kept in memory until the database file changes.
+# CatalogueSearch finds categories, standards and records in the SEARCH full
+# text index, falling back on LIKE when the index is not there.
+# With PIPECAD_CATALOGUE_SNAPSHOT=1 or UseCatalogueSnapshot() lookups read a
+# local immutable snapshot, copied again when the source file changes; the
+# standard editor keeps reading and writing the source.
+
+from PythonQt.QtCore import *
+from PythonQt.QtSql import *
+
+import os
+import re
+import time
+import atexit
+import threading
+
+from pipecad.CatalogueMigration import CATALOGUE_DATABASE, MigrateCatalogue
+from pipecad.CatalogueSnapshot import CATALOGUE_SNAPSHOT_MMAP, SnapshotUri, SnapshotFileName, CopyCatalogue, RemoveSnapshot
+
+CATALOGUE_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA cache_size = -16384",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA foreign_keys = ON",
+)
+
+CATALOGUE_TIMING = {"connections": 0, "prepares": 0, "executes": 0, "rows": 0, "seconds": 0.0, "cold": 0, "coldSeconds": 0.0, "warmSeconds": 0.0}
+
+# Seconds between checks of the source file in snapshot mode.
+CATALOGUE_SNAPSHOT_CHECK = 5.0
+
+# Prepared statements keyed by (connection name, sql), and the keys run before.
+aCatalogueQueries = dict()
+aCatalogueWarm = set()
+aCatalogueLock = threading.Lock()
+aCatalogueMigrated = False
+
+# HEAD rows keyed by (purpose, type), and the file stamp they were read at.
+aCatalogueHeadings = None
+aCatalogueHeadingsStamp = None
+
+# SEARCH_SOURCE as {source: table}, empty when there is no full text index.
+aCatalogueSources = None
+
+# The local snapshot, stamp is the source stamp it was copied at.
+aCatalogueSnapshot = {
+    "enabled": os.getenv("PIPECAD_CATALOGUE_SNAPSHOT", "0") not in ("", "0"),
+    "file": None,
+    "stamp": None,
+    "generation": 0,
+    "checked": 0.0,
+    "copies": 0,
+    "copySeconds": 0.0,
+}
+aCatalogueThread = threading.local()
+
+CATALOGUE_SEARCH_SQL = "SELECT rowid >> 32, rowid & 4294967295, text FROM SEARCH WHERE SEARCH MATCH ? ORDER BY rank LIMIT ?"
+CATALOGUE_LIKE_SQL = (
+    "SELECT 'CATE', id, name || ' ' || IFNULL(tooltip, '') FROM CATE WHERE name LIKE ? OR tooltip LIKE ? "
+    "UNION ALL SELECT 'SDTE', id, name || ' ' || IFNULL(detail, '') FROM SDTE WHERE name LIKE ? OR detail LIKE ? LIMIT ?"
+)
+
+
+def CatalogueUpgrade():
+    global aCatalogueMigrated
+
+    with aCatalogueLock:
+        if not aCatalogueMigrated:
+            aCatalogueMigrated = True
+            try:
+                MigrateCatalogue(CATALOGUE_DATABASE)
+            except Exception as e:
+                # A read-only catalogue still works, only without the new indexes.
+                print("Catalogue migration failed: " + str(e))
+            # try
+        # if
+    # with
+# CatalogueUpgrade
+
+def CatalogueDatabase():
+    """Return the catalogue connection of the calling thread."""
+
+    aName = "PipeStd_%d" % threading.get_ident()
+    if QSqlDatabase.contains(aName):
+        return QSqlDatabase.database(aName)
+    # if
+
+    CatalogueUpgrade()
+
+    aStartTime = time.perf_counter()
+
+    aDatabase = QSqlDatabase.addDatabase("QSQLITE", aName)
+    aDatabase.setDatabaseName(CATALOGUE_DATABASE)
+    if aDatabase.open():
+        for aPragma in CATALOGUE_PRAGMAS:
+            aDatabase.exec(aPragma)
+        # for
+    # if
+
+    CATALOGUE_TIMING["connections"] += 1
+    CATALOGUE_TIMING["seconds"] += time.perf_counter() - aStartTime
+
+    return aDatabase
+# CatalogueDatabase
+
+def UseCatalogueSnapshot(theEnabled = True):
+    """Serve the lookups of CatalogueRows from a local snapshot of the catalogue."""
+
+    aCatalogueSnapshot["enabled"] = theEnabled
+    aCatalogueSnapshot["checked"] = 0.0
+# UseCatalogueSnapshot
+
+def RefreshSnapshot():
+    # Copy the catalogue again when its stamp changed, checked at most every
+    # CATALOGUE_SNAPSHOT_CHECK seconds so lookups do not stat a network share.
+    aNow = time.monotonic()
+    if aCatalogueSnapshot["file"] is not None and aNow - aCatalogueSnapshot["checked"] < CATALOGUE_SNAPSHOT_CHECK:
+        return
+    # if
+
+    with aCatalogueLock:
+        aCatalogueSnapshot["checked"] = aNow
+
+        # Stamp before the copy, a write during the copy brings the next refresh.
+        aStamp = CatalogueStamp()
+        if aCatalogueSnapshot["file"] is not None and aStamp == aCatalogueSnapshot["stamp"]:
+            return
+        # if
+
+        aOldFileName = aCatalogueSnapshot["file"]
+        aGeneration = aCatalogueSnapshot["generation"] + 1
+        aFileName = SnapshotFileName(aGeneration)
+
+        aCatalogueSnapshot["copySeconds"] += CopyCatalogue(CATALOGUE_DATABASE, aFileName)
+        aCatalogueSnapshot["copies"] += 1
+        aCatalogueSnapshot["file"] = aFileName
+        aCatalogueSnapshot["stamp"] = aStamp
+        aCatalogueSnapshot["generation"] = aGeneration
+
+        if aOldFileName is not None:
+            RemoveSnapshot(aOldFileName)
+        # if
+    # with
+# RefreshSnapshot
+
+def CloseConnection(theName):
+    for aKey in [aKey for aKey in aCatalogueQueries if aKey[0] == theName]:
+        aCatalogueQueries.pop(aKey).finish()
+        aCatalogueWarm.discard(aKey)
+    # for
+
+    QSqlDatabase.database(theName, False).close()
+    QSqlDatabase.removeDatabase(theName)
+# CloseConnection
+
+def CatalogueReader():
+    """Return the connection lookups read from, the thread's snapshot connection in snapshot mode."""
+
+    if not aCatalogueSnapshot["enabled"]:
+        return CatalogueDatabase()
+    # if
+
+    CatalogueUpgrade()
+
+    try:
+        RefreshSnapshot()
+    except Exception as e:
+        print("Catalogue snapshot failed: " + str(e))
+        aCatalogueSnapshot["enabled"] = False
+        return CatalogueDatabase()
+    # try
+
+    aName = "PipeStdSnapshot_%d_%d" % (aCatalogueSnapshot["generation"], threading.get_ident())
+    if QSqlDatabase.contains(aName):
+        return QSqlDatabase.database(aName)
+    # if
+
+    # A new snapshot, let go of this thread's connection to the previous one.
+    aOldName = getattr(aCatalogueThread, "snapshot", None)
+    if aOldName is not None and QSqlDatabase.contains(aOldName):
+        CloseConnection(aOldName)
+    # if
+    aCatalogueThread.snapshot = aName
+
+    aStartTime = time.perf_counter()
+
+    aDatabase = QSqlDatabase.addDatabase("QSQLITE", aName)
+    aDatabase.setConnectOptions("QSQLITE_OPEN_READONLY;QSQLITE_OPEN_URI")
+    aDatabase.setDatabaseName(SnapshotUri(aCatalogueSnapshot["file"]))
+    if aDatabase.open():
+        aDatabase.exec("PRAGMA mmap_size = %d" % CATALOGUE_SNAPSHOT_MMAP)
+    # if
+
+    CATALOGUE_TIMING["connections"] += 1
+    CATALOGUE_TIMING["seconds"] += time.perf_counter() - aStartTime
+
+    return aDatabase
+# CatalogueReader
+
+def CatalogueQuery(theSql, theDatabase = None):
+    """Return the prepared statement for theSql on theDatabase, by default the calling thread's reader."""
+
+    aDatabase = CatalogueReader() if theDatabase is None else theDatabase
+    aKey = (aDatabase.connectionName(), theSql)
+    aQuery = aCatalogueQueries.get(aKey)
+    if aQuery is None:
+        aStartTime = time.perf_counter()
+
+        aQuery = QSqlQuery(aDatabase)
+        aQuery.setForwardOnly(True)
+        if not aQuery.prepare(theSql):
+            raise RuntimeError("Prepare failed: " + aQuery.lastError().text() + "\n" + theSql)
+        # if
+
+        aCatalogueQueries[aKey] = aQuery
+        CATALOGUE_TIMING["prepares"] += 1
+        CATALOGUE_TIMING["seconds"] += time.perf_counter() - aStartTime
+    # if
+
+    return aQuery
+# CatalogueQuery
+
+def CatalogueRows(theSql, theValues = (), theDatabase = None):
+    """Run a prepared statement with positional ? values, return the rows as tuples."""
+
+    aDatabase = CatalogueReader() if theDatabase is None else theDatabase
+    aQuery = CatalogueQuery(theSql, aDatabase)
+
+    # The first run of a statement pays for the schema and the pages it reads.
+    aKey = (aDatabase.connectionName(), theSql)
+    aCold = aKey not in aCatalogueWarm
+    aCatalogueWarm.add(aKey)
+
+    aStartTime = time.perf_counter()
+
+    for i, aValue in enumerate(theValues):
+        aQuery.bindValue(i, aValue)
+    # for
+
+    if not aQuery.exec():
+        raise RuntimeError("Query failed: " + aQuery.lastError().text() + "\n" + theSql)
+    # if
+
+    aRows = []
+    aCount = aQuery.record().count()
+    while aQuery.next():
+        aRows.append(tuple(aQuery.value(i) for i in range(aCount)))
+    # while
+
+    # Release the read cursor, the statement itself stays prepared.
+    aQuery.finish()
+
+    aSeconds = time.perf_counter() - aStartTime
+    CATALOGUE_TIMING["executes"] += 1
+    CATALOGUE_TIMING["rows"] += len(aRows)
+    CATALOGUE_TIMING["seconds"] += aSeconds
+    if aCold:
+        CATALOGUE_TIMING["cold"] += 1
+        CATALOGUE_TIMING["coldSeconds"] += aSeconds
+    else:
+        CATALOGUE_TIMING["warmSeconds"] += aSeconds
+    # if
+
+    return aRows
+# CatalogueRows
+
+def CatalogueStamp():
+    # Committed changes land in the -wal file until a checkpoint, so stamp both.
+    aStamp = []
+    for aFileName in (CATALOGUE_DATABASE, CATALOGUE_DATABASE + "-wal"):
+        try:
+            aStat = os.stat(aFileName)
+            aStamp.append((aStat.st_mtime_ns, aStat.st_size))
+        except OSError:
+            aStamp.append(None)
+        # try
+    # for
+
+    return tuple(aStamp)
+# CatalogueStamp
+
+def CatalogueReadStamp():
+    # The stamp of what the lookups see, in snapshot mode the copied source.
+    if aCatalogueSnapshot["enabled"]:
+        CatalogueReader()
+    # if
+
+    if aCatalogueSnapshot["enabled"]:
+        return aCatalogueSnapshot["stamp"]
+    # if
+
+    return CatalogueStamp()
+# CatalogueReadStamp
+
+def CatalogueHeadings():
+    """Return the HEAD table as {(purpose, type): head}, reread only when the database file changes."""
+
+    global aCatalogueHeadings, aCatalogueHeadingsStamp
+
+    aStamp = CatalogueReadStamp()
+    if aCatalogueHeadings is None or aStamp != aCatalogueHeadingsStamp:
+        aHeadings = dict()
+        for aPurpose, aType, aHead in CatalogueRows("SELECT purpose, type, head FROM HEAD ORDER BY id"):
+            aHeadings.setdefault((aPurpose, aType), aHead)
+        # for
+
+        aCatalogueHeadings = aHeadings
+        aCatalogueHeadingsStamp = aStamp
+    # if
+
+    return aCatalogueHeadings
+# CatalogueHeadings
+
+def CatalogueMatch(theText):
+    # Every word as a prefix, all of them must match: "flange weld" -> "flange"* "weld"*.
+    return " ".join('"%s"*' % aWord for aWord in re.findall(r"\w+", theText))
+# CatalogueMatch
+
+def CatalogueSearch(theText, theLimit = 50, theDatabase = None):
+    """Return the best matches of theText as (table, id, text, cate id, sdte id)."""
+
+    global aCatalogueSources
+
+    aMatch = CatalogueMatch(theText)
+    if len(aMatch) < 1:
+        return []
+    # if
+
+    if aCatalogueSources is None:
+        try:
+            aCatalogueSources = dict(CatalogueRows("SELECT id, name FROM SEARCH_SOURCE", (), theDatabase))
+        except RuntimeError as e:
+            aCatalogueSources = dict()
+        # try
+    # if
+
+    aHits = None
+    if len(aCatalogueSources) > 0:
+        try:
+            aHits = [(aCatalogueSources.get(aSource), aId, aText) for aSource, aId, aText in CatalogueRows(CATALOGUE_SEARCH_SQL, (aMatch, theLimit), theDatabase)]
+        except RuntimeError as e:
+            # An SQLite build without FTS5 reading the index, search the names instead.
+            aCatalogueSources = dict()
+        # try
+    # if
+
+    if aHits is None:
+        aLike = "%" + theText.strip() + "%"
+        aHits = CatalogueRows(CATALOGUE_LIKE_SQL, (aLike, aLike, aLike, aLike, theLimit), theDatabase)
+    # if
+
+    # Place every hit in the standard tree, by primary key lookups.
+    aResults = []
+    for aTable, aId, aText in aHits:
+        if aTable == "CATE":
+            aResults.append((aTable, aId, aText, aId, None))
+        elif aTable == "SDTE":
+            for aCateId, in CatalogueRows("SELECT pid FROM SDTE WHERE id=?", (aId,), theDatabase):
+                aResults.append((aTable, aId, aText, aCateId, aId))
+            # for
+        elif aTable == "SKEY":
+            for aCateId, in CatalogueRows("SELECT CATE.id FROM SKEY JOIN CATE ON CATE.name=SKEY.Skey WHERE SKEY.rowid=?", (aId,), theDatabase):
+                aResults.append((aTable, aId, aText, aCateId, None))
+            # for
+        elif aTable is not None:
+            for aSdteId, aCateId in CatalogueRows('SELECT SDTE.id, SDTE.pid FROM "%s" AS R JOIN SDTE ON SDTE.id=R.pid WHERE R.rowid=?' % aTable, (aId,), theDatabase):
+                aResults.append((aTable, aId, aText, aCateId, aSdteId))
+            # for
+        # if
+    # for
+
+    return aResults
+# CatalogueSearch
+
+def CatalogueTiming():
+    aTiming = dict(CATALOGUE_TIMING)
+    aTiming["warm"] = aTiming["executes"] - aTiming["cold"]
+    aTiming["coldAverage"] = aTiming["coldSeconds"] * 1000.0 / max(aTiming["cold"], 1)
+    aTiming["warmAverage"] = aTiming["warmSeconds"] * 1000.0 / max(aTiming["warm"], 1)
+
+    aText = "%(connections)d connections, %(prepares)d prepares, %(executes)d queries, %(rows)d rows in %(seconds).3fs" % aTiming
+    aText += "; %(cold)d cold queries %(coldAverage).3f ms, %(warm)d warm queries %(warmAverage).3f ms on average" % aTiming
+    if aCatalogueSnapshot["copies"] > 0:
+        aText += "; %(copies)d snapshot copies in %(copySeconds).3fs" % aCatalogueSnapshot
+    # if
+
+    return aText
+# CatalogueTiming
+
+def RemoveSessionSnapshot():
+    if aCatalogueSnapshot["file"] is not None:
+        RemoveSnapshot(aCatalogueSnapshot["file"])
+    # if
+# RemoveSessionSnapshot
+
+atexit.register(RemoveSessionSnapshot)
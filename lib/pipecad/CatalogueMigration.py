@@ -0,0 +1,240 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Versioned schema migrations for the standard catalogue database.
+# PRAGMA user_version records the last applied step; each pending step runs
+# in its own transaction together with the version bump, so an interrupted
+# upgrade leaves the database at the previous version.
+#
+#   python -m pipecad.CatalogueMigration [catalogues/PipeStd.db] [--check]
+# upgrades the database and prints the query plans of the hot queries.
+
+import sys
+import sqlite3
+import argparse
+
+CATALOGUE_DATABASE = "catalogues/PipeStd.db"
+
+
+def IndexParents(theConnection):
+    # Every table keyed to its owner by pid: SECT, CATE, SDTE and the standards.
+    aTables = [aRow[0] for aRow in theConnection.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+    for aTable in aTables:
+        aColumns = [aRow[1] for aRow in theConnection.execute("PRAGMA table_info(\"%s\")" % aTable)]
+        if "pid" in aColumns:
+            theConnection.execute("CREATE INDEX IF NOT EXISTS \"%s_pid\" ON \"%s\" (pid)" % (aTable, aTable))
+        # if
+    # for
+# IndexParents
+
+def IndexHeadings(theConnection):
+    theConnection.execute("CREATE INDEX IF NOT EXISTS HEAD_purpose_type ON HEAD (purpose, type)")
+# IndexHeadings
+
+def SearchSources(theConnection):
+    # (table, text expression) of everything the standard browser can find:
+    # categories, standards, SKEY descriptions and the ItemCode of every record.
+    aSources = [("CATE", "name, tooltip"), ("SDTE", "name, detail"), ("SKEY", "Skey, Detail")]
+    aTables = [aRow[0] for aRow in theConnection.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+    for aTable in aTables:
+        aColumns = [aRow[1].lower() for aRow in theConnection.execute("PRAGMA table_info(\"%s\")" % aTable)]
+        if "pid" in aColumns and "itemcode" in aColumns and aTable.upper() not in ("SECT", "CATE", "SDTE"):
+            aSources.append((aTable, "ItemCode"))
+        # if
+    # for
+
+    return aSources
+# SearchSources
+
+def HasFts5(theConnection):
+    try:
+        theConnection.execute("CREATE VIRTUAL TABLE temp.FTS5_PROBE USING fts5(text)")
+    except sqlite3.OperationalError as e:
+        return False
+    # try
+
+    theConnection.execute("DROP TABLE temp.FTS5_PROBE")
+    return True
+# HasFts5
+
+def IndexSearch(theConnection):
+    # SEARCH is an FTS5 index keyed by rowid = source << 32 | id, with the
+    # source numbers in SEARCH_SOURCE, so the triggers keep it in sync with
+    # rowid lookups only.
+    if not HasFts5(theConnection):
+        # The triggers would make every write fail with "no such module",
+        # without the index CatalogueSearch falls back on LIKE.
+        return
+    # if
+
+    theConnection.execute("CREATE TABLE SEARCH_SOURCE (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)")
+    theConnection.execute("CREATE VIRTUAL TABLE SEARCH USING fts5(text, prefix='1 2 3')")
+
+    for aSource, (aTable, aColumns) in enumerate(SearchSources(theConnection), 1):
+        theConnection.execute("INSERT INTO SEARCH_SOURCE (id, name) VALUES (?, ?)", (aSource, aTable))
+
+        # {0} is NEW or OLD in the triggers.
+        aRowId = "%d * 4294967296 + {0}.rowid" % aSource
+        aText = " || ' ' || ".join("IFNULL({0}.%s, '')" % aColumn.strip() for aColumn in aColumns.split(","))
+        aInsert = "INSERT INTO SEARCH (rowid, text) VALUES (%s, %s);" % (aRowId, aText)
+        aDelete = "DELETE FROM SEARCH WHERE rowid = %s;" % aRowId
+
+        theConnection.execute("INSERT INTO SEARCH (rowid, text) SELECT %s, %s FROM \"%s\" AS NEW" % (aRowId.format("NEW"), aText.format("NEW"), aTable))
+        theConnection.execute("CREATE TRIGGER \"%s_search_insert\" AFTER INSERT ON \"%s\" BEGIN %s END" % (aTable, aTable, aInsert.format("NEW")))
+        theConnection.execute("CREATE TRIGGER \"%s_search_update\" AFTER UPDATE ON \"%s\" BEGIN %s %s END" % (aTable, aTable, aDelete.format("OLD"), aInsert.format("NEW")))
+        theConnection.execute("CREATE TRIGGER \"%s_search_delete\" AFTER DELETE ON \"%s\" BEGIN %s END" % (aTable, aTable, aDelete.format("OLD")))
+    # for
+
+    theConnection.execute("INSERT INTO SEARCH (SEARCH) VALUES ('optimize')")
+# IndexSearch
+
+# Steel density in kg/mm3, plain carbon steel 7850 kg/m3.
+STEEL_DENSITY = 7.85e-6
+
+# DN -> wall thickness in mm of ASME B36.10 schedule 80 pipe.
+SCH80_WALLS = {
+    "6": 2.41, "8": 3.02, "10": 3.20, "15": 3.73, "20": 3.91, "25": 4.55,
+    "32": 4.85, "40": 5.08, "50": 5.54, "65": 7.01, "80": 7.62, "90": 8.08,
+    "100": 8.56, "125": 9.53, "150": 10.97, "200": 12.70, "250": 15.09,
+    "300": 17.48, "350": 19.05, "400": 21.44, "450": 23.83, "500": 26.19,
+    "550": 28.58, "600": 30.96,
+}
+
+# (standard detail pattern, DN -> wall thickness) of the tubes with a known schedule.
+TUBE_SCHEDULES = [
+    ("%SCH80%B36.10%", SCH80_WALLS),
+]
+
+def TubeWeight(theOd, theWall):
+    # Unit weight in kg/m of a tube: steel section area times density.
+    return round(3.141592653589793 * (theOd - theWall) * theWall * STEEL_DENSITY * 1000.0, 2)
+# TubeWeight
+
+def WeighTubes(theConnection):
+    # UWEIGHT is the unit weight of a standards record, kg/m for TUBE. Tubes of
+    # an unknown schedule keep NULL, the PCF export then leaves WEIGHT empty.
+    theConnection.execute("ALTER TABLE TUBE ADD COLUMN UWEIGHT REAL")
+
+    for aPattern, aWalls in TUBE_SCHEDULES:
+        aRows = theConnection.execute("SELECT Id, DN, OD FROM TUBE WHERE pid IN (SELECT id FROM SDTE WHERE detail LIKE ?)", (aPattern,)).fetchall()
+        for aId, aDn, aOd in aRows:
+            aWall = aWalls.get(str(aDn).strip())
+            if aWall == None:
+                continue
+            # if
+
+            theConnection.execute("UPDATE TUBE SET UWEIGHT = ? WHERE Id = ?", (TubeWeight(aOd, aWall), aId))
+        # for
+    # for
+# WeighTubes
+
+# (user_version, description, step), append new steps with the next version.
+CATALOGUE_MIGRATIONS = [
+    (1, "Index pid columns", IndexParents),
+    (2, "Index HEAD by purpose and type", IndexHeadings),
+    (3, "Full text search index", IndexSearch),
+    (4, "Unit weight of schedule tubes", WeighTubes),
+]
+
+# (description, query, index the plan must use).
+CATALOGUE_PLANS = [
+    ("Standards of a category", "SELECT id, name, detail FROM SDTE WHERE pid=1 ORDER BY id", "SDTE_pid"),
+    ("Standards per category", "SELECT pid, COUNT(*) FROM SDTE GROUP BY pid", "SDTE_pid"),
+    ("Categories of a section", "SELECT id, name, tooltip FROM CATE WHERE pid=1", "CATE_pid"),
+    ("Sections of a catalogue", "SELECT id, name, icon FROM SECT WHERE pid=1", "SECT_pid"),
+    ("Records of a standard", "SELECT * FROM ELBW WHERE pid=1", "ELBW_pid"),
+    ("Headings of a purpose", "SELECT type, name FROM HEAD WHERE purpose='PIPE'", "HEAD_purpose_type"),
+    ("Heading of a type", "SELECT type, head FROM HEAD WHERE purpose='PIPE' AND type='TUBE'", "HEAD_purpose_type"),
+]
+
+
+def CatalogueVersion(theConnection):
+    return theConnection.execute("PRAGMA user_version").fetchone()[0]
+# CatalogueVersion
+
+def MigrateCatalogue(theFileName = CATALOGUE_DATABASE):
+    """Apply the pending migrations, return (old version, new version)."""
+
+    aConnection = sqlite3.connect(theFileName, isolation_level=None)
+    try:
+        aOldVersion = CatalogueVersion(aConnection)
+        aVersion = aOldVersion
+        for aStepVersion, aDescription, aStep in CATALOGUE_MIGRATIONS:
+            if aStepVersion <= aVersion:
+                continue
+            # if
+
+            aConnection.execute("BEGIN IMMEDIATE")
+            try:
+                aStep(aConnection)
+                aConnection.execute("PRAGMA user_version = %d" % aStepVersion)
+                aConnection.execute("COMMIT")
+            except:
+                aConnection.execute("ROLLBACK")
+                raise
+            # try
+
+            aVersion = aStepVersion
+        # for
+
+        if aVersion > aOldVersion:
+            aConnection.execute("ANALYZE")
+        # if
+
+        return aOldVersion, aVersion
+    finally:
+        aConnection.close()
+    # try
+# MigrateCatalogue
+
+def ExplainCatalogue(theFileName = CATALOGUE_DATABASE):
+    """Return (description, plan, uses expected index) for every hot query."""
+
+    aPlans = []
+    aConnection = sqlite3.connect(theFileName)
+    try:
+        for aDescription, aQuery, aIndex in CATALOGUE_PLANS:
+            aPlan = "; ".join(aRow[-1] for aRow in aConnection.execute("EXPLAIN QUERY PLAN " + aQuery))
+            aPlans.append((aDescription, aPlan, ("INDEX " + aIndex) in aPlan))
+        # for
+    finally:
+        aConnection.close()
+    # try
+
+    return aPlans
+# ExplainCatalogue
+
+def main(theArgs = None):
+    aParser = argparse.ArgumentParser(description="Upgrade the standard catalogue database schema.")
+    aParser.add_argument("database", nargs="?", default=CATALOGUE_DATABASE, help="catalogue database (default: %(default)s)")
+    aParser.add_argument("--check", action="store_true", help="only print the query plans, do not migrate")
+    aArgs = aParser.parse_args(theArgs)
+
+    if not aArgs.check:
+        aOldVersion, aVersion = MigrateCatalogue(aArgs.database)
+        print("%s: version %d -> %d" % (aArgs.database, aOldVersion, aVersion))
+    # if
+
+    aIndexed = True
+    for aDescription, aPlan, aOk in ExplainCatalogue(aArgs.database):
+        print("%-4s %-26s %s" % ("ok" if aOk else "SCAN", aDescription, aPlan))
+        aIndexed = aIndexed and aOk
+    # for
+
+    return 0 if aIndexed else 1
+# main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Local read-only snapshots of the standard catalogue.
+# The catalogue may live on a slow network share; a snapshot is a copy in the
+# local temp directory taken with the SQLite backup API, so it is consistent
+# even while others write, and opened with immutable=1 so SQLite skips all
+# locking and change detection and reads the pages through mmap.
+#
+#   python -m pipecad.CatalogueSnapshot [catalogues/PipeStd.db] [-r 20]
+# prints the cold and warm latency of the hot queries on the source and on a
+# snapshot. Cold is the first run on a new connection, warm the best repeat.
+
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import tempfile
+
+from urllib.request import pathname2url
+
+from pipecad.CatalogueMigration import CATALOGUE_DATABASE, CATALOGUE_PLANS
+
+CATALOGUE_SNAPSHOT_DIR = os.path.join(tempfile.gettempdir(), "PipeCAD")
+
+CATALOGUE_SNAPSHOT_MMAP = 268435456
+
+
+def SnapshotUri(theFileName, theImmutable = True):
+    aUri = "file:" + pathname2url(os.path.abspath(theFileName))
+    return aUri + ("?immutable=1" if theImmutable else "?mode=ro")
+# SnapshotUri
+
+def SnapshotFileName(theGeneration = 0):
+    # One file per process and refresh, a snapshot is never written once open.
+    return os.path.join(CATALOGUE_SNAPSHOT_DIR, "PipeStd-%d-%d.db" % (os.getpid(), theGeneration))
+# SnapshotFileName
+
+def CopyCatalogue(theSource, theTarget):
+    """Copy theSource to theTarget with the backup API, return the seconds taken."""
+
+    aStartTime = time.perf_counter()
+
+    os.makedirs(os.path.dirname(os.path.abspath(theTarget)), exist_ok=True)
+
+    # Copy next to the target and rename, so a snapshot is never seen half written.
+    aPartName = theTarget + ".part"
+    aSource = sqlite3.connect(SnapshotUri(theSource, False), uri=True)
+    try:
+        aTarget = sqlite3.connect(aPartName)
+        try:
+            aSource.backup(aTarget)
+            aTarget.execute("PRAGMA journal_mode = DELETE")
+        finally:
+            aTarget.close()
+        # try
+    finally:
+        aSource.close()
+    # try
+
+    os.replace(aPartName, theTarget)
+
+    return time.perf_counter() - aStartTime
+# CopyCatalogue
+
+def RemoveSnapshot(theFileName):
+    try:
+        os.remove(theFileName)
+    except OSError as e:
+        # Still open elsewhere on Windows, the temp directory keeps it.
+        pass
+    # try
+# RemoveSnapshot
+
+def CatalogueLatency(theUri, theRepeat = 20):
+    """Return (description, cold seconds, warm seconds) of the hot queries."""
+
+    aLatency = []
+    for aDescription, aQuery, aIndex in CATALOGUE_PLANS:
+        aConnection = sqlite3.connect(theUri, uri=True)
+        try:
+            aConnection.execute("PRAGMA mmap_size = %d" % CATALOGUE_SNAPSHOT_MMAP)
+
+            aTimes = []
+            for i in range(max(theRepeat, 2)):
+                aStartTime = time.perf_counter()
+                aConnection.execute(aQuery).fetchall()
+                aTimes.append(time.perf_counter() - aStartTime)
+            # for
+        finally:
+            aConnection.close()
+        # try
+
+        aLatency.append((aDescription, aTimes[0], min(aTimes[1:])))
+    # for
+
+    return aLatency
+# CatalogueLatency
+
+def main(theArgs = None):
+    aParser = argparse.ArgumentParser(description="Compare catalogue query latency on the source and on a local snapshot.")
+    aParser.add_argument("database", nargs="?", default=CATALOGUE_DATABASE, help="catalogue database (default: %(default)s)")
+    aParser.add_argument("-r", "--repeat", type=int, default=20, help="runs of every query")
+    aArgs = aParser.parse_args(theArgs)
+
+    aSnapshot = SnapshotFileName()
+    aSeconds = CopyCatalogue(aArgs.database, aSnapshot)
+    print("Snapshot %s in %.1f ms" % (aSnapshot, aSeconds * 1000.0))
+
+    try:
+        aSource = CatalogueLatency(SnapshotUri(aArgs.database, False), aArgs.repeat)
+        aLocal = CatalogueLatency(SnapshotUri(aSnapshot), aArgs.repeat)
+    finally:
+        RemoveSnapshot(aSnapshot)
+    # try
+
+    print("%-26s %10s %10s %10s %10s" % ("Query (ms)", "cold", "warm", "snap cold", "snap warm"))
+    for (aDescription, aCold, aWarm), (aName, aSnapCold, aSnapWarm) in zip(aSource, aLocal):
+        print("%-26s %10.3f %10.3f %10.3f %10.3f" % (aDescription, aCold * 1000.0, aWarm * 1000.0, aSnapCold * 1000.0, aSnapWarm * 1000.0))
+    # for
+
+    return 0
+# main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Whole catalogue validation of the standards tables, no PythonQt dependency.
+# Every standards table is read into a DataFrame by its own worker and checked
+# with column-wise rules:
+#   - ItemCode missing or duplicated, also across tables, and codes differing
+#     only in case, which are warnings;
+#   - pid not referring to a standard (SDTE), and SDTE/CATE not in the tree;
+#   - dimension values that are not numbers, and numeric columns that hold
+#     text throughout, which are reported once instead of row by row;
+#   - bores (DN, NA or N1) going down within a standard;
+#   - bore pairs with the small end larger than the large end, or reducers
+#     whose outside diameters do not follow their bores.
+#
+#   python -m pipecad.CatalogueValidator [catalogues/PipeStd.db] [-j 4] [--csv issues.csv]
+# prints the report and exits with 1 when there are issues other than warnings.
+
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import concurrent.futures
+
+import pandas as pd
+
+from pipecad.CatalogueMigration import CATALOGUE_DATABASE
+from pipecad.CatalogueSnapshot import SnapshotUri
+
+# Issues listed in the summary, the rest are only counted.
+VALIDATE_ISSUE_LIMIT = 40
+
+# Bore columns, the first one present is the main bore of a record.
+VALIDATE_BORES = ("DN", "NA", "N1")
+
+# (large bore, small bore, large diameter, small diameter) of branch and reducing
+# standards, the diameters are only checked where the table has them.
+VALIDATE_BORE_PAIRS = (
+    ("NA", "NB", "A", "B"),
+    ("N1", "N2", "D1", "D2"),
+)
+
+# Standards whose ends must differ, the others may be equal (equal tees).
+VALIDATE_REDUCERS = ("REBW", "RCBW", "ESBW")
+
+VALIDATE_COLUMNS = ["table", "id", "ItemCode", "rule", "message"]
+
+# Rules of lower severity, reported after the others and not failing the check.
+VALIDATE_WARNINGS = ("ItemCode case",)
+
+
+class ValidationReport(object):
+    def __init__(self):
+        self.tables = 0
+        self.rows = 0
+        self.issues = pd.DataFrame(columns=VALIDATE_COLUMNS)
+        self.seconds = 0.0
+    # __init__
+
+    def Counts(self):
+        return self.issues.groupby("rule").size().sort_values(ascending=False)
+    # Counts
+
+    def Errors(self):
+        return self.issues[~self.issues["rule"].isin(VALIDATE_WARNINGS)]
+    # Errors
+
+    def Summary(self):
+        aErrors = len(self.Errors())
+        aLines = ["Checked %d rows in %d tables in %.2fs, %d issues, %d warnings." % (self.rows, self.tables, self.seconds, aErrors, len(self.issues) - aErrors)]
+        for aRule, aCount in self.Counts().items():
+            aLines.append("  %s: %d%s" % (aRule, aCount, " (warning)" if aRule in VALIDATE_WARNINGS else ""))
+        # for
+
+        for aIssue in self.issues.head(VALIDATE_ISSUE_LIMIT).itertuples(index=False):
+            aWhere = [str(aValue) for aValue in (aIssue.table, aIssue.id, aIssue.ItemCode) if not pd.isna(aValue)]
+            aLines.append("%s: %s" % (" ".join(aWhere), aIssue.message))
+        # for
+
+        if len(self.issues) > VALIDATE_ISSUE_LIMIT:
+            aLines.append("... %d more" % (len(self.issues) - VALIDATE_ISSUE_LIMIT))
+        # if
+
+        return "\n".join(aLines)
+    # Summary
+# ValidationReport
+
+def Issues(theFrame, theMask, theTable, theRule, theMessages):
+    # One issue per flagged row, theMessages is a string or a Series of strings.
+    aRows = theFrame[theMask]
+    if len(aRows) < 1:
+        return None
+    # if
+
+    aIssues = pd.DataFrame({"table": theTable, "id": aRows.iloc[:, 0].values, "ItemCode": aRows["ItemCode"].values if "ItemCode" in aRows else None, "rule": theRule})
+    aIssues["message"] = theMessages[theMask].values if isinstance(theMessages, pd.Series) else theMessages
+    return aIssues
+# Issues
+
+def NumericColumns(theConnection, theTable):
+    # Dimensions as (name, declared type): the bores and every column declared
+    # with a numeric type.
+    aColumns = []
+    for aRow in theConnection.execute("PRAGMA table_info(\"%s\")" % theTable):
+        aName, aType = aRow[1], aRow[2].upper()
+        if aName.lower() in ("id", "pid"):
+            continue
+        elif aName.upper() in [aPair[0] for aPair in VALIDATE_BORE_PAIRS] + [aPair[1] for aPair in VALIDATE_BORE_PAIRS] + list(VALIDATE_BORES):
+            aColumns.append((aName, aType))
+        elif any(aKey in aType for aKey in ("INT", "REAL", "FLOA", "DOUB", "DEC", "NUM")):
+            aColumns.append((aName, aType))
+        # if
+    # for
+
+    return aColumns
+# NumericColumns
+
+def ValidateTable(theFileName, theTable, theStandards):
+    """Check one standards table, return (rows, issues DataFrame) and its ItemCodes."""
+
+    aConnection = sqlite3.connect(SnapshotUri(theFileName, False), uri=True)
+    try:
+        aFrame = pd.read_sql_query("SELECT * FROM \"%s\" ORDER BY rowid" % theTable, aConnection)
+        aNumericColumns = NumericColumns(aConnection, theTable)
+    finally:
+        aConnection.close()
+    # try
+
+    aIssues = []
+    aColumns = dict((aColumn.upper(), aColumn) for aColumn in aFrame.columns)
+
+    if "ItemCode" in aFrame:
+        aCodes = aFrame["ItemCode"].astype(str).str.strip()
+        aMissing = aFrame["ItemCode"].isna() | (aCodes == "")
+        aIssues.append(Issues(aFrame, aMissing, theTable, "ItemCode missing", "ItemCode is empty"))
+
+        # Codes differing only in spaces collide in the design model.
+        aDuplicated = aCodes.duplicated(keep=False) & ~aMissing
+        aIssues.append(Issues(aFrame, aDuplicated, theTable, "ItemCode duplicated", "ItemCode " + aFrame["ItemCode"].astype(str) + " is used more than once"))
+
+        # Codes differing only in case are distinct names, but easily mistaken.
+        aCaseOnly = aCodes.str.upper().duplicated(keep=False) & ~aDuplicated & ~aMissing
+        aIssues.append(Issues(aFrame, aCaseOnly, theTable, "ItemCode case", "ItemCode " + aFrame["ItemCode"].astype(str) + " differs from another only in case"))
+    else:
+        aCodes = pd.Series(dtype=str)
+    # if
+
+    aOrphaned = ~aFrame["pid"].isin(theStandards)
+    aIssues.append(Issues(aFrame, aOrphaned, theTable, "pid orphaned", "pid " + aFrame["pid"].astype(str) + " is no standard"))
+
+    # Coerce every dimension once, the rules below work on the numbers.
+    aNumbers = dict()
+    for aColumn, aType in aNumericColumns:
+        aValues = aFrame[aColumn]
+        aColumnNumbers = pd.to_numeric(aValues, errors="coerce")
+        aPresent = aValues.notna() & (aValues.astype(str).str.strip() != "")
+        aBad = aPresent & aColumnNumbers.isna()
+
+        if aBad.sum() * 2 > aPresent.sum():
+            # Mostly text, such as connection types in a REAL column: the type is wrong, not the rows.
+            aIssues.append(pd.DataFrame({"table": [theTable], "id": [None], "ItemCode": [None], "rule": ["column type"], "message": ["%s is declared %s but holds text such as '%s'" % (aColumn, aType or "untyped", aValues[aBad].iloc[0])]}))
+            continue
+        # if
+
+        aNumbers[aColumn.upper()] = aColumnNumbers
+        aIssues.append(Issues(aFrame, aBad, theTable, "not numeric", aColumn + " '" + aValues.astype(str) + "' is not a number"))
+    # for
+
+    for aBore in VALIDATE_BORES:
+        if aBore in aNumbers:
+            # A smaller bore than any row before it in the same standard.
+            aPrevious = aNumbers[aBore].groupby(aFrame["pid"]).cummax().groupby(aFrame["pid"]).shift()
+            aDown = aNumbers[aBore] < aPrevious
+            aIssues.append(Issues(aFrame, aDown, theTable, "bore order", aColumns[aBore] + " " + aFrame[aColumns[aBore]].astype(str) + " after " + aPrevious.map("{:g}".format)))
+            break
+        # if
+    # for
+
+    for aLarge, aSmall, aLargeDiameter, aSmallDiameter in VALIDATE_BORE_PAIRS:
+        if aLarge not in aNumbers or aSmall not in aNumbers:
+            continue
+        # if
+
+        aDelta = aNumbers[aLarge] - aNumbers[aSmall]
+        aBad = (aDelta <= 0) if theTable.upper() in VALIDATE_REDUCERS else (aDelta < 0)
+        aMessage = aColumns[aSmall] + " " + aNumbers[aSmall].astype(str) + " not below " + aColumns[aLarge] + " " + aNumbers[aLarge].astype(str)
+        aIssues.append(Issues(aFrame, aBad, theTable, "bore pair", aMessage))
+
+        if aLargeDiameter in aNumbers and aSmallDiameter in aNumbers:
+            # The outside diameters must rank like the bores.
+            aDiameterDelta = aNumbers[aLargeDiameter] - aNumbers[aSmallDiameter]
+            aMismatch = aDelta.notna() & aDiameterDelta.notna() & (((aDelta > 0) != (aDiameterDelta > 0)) | ((aDelta == 0) != (aDiameterDelta == 0)))
+            aMessage = aColumns[aLargeDiameter] + "/" + aColumns[aSmallDiameter] + " " + aNumbers[aLargeDiameter].astype(str) + "/" + aNumbers[aSmallDiameter].astype(str) + " do not follow the bores"
+            aIssues.append(Issues(aFrame, aMismatch, theTable, "diameter pair", aMessage))
+        # if
+    # for
+
+    aIssues = [aIssue for aIssue in aIssues if aIssue is not None]
+    aIssues = pd.concat(aIssues, ignore_index=True) if len(aIssues) > 0 else None
+
+    return len(aFrame), aIssues, pd.DataFrame({"table": theTable, "code": aCodes})
+# ValidateTable
+
+def ValidateTree(theConnection):
+    # Standards and categories outside the tree are never shown nor built.
+    aIssues = []
+    for aTable, aOwner in (("SDTE", "CATE"), ("CATE", "SECT")):
+        aFrame = pd.read_sql_query("SELECT id, name AS ItemCode, pid FROM %s" % aTable, theConnection)
+        aOwners = pd.read_sql_query("SELECT id FROM %s" % aOwner, theConnection)["id"]
+        aIssues.append(Issues(aFrame, ~aFrame["pid"].isin(aOwners), aTable, "pid orphaned", "pid " + aFrame["pid"].astype(str) + " is no " + aOwner))
+    # for
+
+    return [aIssue for aIssue in aIssues if aIssue is not None]
+# ValidateTree
+
+def StandardTables(theConnection):
+    aTables = []
+    for aRow in theConnection.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"):
+        aColumns = [aColumn[1].lower() for aColumn in theConnection.execute("PRAGMA table_info(\"%s\")" % aRow[0])]
+        if "pid" in aColumns and aRow[0].upper() not in ("SECT", "CATE", "SDTE"):
+            aTables.append(aRow[0])
+        # if
+    # for
+
+    return aTables
+# StandardTables
+
+def ValidateCatalogue(theFileName = CATALOGUE_DATABASE, theWorkers = None, theProgress = None):
+    """Validate all standards tables of theFileName in parallel, return a ValidationReport."""
+
+    aReport = ValidationReport()
+    aStartTime = time.perf_counter()
+
+    aFileName = os.path.abspath(theFileName)
+    aConnection = sqlite3.connect(SnapshotUri(aFileName, False), uri=True)
+    try:
+        aTables = StandardTables(aConnection)
+        aStandards = pd.read_sql_query("SELECT id FROM SDTE", aConnection)["id"]
+        aIssues = ValidateTree(aConnection)
+    finally:
+        aConnection.close()
+    # try
+
+    aCodes = []
+    aWorkers = theWorkers or min(len(aTables), os.cpu_count() or 1) or 1
+    with concurrent.futures.ThreadPoolExecutor(max_workers=aWorkers) as aExecutor:
+        aFutures = [aExecutor.submit(ValidateTable, aFileName, aTable, aStandards) for aTable in aTables]
+        for i, aFuture in enumerate(concurrent.futures.as_completed(aFutures)):
+            aRows, aTableIssues, aTableCodes = aFuture.result()
+            aReport.tables += 1
+            aReport.rows += aRows
+            if aTableIssues is not None:
+                aIssues.append(aTableIssues)
+            # if
+            aCodes.append(aTableCodes)
+
+            if theProgress is not None:
+                theProgress(i + 1, len(aTables), "Validate table %d/%d" % (i + 1, len(aTables)))
+            # if
+        # for
+    # with
+
+    # The same ItemCode in two tables makes weight and SKEY lookups ambiguous.
+    if len(aCodes) > 0:
+        aCodes = pd.concat(aCodes, ignore_index=True)
+        aCodes = aCodes[aCodes["code"].notna() & (aCodes["code"] != "") & (aCodes["code"] != "NONE")].drop_duplicates()
+        aShared = aCodes[aCodes["code"].duplicated(keep=False)]
+        if len(aShared) > 0:
+            aTablesOfCode = aShared.groupby("code")["table"].apply(", ".join)
+            aIssues.append(pd.DataFrame({"table": aShared["table"].values, "id": None, "ItemCode": aShared["code"].values, "rule": "ItemCode shared", "message": "ItemCode " + aShared["code"] + " is in " + aShared["code"].map(aTablesOfCode)}))
+        # if
+    # if
+
+    if len(aIssues) > 0:
+        aIssues = pd.concat(aIssues, ignore_index=True)
+        aIssues["warning"] = aIssues["rule"].isin(VALIDATE_WARNINGS)
+        aReport.issues = aIssues.sort_values(["warning", "table", "rule"], kind="stable", ignore_index=True)[VALIDATE_COLUMNS]
+    # if
+
+    aReport.seconds = time.perf_counter() - aStartTime
+
+    return aReport
+# ValidateCatalogue
+
+def main(theArgs = None):
+    aParser = argparse.ArgumentParser(description="Validate the standards tables of the catalogue.")
+    aParser.add_argument("database", nargs="?", default=CATALOGUE_DATABASE, help="catalogue database (default: %(default)s)")
+    aParser.add_argument("-j", "--jobs", type=int, default=None, help="tables checked in parallel (default: CPU count)")
+    aParser.add_argument("--csv", help="write all issues to this CSV file")
+    aArgs = aParser.parse_args(theArgs)
+
+    aReport = ValidateCatalogue(aArgs.database, aArgs.jobs)
+    print(aReport.Summary())
+
+    if aArgs.csv:
+        aReport.issues.to_csv(aArgs.csv, index=False)
+    # if
+
+    return 0 if len(aReport.Errors()) < 1 else 1
+# main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,6 +22,8 @@ from PythonQt.QtSql import *
 
 from lib.pipecad import *
 
+from pipecad.CatalogueDb import CatalogueRows
+
 class SdteDialog(QDialog):
     def __init__(self, parent = None):
         QDialog.__init__(self, parent)
@@ -55,30 +57,14 @@ class SdteDialog(QDialog):
 
         self.treeWidget.currentItemChanged.connect(self.currentItemChanged)
 
-        aDatabase = QSqlDatabase.addDatabase("QSQLITE", "PipeStd_TEXT")
-        aDatabase.setDatabaseName("catalogues/PipeStd.db")
-        aDatabase.open()
-
-        self.typeModel = QSqlQueryModel()
-        self.typeModel.setQuery("SELECT DISTINCT Type, Icon FROM SKEY", aDatabase)
-
-        for i in range(self.typeModel.rowCount()):
-            aRecord = self.typeModel.record(i)
-            aType = aRecord.value("Type")
-            aIcon = ":/PipeCad/Resources/" + str(aRecord.value("Icon"))
+        for aType, aIconName in CatalogueRows("SELECT DISTINCT Type, Icon FROM SKEY"):
+            aIcon = ":/PipeCad/Resources/" + str(aIconName)
 
             aTypeItem = QTreeWidgetItem(self.treeWidget)
             aTypeItem.setText(0, aType)
             aTypeItem.setIcon(0, QIcon(aIcon))
 
-            self.skeyModel = QSqlQueryModel()
-            self.skeyModel.setQuery("SELECT Skey, Detail FROM SKEY WHERE Type='" + aType + "'", aDatabase)
-
-            for j in range(self.skeyModel.rowCount()):
-                aRecord = self.skeyModel.record(j)
-                aSkey = aRecord.value("Skey")
-                aDetail = aRecord.value("Detail")
-
+            for aSkey, aDetail in CatalogueRows("SELECT Skey, Detail FROM SKEY WHERE Type=?", (aType,)):
                 aSkeyItem = QTreeWidgetItem(aTypeItem)
                 aSkeyItem.setText(0, aSkey)
                 aSkeyItem.setText(1, aDetail)
@@ -0,0 +1,191 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+
+
+# Headless stand-in for the PipeCad host, no PythonQt dependency.
+# It implements the part of the host API used by the jobs (items with
+# attributes, CurrentItem, GetItem, CollectItem, CreateItem, DeleteItem,
+# transactions), so JobRunner jobs and the PythonQt-free modules can be run
+# and timed from a plain python interpreter:
+#
+#   aHost = HeadlessHost()
+#   aHost.Install()
+#   aPipe = aHost.CreateItem("PIPE", "/P1")
+#   ...
+#   JobRunner().Run(aJob)
+
+import builtins
+
+
+class HeadlessItem(object):
+    def __init__(self, theHost, theType, theName = "", theOwner = None):
+        self.__dict__["host"] = theHost
+        self.__dict__["Type"] = theType
+        self.__dict__["Name"] = theName
+        self.__dict__["Owner"] = theOwner
+        self.__dict__["Member"] = []
+        self.__dict__["RefNo"] = "=%d/%d" % (theHost.database, len(theHost.items) + 1)
+        self.__dict__["attributes"] = dict()
+    # __init__
+
+    def __getattr__(self, theName):
+        self.host.calls += 1
+        try:
+            return self.attributes[theName]
+        except KeyError as e:
+            raise AttributeError(theName)
+        # try
+    # __getattr__
+
+    def __setattr__(self, theName, theValue):
+        self.host.calls += 1
+        if theName == "Name":
+            self.host.Rename(self, theValue)
+        else:
+            self.attributes[theName] = theValue
+        # if
+    # __setattr__
+
+    def __repr__(self):
+        return "<%s %s %s>" % (self.Type, self.RefNo, self.Name)
+    # __repr__
+# HeadlessItem
+
+class HeadlessHost(object):
+    def __init__(self, theDatabase = 1):
+        self.database = theDatabase
+        self.items = []
+        self.names = dict()
+        self.current = None
+        self.transactions = 0
+        self.calls = 0
+        self.world = HeadlessItem(self, "WORL", "/*")
+    # __init__
+
+    def Install(self):
+        # Make the stand-in the global PipeCad of the plugin modules.
+        builtins.PipeCad = self
+    # Install
+
+    def Rename(self, theItem, theName):
+        if len(theItem.Name) > 0:
+            self.names.pop(theItem.Name, None)
+        # if
+
+        theItem.__dict__["Name"] = theName
+        if len(theName) > 0:
+            self.names[theName] = theItem
+        # if
+    # Rename
+
+    def CurrentItem(self):
+        self.calls += 1
+        return self.current
+    # CurrentItem
+
+    def SetCurrentItem(self, theItem):
+        self.calls += 1
+        if isinstance(theItem, str):
+            aItem = self.GetItem(theItem)
+            if aItem is None:
+                raise ValueError("No item " + theItem)
+            # if
+            theItem = aItem
+        # if
+
+        self.current = theItem
+    # SetCurrentItem
+
+    def GetItem(self, theName):
+        self.calls += 1
+        if theName in ("/*", ""):
+            return self.world
+        # if
+
+        # Names are stored without the leading slash used to refer to them.
+        if theName.startswith("/") and theName[1:] in self.names:
+            return self.names[theName[1:]]
+        # if
+
+        return self.names.get(theName)
+    # GetItem
+
+    def CreateItem(self, theType, theName = ""):
+        # Create the item below the current item and make it current.
+        self.calls += 1
+        if len(theName) > 0 and theName in self.names:
+            raise ValueError("Name " + theName + " already exists")
+        # if
+
+        aOwner = self.current or self.world
+        aItem = HeadlessItem(self, theType, "", aOwner)
+        self.items.append(aItem)
+        aOwner.Member.append(aItem)
+        self.Rename(aItem, theName)
+        self.current = aItem
+        return aItem
+    # CreateItem
+
+    def DeleteItem(self, theType):
+        # Delete the current item of theType with its members, its owner becomes current.
+        self.calls += 1
+        aItem = self.current
+        if aItem is None or aItem.Type != theType:
+            raise ValueError("Current item is no " + theType)
+        # if
+
+        aStack = [aItem]
+        while len(aStack) > 0:
+            aDeleted = aStack.pop()
+            self.items.remove(aDeleted)
+            if len(aDeleted.Name) > 0:
+                self.names.pop(aDeleted.Name, None)
+            # if
+            aStack.extend(aDeleted.Member)
+        # while
+
+        aItem.Owner.Member.remove(aItem)
+        self.current = aItem.Owner
+    # DeleteItem
+
+    def CollectItem(self, theType, theRoot = None):
+        self.calls += 1
+        aItems = []
+        aStack = [theRoot or self.world]
+        while len(aStack) > 0:
+            aItem = aStack.pop()
+            if len(theType) < 1 or aItem.Type == theType:
+                aItems.append(aItem)
+            # if
+            aStack.extend(reversed(aItem.Member))
+        # while
+
+        return aItems
+    # CollectItem
+
+    def StartTransaction(self, theName = ""):
+        self.calls += 1
+        self.transactions += 1
+    # StartTransaction
+
+    def CommitTransaction(self):
+        self.calls += 1
+    # CommitTransaction
+
+    def UpdateViewer(self):
+        pass
+    # UpdateViewer
+# HeadlessHost
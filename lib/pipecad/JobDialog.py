@@ -0,0 +1,88 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+
+
+from PythonQt.QtCore import *
+from PythonQt.QtGui import *
+from PythonQt.pipecad import *
+
+from lib.pipecad import *
+
+from pipecad.JobRunner import JobRunner
+
+
+class JobProgressDialog(object):
+    # JobRunner monitor on a modal QProgressDialog.
+
+    def __init__(self, theParent = None):
+        self.parent = theParent
+        self.dialog = None
+    # __init__
+
+    def Start(self, theName):
+        self.dialog = QProgressDialog(theName, QT_TRANSLATE_NOOP("PipeCAD", "Cancel"), 0, 0, self.parent)
+        self.dialog.setWindowTitle(theName)
+        self.dialog.setWindowModality(Qt.WindowModal)
+        self.dialog.setMinimumDuration(500)
+        self.dialog.setAutoClose(False)
+        self.dialog.setAutoReset(False)
+    # Start
+
+    def Update(self, theValue, theMaximum, theText):
+        if self.dialog.maximum != theMaximum:
+            self.dialog.setMaximum(theMaximum)
+        # if
+
+        self.dialog.setValue(min(theValue, theMaximum) if theMaximum > 0 else 0)
+        if len(theText) > 0:
+            self.dialog.setLabelText(theText)
+        # if
+    # Update
+
+    def ProcessEvents(self):
+        QCoreApplication.processEvents()
+    # ProcessEvents
+
+    def WasCanceled(self):
+        return self.dialog.wasCanceled
+    # WasCanceled
+
+    def Stop(self):
+        self.dialog.close()
+    # Stop
+# JobProgressDialog
+
+def RunJob(theJob, theParent = None):
+    # Run the job with a progress dialog, report errors, return the JobResult.
+    if theParent == None:
+        theParent = PipeCad
+    # if
+
+    aRunner = JobRunner(JobProgressDialog(theParent))
+    try:
+        aResult = aRunner.Run(theJob)
+    finally:
+        aRunner.Shutdown()
+    # try
+
+    print(aResult.Summary())
+
+    if len(aResult.error) > 0:
+        QMessageBox.critical(theParent, "", aResult.error)
+    # if
+
+    return aResult
+# RunJob
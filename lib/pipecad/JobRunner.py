@@ -0,0 +1,232 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+
+
+# Shared runner for long jobs, no PythonQt dependency.
+# A job is split into three phases:
+#   Snapshot: main thread, reads the host (PipeCad items, Qt models);
+#   Work:     worker thread, pure python on the snapshot, may use processes;
+#   Finish:   main thread, writes results back to the host or the UI.
+# Progress and cancellation go through a JobContext. The runner keeps the UI
+# responsive through a monitor: JobDialog.JobProgressDialog in PipeCAD, or
+# ConsoleMonitor when run headless (see HeadlessHost).
+
+import sys
+import time
+import threading
+import traceback
+import concurrent.futures
+
+
+class JobCancelled(Exception):
+    pass
+# JobCancelled
+
+class JobContext(object):
+    def __init__(self, theMonitor):
+        self.monitor = theMonitor
+        self.mainThread = threading.current_thread()
+        self.lock = threading.Lock()
+        self.value = 0
+        self.maximum = 0
+        self.text = ""
+        self.cancelled = False
+        self.lastEvents = 0.0
+    # __init__
+
+    def Cancel(self):
+        self.cancelled = True
+    # Cancel
+
+    def Check(self):
+        # Cooperative cancellation point.
+        if self.cancelled:
+            raise JobCancelled()
+        # if
+    # Check
+
+    def Progress(self, theValue, theMaximum = None, theText = None):
+        with self.lock:
+            self.value = theValue
+            if theMaximum != None:
+                self.maximum = theMaximum
+            # if
+            if theText != None:
+                self.text = theText
+            # if
+        # with
+
+        if threading.current_thread() is self.mainThread:
+            # Host bound phases run on the main thread, keep the UI alive.
+            aNow = time.perf_counter()
+            if aNow - self.lastEvents > 0.05:
+                self.lastEvents = aNow
+                self.Update()
+            # if
+        # if
+
+        self.Check()
+    # Progress
+
+    def Update(self):
+        with self.lock:
+            aState = (self.value, self.maximum, self.text)
+        # with
+
+        self.monitor.Update(*aState)
+        self.monitor.ProcessEvents()
+        if self.monitor.WasCanceled():
+            self.cancelled = True
+        # if
+    # Update
+# JobContext
+
+class Job(object):
+    # Override the phases, Work must not call the host.
+    name = "Job"
+
+    def Snapshot(self, theContext):
+        return None
+    # Snapshot
+
+    def Work(self, theSnapshot, theContext):
+        return theSnapshot
+    # Work
+
+    def Finish(self, theResult, theContext):
+        return theResult
+    # Finish
+# Job
+
+class JobResult(object):
+    __slots__ = ("name", "result", "error", "cancelled", "timing")
+
+    def __init__(self, theName):
+        self.name = theName
+        self.result = None
+        self.error = ""
+        self.cancelled = False
+        self.timing = dict()
+    # __init__
+
+    def Summary(self):
+        aTiming = ", ".join("%s %.3fs" % (aPhase, aTime) for (aPhase, aTime) in self.timing.items())
+        if self.cancelled:
+            return "%s cancelled (%s)" % (self.name, aTiming)
+        # if
+
+        if len(self.error) > 0:
+            return "%s failed: %s" % (self.name, self.error.strip().splitlines()[-1])
+        # if
+
+        return "%s finished (%s)" % (self.name, aTiming)
+    # Summary
+# JobResult
+
+class ConsoleMonitor(object):
+    # Headless monitor, prints the progress.
+
+    def __init__(self, theStream = None):
+        self.stream = theStream or sys.stdout
+        self.last = None
+    # __init__
+
+    def Start(self, theName):
+        self.stream.write(theName + "\n")
+    # Start
+
+    def Update(self, theValue, theMaximum, theText):
+        aLine = "  %s %d/%d" % (theText, theValue, theMaximum)
+        if aLine != self.last:
+            self.last = aLine
+            self.stream.write(aLine + "\n")
+        # if
+    # Update
+
+    def ProcessEvents(self):
+        pass
+    # ProcessEvents
+
+    def WasCanceled(self):
+        return False
+    # WasCanceled
+
+    def Stop(self):
+        pass
+    # Stop
+# ConsoleMonitor
+
+class JobRunner(object):
+    def __init__(self, theMonitor = None):
+        self.monitor = theMonitor or ConsoleMonitor()
+        self.executor = None
+    # __init__
+
+    def Run(self, theJob):
+        aResult = JobResult(theJob.name)
+        aContext = JobContext(self.monitor)
+        aPhase = "snapshot"
+
+        self.monitor.Start(theJob.name)
+        try:
+            aStartTime = time.perf_counter()
+            aSnapshot = theJob.Snapshot(aContext)
+            aContext.Check()
+            aResult.timing["snapshot"] = time.perf_counter() - aStartTime
+
+            aPhase = "work"
+            aStartTime = time.perf_counter()
+            aWork = self.RunWork(theJob, aSnapshot, aContext)
+            aContext.Check()
+            aResult.timing["work"] = time.perf_counter() - aStartTime
+
+            aPhase = "finish"
+            aStartTime = time.perf_counter()
+            aResult.result = theJob.Finish(aWork, aContext)
+            aResult.timing["finish"] = time.perf_counter() - aStartTime
+        except JobCancelled as e:
+            aResult.cancelled = True
+        except Exception as e:
+            aResult.error = "%s: %s" % (aPhase, traceback.format_exc())
+        finally:
+            self.monitor.Stop()
+        # try
+
+        return aResult
+    # Run
+
+    def RunWork(self, theJob, theSnapshot, theContext):
+        if self.executor == None:
+            self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # if
+
+        aFuture = self.executor.submit(theJob.Work, theSnapshot, theContext)
+        while True:
+            try:
+                return aFuture.result(timeout=0.05)
+            except concurrent.futures.TimeoutError as e:
+                theContext.Update()
+            # try
+        # while
+    # RunWork
+
+    def Shutdown(self):
+        if self.executor != None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        # if
+    # Shutdown
+# JobRunner
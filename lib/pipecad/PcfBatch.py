@@ -0,0 +1,132 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+
+
+# Batch PCF export engine, no PythonQt dependency.
+# The branches are snapshot on the main thread (see PcfExporter.SnapshotPipe),
+# the snapshots are then formatted and written in a worker pool.
+
+import os
+import sys
+import concurrent.futures
+import multiprocessing
+
+from pipecad import PcfWriter
+from pipecad.PcfSnapshot import FormatPcf
+
+
+def WriteJob(theName, thePipe, theFileName):
+    # Run in the worker, return (name, file name, error message).
+    try:
+        PcfWriter.WritePcf(FormatPcf(thePipe), theFileName)
+        return (theName, theFileName, "")
+    except Exception as e:
+        return (theName, theFileName, "%s: %s" % (type(e).__name__, e))
+    # try
+# WriteJob
+
+def PythonExecutable():
+    # Worker processes need a python interpreter, PipeCAD embeds python so
+    # sys.executable may be the application itself.
+    aName = os.path.basename(sys.executable).lower()
+    if aName.startswith("python"):
+        return sys.executable
+    # if
+
+    for aName in ("python.exe", "python3", "python"):
+        aExecutable = os.path.join(sys.exec_prefix, aName)
+        if os.path.isfile(aExecutable):
+            return aExecutable
+        # if
+    # for
+
+    return None
+# PythonExecutable
+
+def CreateExecutor(theWorkers = None):
+    if theWorkers == None:
+        theWorkers = os.cpu_count() or 1
+    # if
+
+    aExecutable = PythonExecutable()
+    if aExecutable != None:
+        try:
+            aContext = multiprocessing.get_context("spawn")
+            aContext.set_executable(aExecutable)
+            return concurrent.futures.ProcessPoolExecutor(max_workers=theWorkers, mp_context=aContext)
+        except Exception as e:
+            pass
+        # try
+    # if
+
+    # Fall back to threads, formatting and file writing still overlap.
+    return concurrent.futures.ThreadPoolExecutor(max_workers=theWorkers)
+# CreateExecutor
+
+class PcfBatch(object):
+    def __init__(self, theWorkers = None):
+        self.executor = CreateExecutor(theWorkers)
+        self.futures = set()
+        self.results = []
+    # __init__
+
+    def Submit(self, theName, thePipe, theFileName):
+        self.futures.add(self.executor.submit(WriteJob, theName, thePipe, theFileName))
+    # Submit
+
+    def Pending(self):
+        return len(self.futures)
+    # Pending
+
+    def Poll(self, theTimeout = 0.1):
+        # Return the jobs finished within the timeout, the caller keeps its event loop running in between.
+        if len(self.futures) < 1:
+            return []
+        # if
+
+        aDone, self.futures = concurrent.futures.wait(self.futures, timeout=theTimeout, return_when=concurrent.futures.FIRST_COMPLETED)
+
+        aResults = []
+        for aFuture in aDone:
+            if aFuture.cancelled():
+                continue
+            # if
+
+            aException = aFuture.exception()
+            if aException != None:
+                aResults.append(("", "", "%s: %s" % (type(aException).__name__, aException)))
+            else:
+                aResults.append(aFuture.result())
+            # if
+        # for
+
+        self.results.extend(aResults)
+        return aResults
+    # Poll
+
+    def Cancel(self):
+        # Cancel the jobs not started yet, running jobs finish their file.
+        for aFuture in self.futures:
+            aFuture.cancel()
+        # for
+
+        self.futures = set(aFuture for aFuture in self.futures if not aFuture.cancelled())
+    # Cancel
+
+    def Shutdown(self):
+        self.executor.shutdown(wait=True)
+    # Shutdown
+# PcfBatch
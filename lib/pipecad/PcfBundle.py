@@ -0,0 +1,210 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+
+
+# Compressed multi-PCF bundle, no PythonQt dependency.
+# All PCF files of an export are streamed into one archive with a JSON index
+# of line -> member, so a single line can be read back without unpacking:
+#   .zip: one deflated member per line plus "index.json";
+#   .tar.zst: a tar stream where every member is its own zstd frame, the
+#   index is the last member and a zstd skippable frame at the end of the
+#   file holds the offset of the index frame. "zstd -d | tar x" still works.
+# The .tar.zst format needs the optional zstandard module.
+
+import io
+import os
+import json
+import time
+import shutil
+import struct
+import tarfile
+import zipfile
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+# try
+
+
+INDEX_NAME = "index.json"
+COPY_BLOCK_SIZE = 1 << 20
+
+# zstd skippable frame holding the index frame offset.
+SKIPPABLE_MAGIC = 0x184D2A5C
+TRAILER_SIZE = 16
+
+
+def BundleFormats():
+    aFormats = [".zip"]
+    if zstandard != None:
+        aFormats.append(".tar.zst")
+    # if
+
+    return aFormats
+# BundleFormats
+
+def MemberName(theLine):
+    return theLine.strip("/").replace("/", "_") + ".pcf"
+# MemberName
+
+class PcfBundleWriter(object):
+    def __init__(self, theFileName, theLevel = None):
+        self.fileName = theFileName
+        self.index = dict()
+        self.isZip = not theFileName.lower().endswith(".tar.zst")
+
+        if self.isZip:
+            aLevel = 6 if theLevel == None else theLevel
+            self.archive = zipfile.ZipFile(theFileName, "w", zipfile.ZIP_DEFLATED, compresslevel=aLevel)
+        else:
+            if zstandard == None:
+                raise RuntimeError("The zstandard module is required for .tar.zst bundles.")
+            # if
+
+            self.stream = open(theFileName, "wb")
+            self.compressor = zstandard.ZstdCompressor(level=3 if theLevel == None else theLevel)
+        # if
+    # __init__
+
+    def AddFile(self, theLine, theFileName):
+        # Stream one PCF file into the bundle in blocks.
+        aName = MemberName(theLine)
+        aSize = os.path.getsize(theFileName)
+
+        if self.isZip:
+            self.archive.write(theFileName, aName)
+            self.index[theLine] = {"member": aName, "offset": self.archive.getinfo(aName).header_offset, "size": aSize}
+        else:
+            with open(theFileName, "rb") as aPcfFile:
+                self.index[theLine] = self.AddFrame(aName, aPcfFile, aSize)
+            # with
+        # if
+    # AddFile
+
+    def AddFrame(self, theName, theStream, theSize):
+        aInfo = tarfile.TarInfo(theName)
+        aInfo.size = theSize
+        aInfo.mtime = int(time.time())
+
+        # Non-ASCII or long names add PAX header blocks, the frame size must
+        # count the header as written.
+        aHeader = aInfo.tobuf(format=tarfile.PAX_FORMAT)
+        aPadding = (-theSize) % tarfile.BLOCKSIZE
+
+        aOffset = self.stream.tell()
+        aWriter = self.compressor.stream_writer(self.stream, size=len(aHeader) + theSize + aPadding, closefd=False)
+        aWriter.write(aHeader)
+        shutil.copyfileobj(theStream, aWriter, COPY_BLOCK_SIZE)
+        aWriter.write(b"\0" * aPadding)
+        aWriter.flush(zstandard.FLUSH_FRAME)
+
+        return {"member": theName, "offset": aOffset, "length": self.stream.tell() - aOffset, "size": theSize}
+    # AddFrame
+
+    def Close(self):
+        aIndex = json.dumps({"version": 1, "lines": self.index}, indent=1, sort_keys=True).encode("utf-8")
+
+        if self.isZip:
+            self.archive.writestr(INDEX_NAME, aIndex)
+            self.archive.close()
+            return
+        # if
+
+        aIndexOffset = self.stream.tell()
+        self.AddFrame(INDEX_NAME, io.BytesIO(aIndex), len(aIndex))
+
+        # End of tar archive, then the trailer.
+        self.stream.write(self.compressor.compress(b"\0" * (tarfile.BLOCKSIZE * 2)))
+        self.stream.write(struct.pack("<IIQ", SKIPPABLE_MAGIC, 8, aIndexOffset))
+        self.stream.close()
+    # Close
+# PcfBundleWriter
+
+class PcfBundleReader(object):
+    def __init__(self, theFileName):
+        self.fileName = theFileName
+        self.isZip = not theFileName.lower().endswith(".tar.zst")
+
+        if self.isZip:
+            self.archive = zipfile.ZipFile(theFileName, "r")
+            self.index = json.loads(self.archive.read(INDEX_NAME).decode("utf-8"))["lines"]
+        else:
+            if zstandard == None:
+                raise RuntimeError("The zstandard module is required for .tar.zst bundles.")
+            # if
+
+            self.stream = open(theFileName, "rb")
+            self.stream.seek(-TRAILER_SIZE, os.SEEK_END)
+            aMagic, aLength, aIndexOffset = struct.unpack("<IIQ", self.stream.read(TRAILER_SIZE))
+            if aMagic != SKIPPABLE_MAGIC or aLength != 8:
+                raise ValueError("Not a PCF bundle: " + theFileName)
+            # if
+
+            self.index = json.loads(self.ReadFrame(aIndexOffset).decode("utf-8"))["lines"]
+        # if
+    # __init__
+
+    def Lines(self):
+        return sorted(self.index)
+    # Lines
+
+    def ReadFrame(self, theOffset):
+        # Decompress one member frame, skip its tar header.
+        self.stream.seek(theOffset)
+        aReader = zstandard.ZstdDecompressor().stream_reader(self.stream, read_across_frames=False, closefd=False)
+        aHeader = tarfile.TarInfo.frombuf(aReader.read(tarfile.BLOCKSIZE), tarfile.ENCODING, "surrogateescape")
+        if aHeader.type in (tarfile.XHDTYPE, tarfile.XGLTYPE):
+            # PAX extended header, the real header follows.
+            aReader.read(aHeader.size + (-aHeader.size) % tarfile.BLOCKSIZE)
+            aHeader = tarfile.TarInfo.frombuf(aReader.read(tarfile.BLOCKSIZE), tarfile.ENCODING, "surrogateescape")
+        # if
+
+        return aReader.read(aHeader.size)
+    # ReadFrame
+
+    def ReadLine(self, theLine):
+        aEntry = self.index[theLine]
+        if self.isZip:
+            aData = self.archive.read(aEntry["member"])
+        else:
+            aData = self.ReadFrame(aEntry["offset"])
+        # if
+
+        return aData.decode("utf-8", errors="replace")
+    # ReadLine
+
+    def ExtractLine(self, theLine, theFileName):
+        aEntry = self.index[theLine]
+        if self.isZip:
+            aData = self.archive.read(aEntry["member"])
+        else:
+            aData = self.ReadFrame(aEntry["offset"])
+        # if
+
+        with open(theFileName, "wb") as aPcfFile:
+            aPcfFile.write(aData)
+        # with
+    # ExtractLine
+
+    def Close(self):
+        if self.isZip:
+            self.archive.close()
+        else:
+            self.stream.close()
+        # if
+    # Close
+# PcfBundleReader
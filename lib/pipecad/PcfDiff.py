@@ -0,0 +1,268 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+
+
+# Structural diff between two PCF revisions, no PythonQt dependency.
+# Components are matched by hashed keys of type, SKEY, item code and the end
+# points quantized to a tolerance:
+#   - same full key: unchanged;
+#   - same type, SKEY and item code at other end points: moved;
+#   - same type and end points with another SKEY or item code: re-specced;
+#   - the rest: added or removed.
+#
+# Usage: python -m pipecad.PcfDiff OLD NEW [-j N] [--tolerance MM] [--json]
+# OLD and NEW are two PCF files or two directories of PCF files matched by name.
+
+import os
+import sys
+import json
+import argparse
+import concurrent.futures
+
+import numpy as np
+
+from pipecad.PcfParser import ParsePcf
+
+
+# End points closer than this (MM) are the same.
+DEFAULT_TOLERANCE = 1.0
+
+
+def QuantizedEnds(theData, theTolerance):
+    # (n, 6) integer end points, the two ends in a canonical order so a
+    # flipped component still matches.
+    aEnds = np.round(theData.ends / theTolerance).astype(np.int64)
+    aDiff = aEnds[:, 0] - aEnds[:, 1]
+    aFirst = np.argmax(aDiff != 0, axis=1)
+    aSwap = aDiff[np.arange(len(aDiff)), aFirst] > 0
+    aEnds[aSwap] = aEnds[aSwap][:, ::-1]
+    return aEnds.reshape(-1, 6)
+# QuantizedEnds
+
+def ComponentKeys(theData, theTolerance):
+    # Return (full, spec, place) hashed keys for each component.
+    aEnds = [tuple(aRow) for aRow in QuantizedEnds(theData, theTolerance).tolist()]
+    aStrings = theData.strings
+    aTypes = [aStrings[i] for i in theData.types.tolist()]
+    aSkeys = [aStrings[i] for i in theData.skeys.tolist()]
+    aCodes = [aStrings[i] for i in theData.codes.tolist()]
+
+    aFull = [hash((t, s, c, e)) for (t, s, c, e) in zip(aTypes, aSkeys, aCodes, aEnds)]
+    aSpec = [hash((t, s, c)) for (t, s, c) in zip(aTypes, aSkeys, aCodes)]
+    aPlace = [hash((t, e)) for (t, e) in zip(aTypes, aEnds)]
+    return aFull, aSpec, aPlace
+# ComponentKeys
+
+def MatchKeys(theOldKeys, theOldIndices, theNewKeys, theNewIndices):
+    # Pair the indices with equal keys, return (pairs, old rest, new rest).
+    aBuckets = dict()
+    for i in theOldIndices:
+        aBuckets.setdefault(theOldKeys[i], []).append(i)
+    # for
+
+    aPairs = []
+    aNewRest = []
+    for j in theNewIndices:
+        aBucket = aBuckets.get(theNewKeys[j])
+        if aBucket:
+            aPairs.append((aBucket.pop(0), j))
+        else:
+            aNewRest.append(j)
+        # if
+    # for
+
+    aOldRest = sorted(i for aBucket in aBuckets.values() for i in aBucket)
+    return aPairs, aOldRest, aNewRest
+# MatchKeys
+
+def MatchNearest(theOldKeys, theOldIndices, theNewKeys, theNewIndices, theOldCentres, theNewCentres):
+    # Like MatchKeys, but among equal keys the closest components are paired first.
+    aOldBuckets = dict()
+    for i in theOldIndices:
+        aOldBuckets.setdefault(theOldKeys[i], []).append(i)
+    # for
+
+    aNewBuckets = dict()
+    for j in theNewIndices:
+        aNewBuckets.setdefault(theNewKeys[j], []).append(j)
+    # for
+
+    aPairs = []
+    aOldRest = []
+    aNewRest = []
+    for (aKey, aNewBucket) in aNewBuckets.items():
+        aOldBucket = aOldBuckets.pop(aKey, [])
+        if len(aOldBucket) < 1:
+            aNewRest.extend(aNewBucket)
+            continue
+        # if
+
+        aDistance = np.linalg.norm(theOldCentres[aOldBucket][:, None, :] - theNewCentres[aNewBucket][None, :, :], axis=2)
+        aOldUsed = set()
+        aNewUsed = set()
+        for k in np.argsort(aDistance, axis=None).tolist():
+            (a, b) = divmod(k, len(aNewBucket))
+            if a in aOldUsed or b in aNewUsed:
+                continue
+            # if
+            aOldUsed.add(a)
+            aNewUsed.add(b)
+            aPairs.append((aOldBucket[a], aNewBucket[b]))
+        # for
+
+        aOldRest.extend(i for (a, i) in enumerate(aOldBucket) if a not in aOldUsed)
+        aNewRest.extend(j for (b, j) in enumerate(aNewBucket) if b not in aNewUsed)
+    # for
+
+    for aOldBucket in aOldBuckets.values():
+        aOldRest.extend(aOldBucket)
+    # for
+
+    return sorted(aPairs), sorted(aOldRest), sorted(aNewRest)
+# MatchNearest
+
+def Describe(theData, theIndex):
+    aType, aSkey, aCode = theData.Component(theIndex)
+    aEnds = theData.ends[theIndex]
+    return {
+        "type": aType,
+        "skey": aSkey,
+        "code": aCode,
+        "ends": [[round(v, 1) for v in aEnds[0].tolist()], [round(v, 1) for v in aEnds[1].tolist()]],
+    }
+# Describe
+
+def DiffData(theOld, theNew, theTolerance = DEFAULT_TOLERANCE):
+    aOldFull, aOldSpec, aOldPlace = ComponentKeys(theOld, theTolerance)
+    aNewFull, aNewSpec, aNewPlace = ComponentKeys(theNew, theTolerance)
+
+    aSame, aOldRest, aNewRest = MatchKeys(aOldFull, range(len(theOld)), aNewFull, range(len(theNew)))
+    aMoved, aOldRest, aNewRest = MatchNearest(aOldSpec, aOldRest, aNewSpec, aNewRest, theOld.ends.mean(axis=1), theNew.ends.mean(axis=1))
+    aRespecced, aOldRest, aNewRest = MatchKeys(aOldPlace, aOldRest, aNewPlace, aNewRest)
+
+    return {
+        "old": theOld.name,
+        "new": theNew.name,
+        "unchanged": len(aSame),
+        "added": [Describe(theNew, j) for j in aNewRest],
+        "removed": [Describe(theOld, i) for i in aOldRest],
+        "moved": [{"old": Describe(theOld, i), "new": Describe(theNew, j)} for (i, j) in aMoved],
+        "respecced": [{"old": Describe(theOld, i), "new": Describe(theNew, j)} for (i, j) in aRespecced],
+    }
+# DiffData
+
+def DiffPcf(theOldFile, theNewFile, theTolerance = DEFAULT_TOLERANCE):
+    return DiffData(ParsePcf(theOldFile), ParsePcf(theNewFile), theTolerance)
+# DiffPcf
+
+def DiffJob(theOldFile, theNewFile, theTolerance):
+    # Worker entry, missing files diff against an empty revision.
+    try:
+        if theOldFile == None:
+            aNew = ParsePcf(theNewFile)
+            return {"old": None, "new": theNewFile, "unchanged": 0, "added": [Describe(aNew, j) for j in range(len(aNew))], "removed": [], "moved": [], "respecced": []}
+        # if
+
+        if theNewFile == None:
+            aOld = ParsePcf(theOldFile)
+            return {"old": theOldFile, "new": None, "unchanged": 0, "added": [], "removed": [Describe(aOld, i) for i in range(len(aOld))], "moved": [], "respecced": []}
+        # if
+
+        return DiffPcf(theOldFile, theNewFile, theTolerance)
+    except Exception as e:
+        return {"old": theOldFile, "new": theNewFile, "error": "%s: %s" % (type(e).__name__, e)}
+    # try
+# DiffJob
+
+def PairFiles(theOld, theNew):
+    # Two files, or two directories matched by PCF file name.
+    if not os.path.isdir(theOld):
+        return [(theOld, theNew)]
+    # if
+
+    def PcfFiles(thePath):
+        return dict((aName.lower(), os.path.join(thePath, aName)) for aName in os.listdir(thePath) if aName.lower().endswith(".pcf"))
+    # PcfFiles
+
+    aOldFiles = PcfFiles(theOld)
+    aNewFiles = PcfFiles(theNew)
+    return [(aOldFiles.get(aName), aNewFiles.get(aName)) for aName in sorted(set(aOldFiles) | set(aNewFiles))]
+# PairFiles
+
+def DiffMany(thePairs, theTolerance = DEFAULT_TOLERANCE, theWorkers = None):
+    # Diff many PCF pairs in a process pool, results keep the order of the pairs.
+    aChunkSize = max(1, len(thePairs) // ((theWorkers or os.cpu_count() or 1) * 4))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=theWorkers) as aExecutor:
+        return list(aExecutor.map(DiffJob, [p[0] for p in thePairs], [p[1] for p in thePairs], [theTolerance] * len(thePairs), chunksize=aChunkSize))
+    # with
+# DiffMany
+
+def FormatReport(theResults):
+    aLines = []
+    for aResult in theResults:
+        aLines.append("%s -> %s" % (aResult["old"], aResult["new"]))
+        if "error" in aResult:
+            aLines.append("    ERROR " + aResult["error"])
+            continue
+        # if
+
+        aLines.append("    unchanged %d, added %d, removed %d, moved %d, re-specced %d" % (
+            aResult["unchanged"], len(aResult["added"]), len(aResult["removed"]), len(aResult["moved"]), len(aResult["respecced"])))
+        for aItem in aResult["added"]:
+            aLines.append("    + %(type)s %(skey)s %(code)s %(ends)s" % aItem)
+        # for
+        for aItem in aResult["removed"]:
+            aLines.append("    - %(type)s %(skey)s %(code)s %(ends)s" % aItem)
+        # for
+        for aItem in aResult["moved"]:
+            aLines.append("    > %s %s %s -> %s" % (aItem["old"]["type"], aItem["old"]["code"], aItem["old"]["ends"], aItem["new"]["ends"]))
+        # for
+        for aItem in aResult["respecced"]:
+            aLines.append("    * %s %s/%s -> %s/%s" % (aItem["old"]["type"], aItem["old"]["skey"], aItem["old"]["code"], aItem["new"]["skey"], aItem["new"]["code"]))
+        # for
+    # for
+
+    return "\n".join(aLines)
+# FormatReport
+
+def main(theArgs = None):
+    aParser = argparse.ArgumentParser(description="Structural diff between two PCF revisions.")
+    aParser.add_argument("old", help="old PCF file or directory")
+    aParser.add_argument("new", help="new PCF file or directory")
+    aParser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    aParser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="end point tolerance in MM")
+    aParser.add_argument("--json", action="store_true", help="print the result as JSON")
+    aArgs = aParser.parse_args(theArgs)
+
+    aPairs = PairFiles(aArgs.old, aArgs.new)
+    if len(aPairs) == 1:
+        aResults = [DiffJob(aPairs[0][0], aPairs[0][1], aArgs.tolerance)]
+    else:
+        aResults = DiffMany(aPairs, aArgs.tolerance, aArgs.workers)
+    # if
+
+    if aArgs.json:
+        print(json.dumps(aResults, indent=1))
+    else:
+        print(FormatReport(aResults))
+    # if
+
+    return 1 if any("error" in aResult for aResult in aResults) else 0
+# main
+
+if __name__ == "__main__":
+    sys.exit(main())
+# if
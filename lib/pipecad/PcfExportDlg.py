@@ -17,6 +17,9 @@
 # Date: 11:20 2021-11-15
 
 import os
+import time
+import shutil
+import tempfile
 
 from PythonQt.QtCore import *
 from PythonQt.QtGui import *
@@ -25,6 +28,164 @@ from PythonQt.pipecad import *
 
 from lib.pipecad import *
 
+from pipecad import PcfExporter
+from pipecad.PcfBatch import PcfBatch
+from pipecad.PcfBundle import PcfBundleWriter, BundleFormats
+from pipecad.PcfManifest import PcfManifest
+from pipecad.PcfSnapshot import HashPipe
+from pipecad.JobRunner import Job
+from pipecad.JobDialog import RunJob
+
+
+class PcfExportJob(Job):
+    # Snapshot the lines on the main thread, format and write them in the
+    # PcfBatch worker pool, then save the manifest or close the bundle.
+    name = "Export PCF"
+
+    def __init__(self, theItems, thePath, theIncremental, theBundleFormat):
+        self.items = theItems
+        self.path = thePath
+        self.incremental = theIncremental
+        self.bundleFormat = theBundleFormat
+        self.outputPath = thePath
+        self.bundle = None
+        self.manifest = PcfManifest(thePath, PcfExporter.ExportOptions())
+        self.errors = []
+        self.skipped = []
+        self.written = []
+        self.regenerated = dict()
+    # __init__
+
+    def Snapshot(self, theContext):
+        if len(self.bundleFormat) > 0:
+            self.incremental = False
+        # if
+
+        # Host items can only be read on the main thread.
+        aJobs = []
+        aCache = PcfExporter.CatalogueCache()
+        for (i, (aName, aTreeItem)) in enumerate(self.items):
+            theContext.Progress(i, len(self.items) * 2, "Read " + aName)
+
+            aFileName = self.path + "/" + aName.strip("/").replace("/", "_") + ".pcf"
+            try:
+                aPipe = PcfExporter.SnapshotPipe(aTreeItem, aCache)
+                aHash = HashPipe(aPipe)
+                aReason = "forced"
+                if self.incremental:
+                    aReason = self.manifest.Check(aName, aFileName, aHash)
+                # if
+
+                if aReason == None:
+                    self.skipped.append(aName)
+                else:
+                    self.regenerated[aName] = (aHash, aReason)
+                    aJobs.append((aName, aPipe, aFileName))
+                # if
+            except Exception as e:
+                self.errors.append((aName, str(e)))
+            # try
+        # for
+
+        return aJobs
+    # Snapshot
+
+    def Work(self, theJobs, theContext):
+        # Bundle: the workers write into a staging directory, each finished
+        # file is streamed into the archive and removed. Close removes the
+        # directory whatever ends the work.
+        if len(self.bundleFormat) > 0:
+            self.outputPath = tempfile.mkdtemp(prefix=".pcf_", dir=self.path)
+        # if
+
+        aBatch = None
+        try:
+            if self.outputPath != self.path:
+                self.bundle = PcfBundleWriter(self.path + "/" + time.strftime("PCF_%Y%m%d_%H%M%S") + self.bundleFormat)
+            # if
+
+            aBatch = PcfBatch()
+            for (aName, aPipe, aFileName) in theJobs:
+                if self.outputPath != self.path:
+                    aFileName = self.outputPath + "/" + os.path.basename(aFileName)
+                # if
+                aBatch.Submit(aName, aPipe, aFileName)
+            # for
+
+            aFinished = len(self.items) - len(theJobs)
+            while aBatch.Pending() > 0:
+                if theContext.cancelled:
+                    # Let the running files finish, drop the rest.
+                    aBatch.Cancel()
+                # if
+
+                for (aName, aFileName, aError) in aBatch.Poll():
+                    if len(aError) > 0:
+                        self.errors.append((aName, aError))
+                    elif self.bundle != None:
+                        self.bundle.AddFile(aName, aFileName)
+                        os.remove(aFileName)
+                        self.written.append(aName)
+                    else:
+                        self.manifest.Update(aName, aFileName, self.regenerated[aName][0])
+                        self.written.append(aName)
+                    # if
+                    aFinished += 1
+                # for
+
+                with theContext.lock:
+                    theContext.value = len(self.items) + aFinished
+                    theContext.text = "Write %d of %d" % (aFinished, len(self.items))
+                # with
+            # while
+        finally:
+            if aBatch != None:
+                aBatch.Shutdown()
+            # if
+            self.Close()
+        # try
+
+        theContext.Check()
+        return self.written
+    # Work
+
+    def Close(self):
+        if self.outputPath == self.path:
+            self.manifest.Save()
+            return
+        # if
+
+        try:
+            if self.bundle != None:
+                self.bundle.Close()
+            # if
+        finally:
+            shutil.rmtree(self.outputPath, ignore_errors=True)
+        # try
+    # Close
+
+    def Report(self):
+        aTarget = self.path
+        if self.bundle != None:
+            aTarget = self.bundle.fileName
+        # if
+
+        aMessage = "Export %d of %d PCF files to %s." % (len(self.written), len(self.items), aTarget)
+        if len(self.skipped) > 0:
+            aMessage += "\nSkipped %d unchanged." % len(self.skipped)
+        # if
+
+        if len(self.written) > 0:
+            aMessage += "\n\nRegenerated:\n" + "\n".join("%s: %s" % (aName, self.regenerated[aName][1]) for aName in self.written)
+        # if
+
+        if len(self.errors) > 0:
+            aMessage += "\n\nFailed:\n" + "\n".join("%s: %s" % (aName, aError) for (aName, aError) in self.errors)
+        # if
+
+        return aMessage
+    # Report
+# PcfExportJob
 
 class PcfExporterDlg(QDialog):
     def __init__(self, parent = None):
@@ -76,6 +237,25 @@ class PcfExporterDlg(QDialog):
         self.horizontalLayout.addWidget(self.textPath)
         self.horizontalLayout.addWidget(self.toolPath)
         self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.checkIncremental = QCheckBox(QT_TRANSLATE_NOOP("Design", "Skip unchanged lines"))
+        self.checkIncremental.setToolTip(QT_TRANSLATE_NOOP("Design", "Only regenerate PCF files whose data or export options changed since the last export"))
+        self.checkIncremental.setChecked(True)
+
+        self.labelOutput = QLabel(QT_TRANSLATE_NOOP("Design", "Output"))
+        self.comboOutput = QComboBox()
+        self.comboOutput.addItem(QT_TRANSLATE_NOOP("Design", "PCF Files"), "")
+        for aFormat in BundleFormats():
+            self.comboOutput.addItem(QT_TRANSLATE_NOOP("Design", "Bundle") + " (*" + aFormat + ")", aFormat)
+        # for
+        self.comboOutput.currentIndexChanged.connect(self.outputChanged)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.addWidget(self.checkIncremental)
+        self.horizontalLayout.addStretch()
+        self.horizontalLayout.addWidget(self.labelOutput)
+        self.horizontalLayout.addWidget(self.comboOutput)
+        self.verticalLayout.addLayout(self.horizontalLayout)
         
         # Action buttons.
         self.buttonBox = QDialogButtonBox()
@@ -86,6 +266,11 @@ class PcfExporterDlg(QDialog):
         self.buttonBox.rejected.connect(self.reject)
     # setupUi
 
+    def outputChanged(self):
+        # A bundle always contains every line.
+        self.checkIncremental.setEnabled(len(self.comboOutput.currentData) < 1)
+    # outputChanged
+
     def setPath(self):
         aPath = QFileDialog.getExistingDirectory(self, "PCF Directory", self.textPath.text)
         if len(aPath) > 0:
@@ -133,6 +318,43 @@ class PcfExporterDlg(QDialog):
     def clearList(self):
         self.listWidget.clear()
     # clearList
+
+    def accept(self):
+        aCount = self.listWidget.count
+        if aCount < 1:
+            QMessageBox.warning(self, "", "Please add PIPE or BRAN to export!")
+            return
+        # if
+
+        aPath = self.textPath.text
+        if not os.path.isdir(aPath):
+            os.makedirs(aPath)
+        # if
+
+        aItems = []
+        for i in range(aCount):
+            aListItem = self.listWidget.item(i)
+            aItems.append((aListItem.text(), aListItem.data(Qt.UserRole)))
+        # for
+
+        aJob = PcfExportJob(aItems, aPath, self.checkIncremental.checked, self.comboOutput.currentData)
+        aResult = RunJob(aJob, self)
+        if len(aResult.error) > 0:
+            return
+        # if
+
+        aMessage = aJob.Report()
+        if aResult.cancelled:
+            aMessage += "\nExport was cancelled."
+        # if
+
+        if len(aJob.errors) > 0:
+            QMessageBox.warning(self, "", aMessage)
+        else:
+            QMessageBox.information(self, "", aMessage)
+            QDialog.accept(self)
+        # if
+    # accept
 # PcfExporterDlg
 
 aPcfExporterDlg = PcfExporterDlg(PipeCad)
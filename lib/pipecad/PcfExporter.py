@@ -23,32 +23,196 @@ from PythonQt.pipecad import *
 
 from lib.pipecad import *
 
+import os
+import time
 
-def ExportPcf(theTreeItem, theFileName):
-    aPcfFile = open(theFileName, "w")
+from pipecad import PcfWriter
+from pipecad.PcfManifest import PcfManifest
+from pipecad.PcfSnapshot import *
+from pipecad.CatalogueDb import CatalogueReader
 
-    # PCF HEADER
-    aPcfFile.write("ISOGEN-FILES   ISOGEN.FLS")
-    aPcfFile.write("\nUNITS-BORE   MM")
-    aPcfFile.write("\nUNITS-CO-ORDS   MM")
-    aPcfFile.write("\nUNITS-BOLT-LENGTH   MM")
-    aPcfFile.write("\nUNITS-BOLT-DIA   MM")
-    aPcfFile.write("\nUNITS-WEIGHT  KGS")
 
-    # PIPELINE
+# Unit weight columns of the standards tables, kg for components and kg/m for TUBE.
+# CatalogueMigration fills UWEIGHT of the schedule tubes.
+WEIGHT_COLUMNS = ("WEIGHT", "UWEIGHT", "UNITWEIGHT")
+
+
+def LoadWeights():
+    # ItemCode -> unit weight from all standards tables with a weight column.
+    aWeights = dict()
+
+    aDatabase = CatalogueReader()
+    if not aDatabase.isOpen():
+        return aWeights
+    # if
+
+    for aTable in aDatabase.tables():
+        aRecord = aDatabase.record(aTable)
+        aColumns = [aRecord.fieldName(i) for i in range(aRecord.count())]
+        if "ItemCode" not in aColumns:
+            continue
+        # if
+
+        aWeightColumns = [aColumn for aColumn in aColumns if aColumn.upper() in WEIGHT_COLUMNS]
+        if len(aWeightColumns) < 1:
+            continue
+        # if
+
+        aQuery = QSqlQuery(aDatabase)
+        aQuery.setForwardOnly(True)
+        aQuery.exec("SELECT ItemCode, " + aWeightColumns[0] + " FROM " + aTable + " WHERE " + aWeightColumns[0] + " IS NOT NULL")
+        while aQuery.next():
+            try:
+                aWeights[str(aQuery.value(0))] = float(aQuery.value(1))
+            except (TypeError, ValueError) as e:
+                pass
+            # try
+        # while
+    # for
+
+    return aWeights
+# LoadWeights
+
+class CatalogueCache(object):
+    # Catalogue data cached across one export run:
+    #   Spref -> (Skey, ItemCode, Description, Weight), shared by all components
+    #   with the same catalogue reference;
+    #   Spec -> {Bore: (ItemCode, Description, Weight)} of its TUBE;
+    #   ItemCode -> unit weight from the catalogue database.
+
+    def __init__(self):
+        self.items = dict()
+        self.tubes = dict()
+        self.weights = None
+        self.hits = 0
+    # __init__
+
+    def Weight(self, theItemCode):
+        if self.weights == None:
+            self.weights = LoadWeights()
+        # if
+
+        return self.weights.get(theItemCode)
+    # Weight
+
+    def Lookup(self, theCompItem):
+        try:
+            aSpref = theCompItem.Spref
+            aKey = aSpref.RefNo
+        except Exception as e:
+            return ("", "", "", None)
+        # try
+
+        aValue = self.items.get(aKey)
+        if aValue != None:
+            self.hits += 1
+            return aValue
+        # if
+
+        try:
+            aDetref = aSpref.Detref
+            aWeight = None
+            aCatref = aSpref.Catref
+            if aCatref != None:
+                # The SCOM name is the catalogue item code.
+                aWeight = self.Weight(aCatref.Name)
+            # if
+            aValue = (aDetref.Skey, aDetref.Name, theCompItem.Dtxr, aWeight)
+        except Exception as e:
+            aValue = ("", "", "", None)
+        # try
+
+        self.items[aKey] = aValue
+        return aValue
+    # Lookup
+
+    def Tubes(self, theSpecItem):
+        if theSpecItem == None:
+            return dict()
+        # if
+
+        aKey = theSpecItem.RefNo
+        aTubes = self.tubes.get(aKey)
+        if aTubes != None:
+            self.hits += 1
+            return aTubes
+        # if
+
+        aTubes = dict()
+        for aSeleItem in theSpecItem.Member:
+            if aSeleItem.Answer != "TUBE":
+                continue
+            # if
+
+            for aSpcoItem in PipeCad.CollectItem("SPCO", aSeleItem):
+                aScomItem = aSpcoItem.Catref
+                if aScomItem == None or aSpcoItem.Answer in aTubes:
+                    continue
+                # if
+
+                aCode = aScomItem.Name
+                aTubes[aSpcoItem.Answer] = (aCode, aSpcoItem.Dtxr, self.Weight(aCode))
+            # for
+        # for
+
+        self.tubes[aKey] = aTubes
+        return aTubes
+    # Tubes
+# CatalogueCache
+
+def SnapshotPoint(theLinkPoint):
+    return PcfPoint(PcfPosition(theLinkPoint.Position.string()), theLinkPoint.Bore, theLinkPoint.Type)
+# SnapshotPoint
+
+def SnapshotComponent(theCompItem, theCache):
+    aComp = PcfComponent(theCompItem.FullType, SnapshotPoint(theCompItem.ArrivePoint), SnapshotPoint(theCompItem.LeavePoint))
+    aComp.skey, aComp.code, aComp.description, aComp.weight = theCache.Lookup(theCompItem)
+
+    if aComp.type in ("TEE", "OLET"):
+        aBranchIndex = 6 - theCompItem.Arrive - theCompItem.Leave
+        aComp.centre = PcfPosition(theCompItem.Position.string())
+        aComp.branch = SnapshotPoint(theCompItem.linkPoint("P" + str(aBranchIndex)))
+    elif aComp.type == "ELBOW":
+        aComp.centre = PcfPosition(theCompItem.Position.string())
+    elif aComp.type == "VALVE":
+        aSpindlePoint = theCompItem.linkPoint("P3")
+        if aSpindlePoint != None:
+            aDirection = aSpindlePoint.Direction
+            aComp.spindle = (aDirection.x, aDirection.y, aDirection.z)
+        # if
+    # if
+
+    return aComp
+# SnapshotComponent
+
+def SnapshotBranch(theBranItem, theCache, theSpecItem = None):
+    aSpecItem = theBranItem.Pspec
+    if aSpecItem == None:
+        aSpecItem = theSpecItem
+    # if
+
+    aBranch = PcfBranch(theBranItem.Name, PcfPosition(theBranItem.Hposition.string()), PcfPosition(theBranItem.Tposition.string()), theBranItem.Tbore, theCache.Tubes(aSpecItem))
+    for aCompItem in theBranItem.Member:
+        aBranch.components.append(SnapshotComponent(aCompItem, theCache))
+    # for
+
+    return aBranch
+# SnapshotBranch
+
+def SnapshotPipe(theTreeItem, theCache = None):
+    # Read the PIPE or BRAN item from the host once, the formatter only uses the snapshot.
+    if theCache == None:
+        theCache = CatalogueCache()
+    # if
+
     aSpec = ''
     aPspec = theTreeItem.Pspec
     if aPspec != None:
         aSpec = aPspec.Name
     # if
 
-    aPcfFile.write("\nPIPELINE-REFERENCE   " + theTreeItem.Name)
-    aPcfFile.write("\n    PIPING-SPEC   " + aSpec)
-    aPcfFile.write("\n    INSULATION-SPEC   ")
-    aPcfFile.write("\n    PAINTING-SPEC   ")
-    aPcfFile.write("\n    TRACING-SPEC   ")
+    aPipe = PcfPipe(theTreeItem.Name, aSpec)
 
-    # COMPONENT
     aBranchList = []
     if theTreeItem.Type == "PIPE":
         aBranchList = theTreeItem.Member
@@ -56,135 +220,61 @@ def ExportPcf(theTreeItem, theFileName):
         aBranchList.append(theTreeItem)
     # if
 
-    # Item Code Dict.
-    aCodeDict = dict()
-
     for aBranItem in (aBranchList):
         if aBranItem.Type != "BRAN":
             # Ignore REVI item.
             continue
         #if
-        
-        aHeadPoint = aBranItem.Hposition
-        aTailPoint = aBranItem.Tposition
 
-        for aCompItem in aBranItem.Member:
-            aType = aCompItem.FullType
-            aArrivePoint = aCompItem.ArrivePoint
-            aLeavePoint = aCompItem.LeavePoint
+        aPipe.branches.append(SnapshotBranch(aBranItem, theCache, aPspec))
+    # for
 
-            try:
-                aDetref = aCompItem.Spref.Detref
-                aSkey = aDetref.Skey
-                aCode = aDetref.Name
-                aDescription = aCompItem.Dtxr
-            except Exception as e:
-                aSkey = ""
-                aCode = ""
-                aDescription = ""
-
-            if aHeadPoint.Distance(aArrivePoint.Position) > 1:
-                # Add Pipe
-                aPcfFile.write("\nPIPE")
-                aPcfFile.write("\n    END-POINT    " + aHeadPoint.string() + " " + aArrivePoint.Bore)
-                aPcfFile.write("\n    END-POINT    " + aArrivePoint.Position.string() + " " + aArrivePoint.Bore)
-                aPcfFile.write("\n    PIPING-SPEC   ")
-                aPcfFile.write("\n    INSULATION-SPEC   ")
-                aPcfFile.write("\n    PAINTING-SPEC   ")
-                aPcfFile.write("\n    TRACING-SPEC   ")
-                aPcfFile.write("\n    WEIGHT   ")
-                aPcfFile.write("\n    ITEM-CODE   PA100" )
-                aPcfFile.write("\n    ITEM-DESCRIPTION   PIPE SCH80 ANSI B36.10")
-
-            aHeadPoint = aLeavePoint.Position
-
-            if aType.startswith("REDUCER"):
-                if aSkey.startswith("RC"):
-                    aType = "REDUCER-CONCENTRIC"
-                else:
-                    aType = "REDUCER-ECCENTRIC"
-                # if
-            # if
+    return aPipe
+# SnapshotPipe
 
-            aPcfFile.write("\n" + aType)
-            aPcfFile.write("\n    END-POINT    " + aArrivePoint.Position.string() + " " + aArrivePoint.Bore + " " + aArrivePoint.Type)
-            aPcfFile.write("\n    END-POINT    " + aLeavePoint.Position.string() + " " + aLeavePoint.Bore + " " + aLeavePoint.Type)
-
-            if aType in ("TEE", "OLET"):
-                aBranchIndex = 6 - aCompItem.Arrive - aCompItem.Leave
-                aBranchPoint = aCompItem.linkPoint("P" + str(aBranchIndex))
-                aPcfFile.write("\n    CENTRE-POINT   " + aCompItem.Position.string())
-                aPcfFile.write("\n    BRANCH1-POINT   " + aBranchPoint.Position.string() + " " + aBranchPoint.Bore + " " + aBranchPoint.Type)
-            elif aType == "ELBOW":
-                aPcfFile.write("\n    CENTRE-POINT   " + aCompItem.Position.string())
-            elif aType == "VALVE":
-                aSpindlePoint = aCompItem.linkPoint("P3")
-                if aSpindlePoint != None:
-                    aDirection = aSpindlePoint.Direction
-                    aSpindleDirection = ''
-                    if abs(aDirection.x) > abs(aDirection.y) and abs(aDirection.x) > abs(aDirection.z):
-                        if aDirection.x > 0:
-                            aSpindleDirection = "EAST"
-                        else:
-                            aSpindleDirection = "WEST"
-                        # if
-                    elif abs(aDirection.y) > abs(aDirection.x) and abs(aDirection.y) > abs(aDirection.z):
-                        if aDirection.y > 0:
-                            aSpindleDirection = "NORTH"
-                        else:
-                            aSpindleDirection = "SOUTH"
-                        # if
-                    elif abs(aDirection.z) > abs(aDirection.x) and abs(aDirection.z) > abs(aDirection.y):
-                        if aDirection.z > 0:
-                            aSpindleDirection = "UP"
-                        else:
-                            aSpindleDirection = "DOWN"
-                        # if
-                    # if
-
-                    aPcfFile.write("\n    SPINDLE-DIRECTION  " + aSpindleDirection)
-                # if
-            # if
+def PcfRecords(theTreeItem):
+    return FormatPcf(SnapshotPipe(theTreeItem))
+# PcfRecords
 
-            aPcfFile.write("\n    SKEY     " + aSkey)
-            aPcfFile.write("\n    PIPING-SPEC   ")
-            aPcfFile.write("\n    INSULATION-SPEC   ")
-            aPcfFile.write("\n    PAINTING-SPEC   ")
-            aPcfFile.write("\n    TRACING-SPEC   ")
-            aPcfFile.write("\n    WEIGHT   ")
-            aPcfFile.write("\n    ITEM-CODE   " + aCode)
-            aPcfFile.write("\n    ITEM-DESCRIPTION   " + aDescription)
-
-            if len(aCode) > 0:
-                aCodeDict[aCode] = aDescription
-            # if
-        # for
+def PcfText(theTreeItem):
+    return PcfWriter.PcfText(PcfRecords(theTreeItem))
+# PcfText
 
-        # Add last pipe.
-        if aHeadPoint.Distance(aTailPoint) > 1:
-            # Add Pipe
-            aPcfFile.write("\nPIPE")
-            aPcfFile.write("\n    END-POINT    " + aHeadPoint.string() + " " + aBranItem.Tbore)
-            aPcfFile.write("\n    END-POINT    " + aTailPoint.string() + " " + aBranItem.Tbore)
-            aPcfFile.write("\n    PIPING-SPEC   ")
-            aPcfFile.write("\n    INSULATION-SPEC   ")
-            aPcfFile.write("\n    PAINTING-SPEC   ")
-            aPcfFile.write("\n    TRACING-SPEC   ")
-            aPcfFile.write("\n    WEIGHT   ")
-            aPcfFile.write("\n    ITEM-CODE   PA100")
-            aPcfFile.write("\n    ITEM-DESCRIPTION   PIPE SCH80 ANSI B36.10")
-    # for
+def ExportOptions():
+    # Options which change the PCF output, recorded in the incremental export manifest.
+    return {"format": PCF_FORMAT_VERSION}
+# ExportOptions
 
-    # ITEM-CODE
-    aPcfFile.write("\nMATERIALS")
-    aPcfFile.write("\nITEM-CODE    PA100")
-    aPcfFile.write("\n    DESCRIPTION    PIPE SCH80 ANSI B36.10")
-    for (aKey, aValue) in aCodeDict.items():
-        aPcfFile.write("\nITEM-CODE    " + aKey)
-        aPcfFile.write("\n    DESCRIPTION    " + aValue)
-    # for
+def ExportPcf(theTreeItem, theFileName, theIncremental = False):
+    # Return the timing of the snapshot and the format/write stages.
+    # With theIncremental the file is only rewritten when the snapshot or the
+    # export options changed since the last export into the same directory.
+    aCache = CatalogueCache()
 
-    aPcfFile.write("\n")
-    aPcfFile.close()
-# ExportPcf
+    aStartTime = time.perf_counter()
+    aPipe = SnapshotPipe(theTreeItem, aCache)
+    aSnapshotTime = time.perf_counter()
 
+    aReason = "forced"
+    if theIncremental:
+        aManifest = PcfManifest(os.path.dirname(os.path.abspath(theFileName)), ExportOptions())
+        aHash = HashPipe(aPipe)
+        aReason = aManifest.Check(aPipe.name, theFileName, aHash)
+        if aReason != None:
+            PcfWriter.WritePcf(FormatPcf(aPipe), theFileName)
+            aManifest.Update(aPipe.name, theFileName, aHash)
+            aManifest.Save()
+        # if
+    else:
+        PcfWriter.WritePcf(FormatPcf(aPipe), theFileName)
+    # if
+    aWriteTime = time.perf_counter()
+
+    return {
+        "components": sum(len(aBranch.components) for aBranch in aPipe.branches),
+        "cacheHits": aCache.hits,
+        "regenerated": aReason,
+        "snapshot": aSnapshotTime - aStartTime,
+        "write": aWriteTime - aSnapshotTime,
+    }
+# ExportPcf
@@ -0,0 +1,89 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+
+
+# Manifest of an incremental PCF export, no PythonQt dependency.
+# The manifest lives in the output directory and records for each exported
+# line the hash of its snapshot and of the export options, so re-exports only
+# rewrite the PCF files whose data or options changed.
+
+import os
+import json
+import hashlib
+
+
+MANIFEST_NAME = ".pcf_manifest.json"
+
+
+def HashOptions(theOptions):
+    return hashlib.sha1(json.dumps(theOptions, sort_keys=True).encode("utf-8")).hexdigest()
+# HashOptions
+
+class PcfManifest(object):
+    def __init__(self, thePath, theOptions = None):
+        self.fileName = os.path.join(thePath, MANIFEST_NAME)
+        self.options = HashOptions(theOptions or {})
+        self.entries = dict()
+
+        try:
+            with open(self.fileName, "r") as aJsonFile:
+                self.entries = json.load(aJsonFile).get("entries", dict())
+            # with
+        except (OSError, ValueError) as e:
+            # No manifest yet or unreadable, export everything.
+            self.entries = dict()
+        # try
+    # __init__
+
+    def Check(self, theName, theFileName, theHash):
+        # Return the reason to regenerate the file, or None if it is up to date.
+        aEntry = self.entries.get(theName)
+        if aEntry == None:
+            return "new"
+        # if
+
+        if aEntry.get("file") != os.path.basename(theFileName) or not os.path.isfile(theFileName):
+            return "file missing"
+        # if
+
+        if aEntry.get("options") != self.options:
+            return "options changed"
+        # if
+
+        if aEntry.get("hash") != theHash:
+            return "modified"
+        # if
+
+        return None
+    # Check
+
+    def Update(self, theName, theFileName, theHash):
+        self.entries[theName] = {
+            "file": os.path.basename(theFileName),
+            "hash": theHash,
+            "options": self.options,
+        }
+    # Update
+
+    def Save(self):
+        aTempName = self.fileName + ".tmp"
+        with open(aTempName, "w") as aJsonFile:
+            json.dump({"version": 1, "entries": self.entries}, aJsonFile, indent=1, sort_keys=True)
+        # with
+
+        os.replace(aTempName, self.fileName)
+    # Save
+# PcfManifest
@@ -0,0 +1,153 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+
+
+# Fast PCF parser, no PythonQt dependency.
+# Components are parsed into compact NumPy arrays: index arrays into string
+# tables for the type, SKEY and item code, and a (n, 2, 3) float array of the
+# end points, so thousands of PCF files can be compared cheaply (see PcfDiff).
+
+import numpy as np
+
+
+# Records which are not components.
+NON_COMPONENTS = ("ISOGEN-FILES", "PIPELINE-REFERENCE", "MATERIALS")
+
+
+class PcfData(object):
+    __slots__ = ("name", "strings", "types", "skeys", "codes", "ends")
+
+    def __init__(self, theName, theStrings, theTypes, theSkeys, theCodes, theEnds):
+        self.name = theName
+        self.strings = theStrings
+        self.types = theTypes
+        self.skeys = theSkeys
+        self.codes = theCodes
+        self.ends = theEnds
+    # __init__
+
+    def __len__(self):
+        return len(self.types)
+    # __len__
+
+    def Component(self, theIndex):
+        return (self.strings[self.types[theIndex]], self.strings[self.skeys[theIndex]], self.strings[self.codes[theIndex]])
+    # Component
+# PcfData
+
+def ParseLines(theLines, theName = ""):
+    aStrings = [""]
+    aStringIndex = {"": 0}
+
+    def Intern(theText):
+        aIndex = aStringIndex.get(theText)
+        if aIndex == None:
+            aIndex = len(aStrings)
+            aStringIndex[theText] = aIndex
+            aStrings.append(theText)
+        # if
+        return aIndex
+    # Intern
+
+    aTypes = []
+    aSkeys = []
+    aCodes = []
+    aEnds = []
+
+    aType = None
+    aSkey = ""
+    aCode = ""
+    aPoints = []
+
+    def Flush():
+        if aType != None:
+            while len(aPoints) < 2:
+                aPoints.append(aPoints[0] if len(aPoints) > 0 else (0.0, 0.0, 0.0))
+            # while
+            aTypes.append(Intern(aType))
+            aSkeys.append(Intern(aSkey))
+            aCodes.append(Intern(aCode))
+            aEnds.append(aPoints[0])
+            aEnds.append(aPoints[1])
+        # if
+    # Flush
+
+    aMaterials = False
+    for aLine in theLines:
+        if len(aLine) < 1 or aLine.isspace():
+            continue
+        # if
+
+        if not aLine[0].isspace():
+            # New record.
+            Flush()
+            aType = None
+            aSkey = ""
+            aCode = ""
+            aPoints = []
+
+            aKeyword = aLine.split(None, 1)[0]
+            if aKeyword == "MATERIALS":
+                aMaterials = True
+            # if
+
+            if aMaterials or aKeyword in NON_COMPONENTS or aKeyword.startswith("UNITS-"):
+                continue
+            # if
+
+            aType = aKeyword
+            continue
+        # if
+
+        if aType == None:
+            continue
+        # if
+
+        aSplits = aLine.split()
+        aKeyword = aSplits[0]
+        if aKeyword == "END-POINT" and len(aSplits) >= 4 and len(aPoints) < 2:
+            try:
+                aPoints.append((float(aSplits[1]), float(aSplits[2]), float(aSplits[3])))
+            except ValueError as e:
+                pass
+            # try
+        elif aKeyword == "SKEY" and len(aSplits) > 1:
+            aSkey = aSplits[1]
+        elif aKeyword == "ITEM-CODE" and len(aSplits) > 1:
+            aCode = aSplits[1]
+        # if
+    # for
+    Flush()
+
+    return PcfData(
+        theName,
+        aStrings,
+        np.array(aTypes, dtype=np.int32),
+        np.array(aSkeys, dtype=np.int32),
+        np.array(aCodes, dtype=np.int32),
+        np.array(aEnds, dtype=np.float64).reshape(-1, 2, 3),
+    )
+# ParseLines
+
+def ParsePcf(theFileName):
+    with open(theFileName, "r", errors="replace") as aPcfFile:
+        return ParseLines(aPcfFile, theFileName)
+    # with
+# ParsePcf
+
+def ParseText(theText, theName = ""):
+    return ParseLines(theText.splitlines(), theName)
+# ParseText
@@ -0,0 +1,295 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+
+
+# Plain snapshot records of a PIPE/BRAN for PCF export, no PythonQt dependency.
+# The host items are read once into these records by PcfExporter.SnapshotPipe(),
+# FormatPcf() then generates the PCF records purely from the snapshot, so it can
+# also run in a worker thread or process.
+
+import math
+import hashlib
+
+
+# Bump when FormatPcf output changes, so incremental exports regenerate all files.
+PCF_FORMAT_VERSION = 1
+
+# Used for pipe spools when the spec has no TUBE for the bore.
+PIPE_ITEM_CODE = "PA100"
+PIPE_DESCRIPTION = "PIPE SCH80 ANSI B36.10"
+
+
+class PcfPosition(object):
+    __slots__ = ("text", "x", "y", "z")
+
+    def __init__(self, theText):
+        # Position.string() is "x y z" in MM.
+        self.text = theText
+        aSplits = theText.split()
+        self.x = float(aSplits[0])
+        self.y = float(aSplits[1])
+        self.z = float(aSplits[2])
+    # __init__
+
+    def Distance(self, thePosition):
+        return math.sqrt((self.x - thePosition.x) ** 2 + (self.y - thePosition.y) ** 2 + (self.z - thePosition.z) ** 2)
+    # Distance
+# PcfPosition
+
+class PcfPoint(object):
+    __slots__ = ("position", "bore", "type")
+
+    def __init__(self, thePosition, theBore, theType):
+        self.position = thePosition
+        self.bore = theBore
+        self.type = theType
+    # __init__
+# PcfPoint
+
+class PcfComponent(object):
+    __slots__ = ("type", "arrive", "leave", "centre", "branch", "spindle", "skey", "code", "description", "weight")
+
+    def __init__(self, theType, theArrive, theLeave):
+        self.type = theType
+        self.arrive = theArrive
+        self.leave = theLeave
+        self.centre = None
+        self.branch = None
+        self.spindle = None
+        self.skey = ""
+        self.code = ""
+        self.description = ""
+        self.weight = None
+    # __init__
+# PcfComponent
+
+class PcfBranch(object):
+    __slots__ = ("name", "head", "tail", "tbore", "tubes", "components")
+
+    def __init__(self, theName, theHead, theTail, theTbore, theTubes = None):
+        self.name = theName
+        self.head = theHead
+        self.tail = theTail
+        self.tbore = theTbore
+        # Bore -> (item code, description, unit weight in kg/m) of the branch spec TUBE.
+        self.tubes = theTubes or dict()
+        self.components = []
+    # __init__
+# PcfBranch
+
+class PcfPipe(object):
+    __slots__ = ("name", "spec", "branches")
+
+    def __init__(self, theName, theSpec):
+        self.name = theName
+        self.spec = theSpec
+        self.branches = []
+    # __init__
+# PcfPipe
+
+def SpindleDirection(theDirection):
+    x, y, z = theDirection
+    aSpindleDirection = ''
+    if abs(x) > abs(y) and abs(x) > abs(z):
+        if x > 0:
+            aSpindleDirection = "EAST"
+        else:
+            aSpindleDirection = "WEST"
+        # if
+    elif abs(y) > abs(x) and abs(y) > abs(z):
+        if y > 0:
+            aSpindleDirection = "NORTH"
+        else:
+            aSpindleDirection = "SOUTH"
+        # if
+    elif abs(z) > abs(x) and abs(z) > abs(y):
+        if z > 0:
+            aSpindleDirection = "UP"
+        else:
+            aSpindleDirection = "DOWN"
+        # if
+    # if
+
+    return aSpindleDirection
+# SpindleDirection
+
+def WeightText(theWeight):
+    if theWeight == None:
+        return ""
+    # if
+
+    return "%.2f" % theWeight
+# WeightText
+
+def PipeRecord(theStart, theEnd, theBore, theTubes):
+    aCode, aDescription, aUnitWeight = theTubes.get(theBore, (PIPE_ITEM_CODE, PIPE_DESCRIPTION, None))
+
+    aWeight = None
+    if aUnitWeight != None:
+        aWeight = aUnitWeight * theStart.Distance(theEnd) / 1000.0
+    # if
+
+    aRecord = "\n".join((
+        "PIPE",
+        "    END-POINT    " + theStart.text + " " + theBore,
+        "    END-POINT    " + theEnd.text + " " + theBore,
+        "    PIPING-SPEC   ",
+        "    INSULATION-SPEC   ",
+        "    PAINTING-SPEC   ",
+        "    TRACING-SPEC   ",
+        "    WEIGHT   " + WeightText(aWeight),
+        "    ITEM-CODE   " + aCode,
+        "    ITEM-DESCRIPTION   " + aDescription,
+    ))
+
+    return aRecord, aCode, aDescription
+# PipeRecord
+
+def FormatPcf(thePipe):
+    # Generate PCF records of the pipe snapshot.
+
+    # PCF HEADER
+    yield "\n".join((
+        "ISOGEN-FILES   ISOGEN.FLS",
+        "UNITS-BORE   MM",
+        "UNITS-CO-ORDS   MM",
+        "UNITS-BOLT-LENGTH   MM",
+        "UNITS-BOLT-DIA   MM",
+        "UNITS-WEIGHT  KGS",
+    ))
+
+    # PIPELINE
+    yield "\n".join((
+        "PIPELINE-REFERENCE   " + thePipe.name,
+        "    PIPING-SPEC   " + thePipe.spec,
+        "    INSULATION-SPEC   ",
+        "    PAINTING-SPEC   ",
+        "    TRACING-SPEC   ",
+    ))
+
+    # Item Code Dict, PA100 is always listed first.
+    aCodeDict = {PIPE_ITEM_CODE: PIPE_DESCRIPTION}
+
+    for aBranch in thePipe.branches:
+        aHeadPoint = aBranch.head
+
+        for aComp in aBranch.components:
+            aType = aComp.type
+            aArrive = aComp.arrive
+            aLeave = aComp.leave
+
+            if aHeadPoint.Distance(aArrive.position) > 1:
+                # Add Pipe
+                aRecord, aCode, aDescription = PipeRecord(aHeadPoint, aArrive.position, aArrive.bore, aBranch.tubes)
+                aCodeDict[aCode] = aDescription
+                yield aRecord
+            # if
+
+            aHeadPoint = aLeave.position
+
+            if aType.startswith("REDUCER"):
+                if aComp.skey.startswith("RC"):
+                    aType = "REDUCER-CONCENTRIC"
+                else:
+                    aType = "REDUCER-ECCENTRIC"
+                # if
+            # if
+
+            aLines = [
+                aType,
+                "    END-POINT    " + aArrive.position.text + " " + aArrive.bore + " " + aArrive.type,
+                "    END-POINT    " + aLeave.position.text + " " + aLeave.bore + " " + aLeave.type,
+            ]
+
+            if aType in ("TEE", "OLET"):
+                aLines.append("    CENTRE-POINT   " + aComp.centre.text)
+                aLines.append("    BRANCH1-POINT   " + aComp.branch.position.text + " " + aComp.branch.bore + " " + aComp.branch.type)
+            elif aType == "ELBOW":
+                aLines.append("    CENTRE-POINT   " + aComp.centre.text)
+            elif aType == "VALVE":
+                if aComp.spindle != None:
+                    aLines.append("    SPINDLE-DIRECTION  " + SpindleDirection(aComp.spindle))
+                # if
+            # if
+
+            aLines.append("    SKEY     " + aComp.skey)
+            aLines.append("    PIPING-SPEC   ")
+            aLines.append("    INSULATION-SPEC   ")
+            aLines.append("    PAINTING-SPEC   ")
+            aLines.append("    TRACING-SPEC   ")
+            aLines.append("    WEIGHT   " + WeightText(aComp.weight))
+            aLines.append("    ITEM-CODE   " + aComp.code)
+            aLines.append("    ITEM-DESCRIPTION   " + aComp.description)
+
+            yield "\n".join(aLines)
+
+            if len(aComp.code) > 0:
+                aCodeDict[aComp.code] = aComp.description
+            # if
+        # for
+
+        # Add last pipe.
+        if aHeadPoint.Distance(aBranch.tail) > 1:
+            # Add Pipe
+            aRecord, aCode, aDescription = PipeRecord(aHeadPoint, aBranch.tail, aBranch.tbore, aBranch.tubes)
+            aCodeDict[aCode] = aDescription
+            yield aRecord
+        # if
+    # for
+
+    # ITEM-CODE
+    aLines = ["MATERIALS"]
+    for (aKey, aValue) in aCodeDict.items():
+        aLines.append("ITEM-CODE    " + aKey)
+        aLines.append("    DESCRIPTION    " + aValue)
+    # for
+
+    yield "\n".join(aLines)
+# FormatPcf
+
+def HashValue(theHash, theValue):
+    # Feed the snapshot records into the hash in slot order.
+    if isinstance(theValue, (PcfPosition, PcfPoint, PcfComponent, PcfBranch, PcfPipe)):
+        theHash.update(type(theValue).__name__.encode())
+        for aSlot in type(theValue).__slots__:
+            if aSlot in ("x", "y", "z"):
+                # Parsed from text.
+                continue
+            # if
+            HashValue(theHash, getattr(theValue, aSlot))
+        # for
+    elif isinstance(theValue, dict):
+        HashValue(theHash, sorted(theValue.items()))
+    elif isinstance(theValue, (list, tuple)):
+        theHash.update(b"[%d" % len(theValue))
+        for aValue in theValue:
+            HashValue(theHash, aValue)
+        # for
+        theHash.update(b"]")
+    elif theValue == None:
+        theHash.update(b"\x00")
+    else:
+        aText = str(theValue).encode("utf-8")
+        theHash.update(b"%d:" % len(aText))
+        theHash.update(aText)
+    # if
+# HashValue
+
+def HashPipe(thePipe):
+    aHash = hashlib.sha1()
+    HashValue(aHash, thePipe)
+    return aHash.hexdigest()
+# HashPipe
@@ -0,0 +1,54 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+
+
+# Pure Python PCF writer, no PythonQt dependency.
+# A PCF record is a string of one or more lines without the trailing newline,
+# e.g. "PIPE\n    END-POINT    ...". Records are produced by generators, see
+# PcfExporter.PcfRecords().
+
+import os
+
+# Buffer size of the PCF file, records are flushed in large blocks.
+PCF_BUFFER_SIZE = 1 << 20
+
+
+def WritePcf(theRecords, theFileName):
+    # Write to a temp file beside the target, then rename it into place,
+    # so an exception never leaves a half-written PCF.
+    aTempName = theFileName + ".tmp"
+
+    try:
+        with open(aTempName, "w", buffering=PCF_BUFFER_SIZE) as aPcfFile:
+            for aRecord in theRecords:
+                aPcfFile.write(aRecord)
+                aPcfFile.write("\n")
+            # for
+        # with
+
+        os.replace(aTempName, theFileName)
+    except:
+        if os.path.exists(aTempName):
+            os.remove(aTempName)
+        # if
+        raise
+    # try
+# WritePcf
+
+def PcfText(theRecords):
+    # In-memory PCF for consumers which do not need a file.
+    return "".join(aRecord + "\n" for aRecord in theRecords)
+# PcfText
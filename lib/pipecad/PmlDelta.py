@@ -0,0 +1,328 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Delta PML export, no PythonQt dependency.
+# After an export the state of the tree is kept in a sidecar file beside the
+# macro: for each item by RefNo its type, name, owner and the hash of its own
+# statements. The next export compares the tree with that state and writes
+# only DELETE, MODIFY and NEW statements for the changed items.
+#
+# Statements are emitted in dependency order: deletes bottom-up in reverse
+# order, so the remaining siblings keep their positions; modifies; then new
+# items top-down, each created after its previous sibling. Unnamed items are
+# addressed as "<TYPE> <n> OF <owner>", the positions are tracked through the
+# emitted statements so they stay valid in the target database.
+
+import os
+import json
+import hashlib
+
+from pipecad.PmlWriter import PML_ELEMENTS, PmlElement
+
+# State sidecar in the output directory, one per exported root.
+PML_STATE_NAME = ".pml_state_%s.json"
+
+# Types whose statements use the PML variables of the category.
+PML_CONTEXT_TYPES = ("PTSE", "GMSE", "SCOM")
+
+
+def StateFileName(theFileName, theRefNo):
+    aRefNo = theRefNo.strip("=").replace("/", "_")
+    return os.path.join(os.path.dirname(os.path.abspath(theFileName)), PML_STATE_NAME % aRefNo)
+# StateFileName
+
+def DeltaUnits(theUnits = None):
+    # Type: (formatter returning the statements, member types, recreate on change).
+    # The catalogue elements use PmlWriter, theUnits adds e.g. equipment.
+    aUnits = dict()
+    for aType in PML_ELEMENTS.keys():
+        aUnits[aType] = (None, PML_ELEMENTS[aType][2], False)
+    # for
+    aUnits.update(theUnits or {})
+    return aUnits
+# DeltaUnits
+
+class PmlState(object):
+    # Snapshot of a tree: entries [RefNo, type, name, owner RefNo, hash] in
+    # pre-order, and the statements of the items a delta needs. With an old
+    # state only new, moved or changed items keep their statements.
+
+    def __init__(self, theEntries = None, theOld = None, theUnits = None):
+        self.entries = theEntries or []
+        self.statements = dict()
+        self.old = None
+        self.units = DeltaUnits(theUnits)
+        self.recreated = set()
+        if theOld != None:
+            self.old = dict((aEntry[0], aEntry) for aEntry in theOld.entries)
+        # if
+    # __init__
+
+    def Root(self):
+        return self.entries[0] if len(self.entries) > 0 else None
+    # Root
+
+    def Add(self, theRefNo, theType, theName, theOwner, theLines):
+        aHash = hashlib.sha1("".join(theLines).encode("utf-8")).hexdigest()
+        self.entries.append([theRefNo, theType, theName, theOwner, aHash])
+
+        if self.old == None:
+            # Full export, the statements are written as they come.
+            return
+        # if
+
+        aOld = self.old.get(theRefNo)
+        if aOld == None or aOld[1] != theType or aOld[3] != theOwner or theOwner in self.recreated:
+            self.recreated.add(theRefNo)
+        elif self.units[theType][2] and aOld[4] != aHash:
+            self.recreated.add(theRefNo)
+        # if
+
+        if theRefNo in self.recreated or aOld[4] != aHash:
+            self.statements[theRefNo] = theLines
+        # if
+    # Add
+
+    def Save(self, theFileName):
+        aTempName = theFileName + ".tmp"
+        with open(aTempName, "w") as aJsonFile:
+            json.dump({"entries": self.entries}, aJsonFile, separators=(",", ":"))
+        # with
+        os.replace(aTempName, theFileName)
+    # Save
+# PmlState
+
+def LoadState(theFileName):
+    try:
+        with open(theFileName, "r") as aJsonFile:
+            return PmlState(json.load(aJsonFile)["entries"])
+        # with
+    except (OSError, ValueError, KeyError) as e:
+        # No state yet or unreadable, export everything.
+        return None
+    # try
+# LoadState
+
+def SnapshotState(theRoot, theOld, theUnits = None, theProgress = None, theStep = 200):
+    # Read the tree from the host and hash the statements of every item.
+    aState = PmlState(None, theOld, theUnits)
+    aStack = [(theRoot, theRoot.Type, None)]
+
+    while len(aStack) > 0:
+        aItem, aType, aOwner = aStack.pop()
+        aRefNo = aItem.RefNo
+        aFormat, aMemberTypes, aRecreate = aState.units[aType]
+
+        aLines = []
+        if aFormat != None:
+            aLines = aFormat(aItem)
+        elif aType in PML_ELEMENTS:
+            PmlElement(aItem, aType, aLines)
+        # if
+
+        aState.Add(aRefNo, aType, aItem.Name, aOwner, aLines)
+
+        if len(aMemberTypes) > 0:
+            aMembers = []
+            for aMember in aItem.Member:
+                aMemberType = aMember.Type
+                if aMemberType in aMemberTypes:
+                    aMembers.append((aMember, aMemberType, aRefNo))
+                # if
+            # for
+            aMembers.reverse()
+            aStack.extend(aMembers)
+        # if
+
+        if theProgress != None and len(aState.entries) % theStep == 0:
+            theProgress(len(aState.entries))
+        # if
+    # while
+
+    return aState
+# SnapshotState
+
+class PmlTarget(object):
+    # Members, names and the current element of the target database while
+    # the delta statements are emitted.
+
+    def __init__(self, theState):
+        self.types = dict()
+        self.names = dict()
+        self.owners = dict()
+        self.members = dict()
+        self.current = None
+
+        for (aRefNo, aType, aName, aOwner, aHash) in theState.entries:
+            self.Add(aRefNo, aType, aName, aOwner, None)
+        # for
+    # __init__
+
+    def Add(self, theRefNo, theType, theName, theOwner, theAfter):
+        self.types[theRefNo] = theType
+        self.names[theRefNo] = theName
+        self.owners[theRefNo] = theOwner
+        self.members[theRefNo] = []
+        if theOwner != None:
+            aMembers = self.members[theOwner]
+            if theAfter == None:
+                aMembers.append(theRefNo)
+            else:
+                aMembers.insert(aMembers.index(theAfter) + 1, theRefNo)
+            # if
+        # if
+    # Add
+
+    def Remove(self, theRefNo):
+        self.members[self.owners[theRefNo]].remove(theRefNo)
+    # Remove
+
+    def Name(self, theRefNo):
+        # PML identifier of the item in the target.
+        aName = self.names[theRefNo]
+        if len(aName) > 0:
+            return "/" + aName
+        # if
+
+        aOwner = self.owners[theRefNo]
+        aType = self.types[theRefNo]
+        aIndex = 1
+        for aMember in self.members[aOwner]:
+            if aMember == theRefNo:
+                break
+            # if
+            if self.types[aMember] == aType:
+                aIndex += 1
+            # if
+        # for
+        return "%s %d OF %s" % (aType, aIndex, self.Name(aOwner))
+    # Name
+
+    def Goto(self, theRefNo, theLines):
+        if self.current != theRefNo:
+            theLines.append("\n" + self.Name(theRefNo))
+            self.current = theRefNo
+        # if
+    # Goto
+
+    def Context(self, theAfter, theOwner, theLines):
+        # Set the category variables as the full export would have them after theAfter.
+        aPtref = "nulref"
+        aGmref = "nulref"
+        for aMember in self.members[theOwner] if theAfter != None else []:
+            if self.types[aMember] == "PTSE":
+                aPtref = self.Name(aMember)
+            elif self.types[aMember] == "GMSE":
+                aGmref = self.Name(aMember)
+            # if
+            if aMember == theAfter:
+                break
+            # if
+        # for
+
+        theLines.append("\n!aCategory = " + self.Name(theOwner))
+        theLines.append("\n!aPtref = " + aPtref)
+        theLines.append("\n!aGmref = " + aGmref)
+    # Context
+# PmlTarget
+
+def DeltaPml(theOld, theNew):
+    # Return the delta statements and a dict of counts. The root must be
+    # named, so the target can find it.
+    aUnits = theNew.units
+    aOldRoot = theOld.Root()
+    aNewRoot = theNew.Root()
+    if aOldRoot == None or aOldRoot[0] != aNewRoot[0] or len(aNewRoot[2]) < 1:
+        raise ValueError("The PML state does not belong to a named %s" % aNewRoot[1])
+    # if
+
+    aOld = dict((aEntry[0], aEntry) for aEntry in theOld.entries)
+
+    # An item is kept when it has the same type and owner and its owner is
+    # kept, recreated units (e.g. equipment) only when unchanged.
+    aKept = set()
+    for (aRefNo, aType, aName, aOwner, aHash) in theNew.entries:
+        aOldEntry = aOld.get(aRefNo)
+        if aOldEntry == None or aOldEntry[1] != aType or aOldEntry[3] != aOwner:
+            continue
+        # if
+        if aOwner != None and aOwner not in aKept:
+            continue
+        # if
+        if aUnits[aType][2] and aOldEntry[4] != aHash:
+            continue
+        # if
+        aKept.add(aRefNo)
+    # for
+
+    aTarget = PmlTarget(theOld)
+    aLines = []
+    aCounts = {"delete": 0, "modify": 0, "new": 0}
+
+    # DELETE, topmost removed items only, last first.
+    for (aRefNo, aType, aName, aOwner, aHash) in reversed(theOld.entries):
+        if aRefNo in aKept or (aOwner != None and aOwner not in aKept):
+            continue
+        # if
+        aTarget.Goto(aRefNo, aLines)
+        aLines.append("\nDELETE %s" % aType)
+        aTarget.Remove(aRefNo)
+        aTarget.current = aOwner
+        aCounts["delete"] += 1
+    # for
+
+    # MODIFY, attributes only, the references are kept.
+    for (aRefNo, aType, aName, aOwner, aHash) in theNew.entries:
+        if aRefNo not in aKept or aOld[aRefNo][4] == aHash:
+            continue
+        # if
+        aTarget.Goto(aRefNo, aLines)
+        for aLine in theNew.statements[aRefNo][1:]:
+            if not aLine.startswith("\n!"):
+                aLines.append(aLine)
+            # if
+        # for
+        if aName != aTarget.names[aRefNo]:
+            aLines.append("\nNAME /%s" % aName if len(aName) > 0 else "\nUNNAME")
+            aTarget.names[aRefNo] = aName
+        # if
+        aCounts["modify"] += 1
+    # for
+
+    # NEW, top-down after the previous sibling in the new tree.
+    aMembers = dict()
+    for (aRefNo, aType, aName, aOwner, aHash) in theNew.entries:
+        aSiblings = aMembers.setdefault(aOwner, [])
+        aSiblings.append(aRefNo)
+        aMembers[aRefNo] = []
+
+        if aRefNo in aKept:
+            continue
+        # if
+
+        aAfter = aSiblings[-2] if len(aSiblings) > 1 else None
+        if aType in PML_CONTEXT_TYPES:
+            aTarget.Context(aAfter, aOwner, aLines)
+        # if
+        aTarget.Goto(aOwner if aAfter == None else aAfter, aLines)
+
+        aLines.extend(theNew.statements[aRefNo])
+        aTarget.Add(aRefNo, aType, aName, aOwner, aAfter)
+        aTarget.current = None if aUnits[aType][2] else aRefNo
+        aCounts["new"] += 1
+    # for
+
+    return (aLines, aCounts)
+# DeltaPml
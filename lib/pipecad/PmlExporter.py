@@ -23,437 +23,71 @@ from PythonQt.pipecad import *
 
 from lib.pipecad import *
 
-import time
+import os
 
+from pipecad.PmlWriter import *
+from pipecad.PmlImporter import ReadPml, CreatePml
+from pipecad.PmlDelta import PmlState, LoadState, SnapshotState, StateFileName, DeltaPml
+from pipecad.PmlSections import PmlSections
+from pipecad.JobRunner import Job
+from pipecad.JobDialog import RunJob
 
-def exportParam(thePmlFile, theKey, theValue):
-    if len(theValue) < 1:
-        return
-    # if
-
-    if theValue.startswith("DD"):
-        aSplits = theValue.split("*")
-        if len(aSplits) > 1:
-            thePmlFile.write("\n%s %s TIMES %s" % (theKey, aSplits[1], aSplits[0]))
-        else:
-            thePmlFile.write("\n%s %s" % (theKey, theValue))
-        #if
-    else:
-        thePmlFile.write("\n%s (%s)" % (theKey, theValue))
-    # if
 
-# exportParam
-
-def exportCatalogue(theTreeItem, thePmlFile):
+def exportCatalogue(theTreeItem, thePmlFile, theProgress = None, theState = None):
     if theTreeItem is None:
-        return
+        return 0
     # if
 
-    if theTreeItem.Type == "CATA":
-        # CATA
-        exportCata(theTreeItem, thePmlFile)
+    if theTreeItem.Type != "CATA":
+        return 0
     # if
 
+    # The PML_ELEMENTS table drives the walk, see PmlWriter.
+    return WritePml(theTreeItem, thePmlFile, theProgress, theState)
 # exportCatalogue
 
-def exportCata(theTreeItem, thePmlFile):
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW CATALOGUE /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW CATALOGUE")
-    # if
-
-    if len(theTreeItem.Purpose) > 0:
-        thePmlFile.write("\nPURP %s" % theTreeItem.Purpose)
-    # if
-
-    for aSectItem in theTreeItem.Member:
-        exportSect(aSectItem, thePmlFile)
-    # for
-
-# exportCata
-
-def exportSect(theTreeItem, thePmlFile):
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW SECTION /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW SECTION")
-    # if
-    
-    if len(theTreeItem.Purpose) > 0:
-        thePmlFile.write("\nPURP %s" % theTreeItem.Purpose)
-    # if
-
-    for aCateItem in theTreeItem.Member:
-        exportCate(aCateItem, thePmlFile)
-    # for
-# exportSect
-
-def exportCate(theTreeItem, thePmlFile):
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW CATEGORY /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW CATEGORY")
-    # if
-
-    if len(theTreeItem.Purpose) > 0:
-        thePmlFile.write("\nPURP %s" % theTreeItem.Purpose)
-    # if
-
-    thePmlFile.write("\nDESC |%s|" % theTreeItem.Description)
-    thePmlFile.write("\nGTYP %s" % theTreeItem.Gtype)
-    thePmlFile.write("\n!aCategory = ce")
-    thePmlFile.write("\n!aPtref = nulref")
-    thePmlFile.write("\n!aGmref = nulref")
-
-    for aChildItem in theTreeItem.Member:
-        exportSdte(aChildItem, thePmlFile)
-        exportText(aChildItem, thePmlFile)
-        exportPtse(aChildItem, thePmlFile)
-        exportGmse(aChildItem, thePmlFile)
-        exportScom(aChildItem, thePmlFile)
-    # for
-# exportCate
-
-def exportSdte(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "SDTE":
-        return
-    # if
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW SDTEXT /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW SDTEXT")
-    # if
-
-    thePmlFile.write("\nSKEY '%s'" % theTreeItem.Skey)
-    thePmlFile.write("\nRTEX (|%s|)" % theTreeItem.Rtext)
-    thePmlFile.write("\nSTEX |%s|" % theTreeItem.Stext)
-# exportSdte
-
-def exportText(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "TEXT":
-        return
-    # if
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW TEXT /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW TEXT")
-    # if
-
-    thePmlFile.write("\nSTEX |%s|" % theTreeItem.Stext)
-# exportText
-
-def exportScom(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "SCOM":
-        return
-    # if
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW SCOMPONENT /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW SCOMPONENT")
-    # if
-
-    thePmlFile.write("\n!!ce.Ptref = !aPtref")
-    thePmlFile.write("\n!!ce.Gmref = !aGmref")
-
-    thePmlFile.write("\nGTYP %s" % theTreeItem.Gtype)
-    thePmlFile.write("\nPARA %s" % theTreeItem.Param)
-
-# exportScom
-
-def exportPtse(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "PTSE":
-        return
-    # if
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW PTSET /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW PTSET")
-    # if
-
-    thePmlFile.write("\n!aCategory.Ptref = ce")
-    thePmlFile.write("\n!aPtref = ce")
-
-    for aPntItem in theTreeItem.Member:
-        exportPtax(aPntItem, thePmlFile)
-        exportPtca(aPntItem, thePmlFile)
-    # for
-
-# exportPtse
-
-def exportPtax(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "PTCA":
-        return
-    # if
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW PTCAR /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW PTCAR")
-    # if
-
-    aPx = theTreeItem.Px.replace("math.tan", "TAN")
-    aPx = aPx.replace("math.pi", "180")
-
-    aPy = theTreeItem.Py.replace("math.tan", "TAN")
-    aPy = aPy.replace("math.pi", "180")
-
-    aPz = theTreeItem.Pz.replace("math.tan", "TAN")
-    aPz = aPz.replace("math.pi", "180")
-
-    thePmlFile.write("\nNUMB %d" % theTreeItem.Number)
-
-    if len(theTreeItem.Connection) > 0:
-        thePmlFile.write("\nPCON %s" % theTreeItem.Connection)
-    # if
-
-    if len(theTreeItem.Bore) > 0:
-        thePmlFile.write("\nPBOR %s" % theTreeItem.Bore)
-    # if
-
-    if len(theTreeItem.Direction) > 0:
-        thePmlFile.write("\nPtcdirection %s" % theTreeItem.Direction)
-    # if
-
-    if len(aPx) > 0:
-        if aPx.startswith("DD"):
-            thePmlFile.write("\nPX %s" % aPx)
-        else:
-            thePmlFile.write("\nPX (%s)" % aPx)
-        # if
-    # if
-
-    if len(aPy) > 0:
-        if aPy.startswith("DD"):
-            thePmlFile.write("\nPY %s" % aPy)
-        else:
-            thePmlFile.write("\nPY (%s)" % aPy)
-        # if
-    # if
-
-    if len(aPz) > 0:
-        if aPz.startswith("DD"):
-            thePmlFile.write("\nPZ %s" % aPz)
-        else:
-            thePmlFile.write("\nPZ (%s)" % aPz)
+class PmlLines(list):
+    # File-like list of statements.
+
+    def write(self, theText):
+        self.append(theText)
+    # write
+# PmlLines
+
+def equipmentLines(theTreeItem):
+    aLines = PmlLines()
+    exportEquipment(theTreeItem, aLines)
+    return aLines
+# equipmentLines
+
+# Delta units of the equipment, an EQUI is recreated when it changed.
+PML_EQUIPMENT_UNITS = {
+    "ZONE": (None, ("EQUI",), False),
+    "EQUI": (equipmentLines, (), True),
+}
+
+def exportZone(theTreeItem, thePmlFile, theState = None):
+    # The equipment of a zone, or a single equipment.
+    aOwner = None
+    aEquipments = [theTreeItem]
+    if theTreeItem.Type == "ZONE":
+        aOwner = theTreeItem.RefNo
+        aEquipments = [aItem for aItem in theTreeItem.Member if aItem.Type == "EQUI"]
+        if theState != None:
+            theState.Add(aOwner, "ZONE", theTreeItem.Name, None, [])
         # if
-    # if
-
-# exportPtax
-
-def exportPtca(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "PTAX":
+    elif theTreeItem.Type != "EQUI":
         return
     # if
 
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW PTAXIS /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW PTAXIS")
-    # if
-
-    aPdis = theTreeItem.Distance.replace("math.tan", "TAN")
-    aPdis = aPdis.replace("math.pi", "180")
-
-    thePmlFile.write("\nNUMB %d" % theTreeItem.Number)
-
-    if len(theTreeItem.Connection) > 0:
-        thePmlFile.write("\nPCON %s" % theTreeItem.Connection)
-    # if
-
-    if len(theTreeItem.Bore) > 0:
-        thePmlFile.write("\nPBOR %s" % theTreeItem.Bore)
-    # if
-
-    if len(aPdis) > 0:
-        if aPdis.startswith("DD"):
-            thePmlFile.write("\nPDIS %s" % aPdis)
-        else:
-            thePmlFile.write("\nPDIS (%s)" % aPdis)
+    for aEquipment in aEquipments:
+        aLines = equipmentLines(aEquipment)
+        thePmlFile.write("".join(aLines))
+        if theState != None:
+            theState.Add(aEquipment.RefNo, "EQUI", aEquipment.Name, aOwner, aLines)
         # if
-    # if
-
-    if len(theTreeItem.Axis) > 0:
-        thePmlFile.write("\nPAXI %s" % theTreeItem.Axis)
-    # if
-# exportPtca
-
-def exportGmse(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "GMSE":
-        return
-    # if
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW GMSET /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW GMSET")
-    # if
-
-    thePmlFile.write("\n!aCategory.Gmref = ce")
-    thePmlFile.write("\n!aGmref = ce")
-
-    for aChildItem in theTreeItem.Member:
-        exportSbox(aChildItem, thePmlFile)
-        exportScyl(aChildItem, thePmlFile)
-        exportLsno(aChildItem, thePmlFile)
-        exportSdsh(aChildItem, thePmlFile)
-        exportScto(aChildItem, thePmlFile)
     # for
-
-# exportGmse
-
-def exportSbox(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "SBOX":
-        return
-    # if
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW SBOX /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW SBOX")
-    # if
-
-    thePmlFile.write("\nTuflag True")
-
-    if len(theTreeItem.Px) > 0:
-        thePmlFile.write("\nPx (%s)" % theTreeItem.Px)
-    # if
-
-    if len(theTreeItem.Py) > 0:
-        thePmlFile.write("\nPy (%s)" % theTreeItem.Py)
-    # if
-
-    if len(theTreeItem.Pz) > 0:
-        thePmlFile.write("\nPz (%s)" % theTreeItem.Pz)
-    # if
-
-    if len(theTreeItem.Pxlength) > 0:
-        thePmlFile.write("\nPxlength (%s)" % theTreeItem.Pxlength)
-    # if
-
-    if len(theTreeItem.Pylength) > 0:
-        thePmlFile.write("\nPylength (%s)" % theTreeItem.Pylength)
-    # if
-
-    if len(theTreeItem.Pzlength) > 0:
-        thePmlFile.write("\nPzlength (%s)" % theTreeItem.Pzlength)
-    # if
-
-# exportSbox
-
-def exportScyl(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "SCYL":
-        return
-    # if
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW SCYLINDER /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW SCYLINDER")
-    # if
-
-    thePmlFile.write("\nTuflag True")
-
-    if len(theTreeItem.Distance) > 0:
-        thePmlFile.write("\nPdistance (%s)" % theTreeItem.Distance)
-    # if
-
-    if len(theTreeItem.Diameter) > 0:
-        thePmlFile.write("\nPdiameter (%s)" % theTreeItem.Diameter)
-    # if
-
-    if len(theTreeItem.Height) > 0:
-        thePmlFile.write("\nPheight (%s)" % theTreeItem.Height)
-    # if
-
-    if len(theTreeItem.Axis) > 0:
-        thePmlFile.write("\nPaxis %s" % theTreeItem.Axis)
-    # if
-
-# exportScyl
-
-def exportLsno(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "LSNO":
-        return
-    # if
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW LSNOUT /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW LSNOUT")
-    # if
-
-    thePmlFile.write("\nTuflag True")
-
-    exportParam(thePmlFile, "Ptdistance", theTreeItem.Tdistance)
-    exportParam(thePmlFile, "Pbdistance", theTreeItem.Bdistance)
-    exportParam(thePmlFile, "Ptdiameter", theTreeItem.Tdiameter)
-    exportParam(thePmlFile, "Pbdiameter", theTreeItem.Bdiameter)
-    exportParam(thePmlFile, "Poffset", theTreeItem.Offset)
-
-    if len(theTreeItem.Aaxis) > 0:
-        thePmlFile.write("\nPaaxis %s" % theTreeItem.Aaxis)
-    # if
-
-    if len(theTreeItem.Baxis) > 0:
-        thePmlFile.write("\nPbaxis %s" % theTreeItem.Baxis)
-    # if
-
-# exportLsno
-
-def exportSdsh(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "SDSH":
-        return
-    # if
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW SDSH /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW SDSH")
-    # if
-
-    thePmlFile.write("\nTuflag True")
-
-    if len(theTreeItem.Axis) > 0:
-        thePmlFile.write("\nPaxis %s" % theTreeItem.Axis)
-    # if
-
-    exportParam(thePmlFile, "Pdistance", theTreeItem.Distance)
-    exportParam(thePmlFile, "Pheight", theTreeItem.Height)
-    exportParam(thePmlFile, "Pradius", theTreeItem.Radius)
-    exportParam(thePmlFile, "Pdiameter", theTreeItem.Diameter)
-
-# exportSdsh
-
-def exportScto(theTreeItem, thePmlFile):
-    if theTreeItem.Type != "SCTO":
-        return
-    # if
-
-    if len(theTreeItem.Name) > 0:
-        thePmlFile.write("\nNEW SCTORUS /%s" % theTreeItem.Name)
-    else:
-        thePmlFile.write("\nNEW SCTORUS")
-    # if
-
-    thePmlFile.write("\nTuflag True")
-
-    if len(theTreeItem.Aaxis) > 0:
-        thePmlFile.write("\nPaaxis %s" % theTreeItem.Aaxis)
-    # if
-
-    if len(theTreeItem.Baxis) > 0:
-        thePmlFile.write("\nPbaxis %s" % theTreeItem.Baxis)
-    # if
-
-    exportParam(thePmlFile, "Pdiameter", theTreeItem.Diameter)
-
-# exportScto
+# exportZone
 
 def exportEquipment(theTreeItem, thePmlFile):
     if theTreeItem.Type != "EQUI":
@@ -543,6 +177,72 @@ def exportEquipment(theTreeItem, thePmlFile):
     # for
 # exportEquipment
 
+class PmlExportJob(Job):
+    name = "Export PDMS PML"
+
+    def __init__(self, theTreeItem, theFileName, thePartSize = PML_PART_SIZE, theDelta = False):
+        self.treeItem = theTreeItem
+        self.fileName = theFileName
+        self.partSize = thePartSize
+        self.delta = theDelta
+        self.counts = None
+    # __init__
+
+    def Snapshot(self, theContext):
+        # The tree is read from the host, walk it on the main thread. A full
+        # export streams the body into the part files, a delta export keeps
+        # the statements of the changed items only.
+        aStateFile = StateFileName(self.fileName, self.treeItem.RefNo)
+
+        aOld = None
+        if self.delta and len(self.treeItem.Name) > 0:
+            aOld = LoadState(aStateFile)
+        # if
+
+        if aOld != None:
+            aProgress = lambda theCount: theContext.Progress(theCount, 0, "Compare %d elements" % theCount)
+            aState = SnapshotState(self.treeItem, aOld, PML_EQUIPMENT_UNITS, aProgress)
+            return (None, aOld, aState, aStateFile)
+        # if
+
+        aState = PmlState(None, None, PML_EQUIPMENT_UNITS)
+        aPmlFile = PmlPartWriter(self.fileName, self.partSize)
+        try:
+            aProgress = lambda theCount: theContext.Progress(theCount, 0, "%d elements, %d KB" % (theCount, aPmlFile.total // 1024))
+
+            exportZone(self.treeItem, aPmlFile, aState)
+
+            exportCatalogue(self.treeItem, aPmlFile, aProgress, aState)
+        except:
+            aPmlFile.Discard()
+            raise
+        # try
+
+        return (aPmlFile, None, aState, aStateFile)
+    # Snapshot
+
+    def Work(self, theSnapshot, theContext):
+        aPmlFile, aOld, aState, aStateFile = theSnapshot
+        theContext.Progress(0, 0, "Write " + self.fileName)
+
+        if aPmlFile == None:
+            aLines, self.counts = DeltaPml(aOld, aState)
+            aPmlFile = PmlPartWriter(self.fileName, 0)
+            aPmlFile.write("".join(aLines))
+        # if
+
+        try:
+            aFiles = aPmlFile.Close(PmlHeader(), PmlFooter(self.treeItem.Type))
+        except:
+            aPmlFile.Discard()
+            raise
+        # try
+
+        aState.Save(aStateFile)
+        return aFiles
+    # Work
+# PmlExportJob
+
 def Export():
     aTreeItem = PipeCad.CurrentItem()
     if aTreeItem is None:
@@ -555,40 +255,114 @@ def Export():
         return
     # if
 
-    aPmlFile = open(aFileName, "w")
+    aDelta = False
+    if os.path.isfile(StateFileName(aFileName, aTreeItem.RefNo)):
+        aDelta = QMessageBox.question(PipeCad, "", PipeCad.tr("Export only the changes since the last export?")) == QMessageBox.Yes
+    # if
+
+    aJob = PmlExportJob(aTreeItem, aFileName, PML_PART_SIZE, aDelta)
+    aResult = RunJob(aJob)
+    if aResult.cancelled or len(aResult.error) > 0:
+        return
+    # if
+
+    if aJob.counts != None:
+        QMessageBox.information(PipeCad, "", "Export PDMS PML Finished!\n%(new)d new, %(modify)d modified, %(delete)d deleted items." % aJob.counts)
+        return
+    # if
+
+    QMessageBox.information(PipeCad, "", "Export PDMS PML Finished!")
+# Export
+
+class PmlSectionsJob(Job):
+    name = "Export PDMS PML Sections"
+
+    def __init__(self, theTreeItem, theFileName, theWorkers = None):
+        self.treeItem = theTreeItem
+        self.fileName = theFileName
+        self.sections = PmlSections(theFileName, theWorkers)
+    # __init__
+
+    def Snapshot(self, theContext):
+        aProgress = lambda theCount, theTotal: theContext.Progress(theCount, theTotal, "Read section %d/%d" % (theCount, theTotal))
+        self.sections.Snapshot(self.treeItem, aProgress)
+    # Snapshot
+
+    def Work(self, theSnapshot, theContext):
+        aProgress = lambda theCount, theTotal: theContext.Progress(theCount, theTotal, "Write section %d/%d" % (theCount, theTotal))
+        aFiles = self.sections.Write(aProgress)
+        self.sections.state.Save(StateFileName(self.fileName, self.treeItem.RefNo))
+        return aFiles
+    # Work
+# PmlSectionsJob
+
+def ExportSections():
+    # Catalogue export with one macro per section, formatted in parallel.
+    aTreeItem = PipeCad.CurrentItem()
+    if aTreeItem is None or aTreeItem.Type != "CATA":
+        QMessageBox.critical(PipeCad, "", PipeCad.tr("Please select catalogue to export!"))
+        return
+    # if
+
+    aFileName = QFileDialog.getSaveFileName(PipeCad, PipeCad.tr("Export PDMS PML"), "", PipeCad.tr("PDMS PML Macro (*.pml)"))
+    if len(aFileName) < 1:
+        return
+    # if
+
+    aJob = PmlSectionsJob(aTreeItem, aFileName)
+    aResult = RunJob(aJob)
+    if aResult.cancelled or len(aResult.error) > 0:
+        return
+    # if
 
-    # PML Macro Header.
-    aPmlFile.write("$S-  -- Synonym translation OFF")
-    aPmlFile.write("\n-- ----------------------------------------------------------------")
-    aPmlFile.write("\n-- Data Listing    Date : " + time.asctime(time.localtime(time.time())))
-    aPmlFile.write("\n-- Exported by PipeCAD.\n")
+    aTiming = aJob.sections.timing
+    QMessageBox.information(PipeCad, "", "Export PDMS PML Finished!\n%d sections, read %.2fs, format %.2fs." % (len(aJob.sections.sections), aTiming["snapshot"], aTiming["format"]))
+# ExportSections
 
-    aPmlFile.write("\nONERROR GOLABEL /ERROR3\n")
-    aPmlFile.write("\nINPUT BEGIN")
+def PmlOrientation(theY, theZ):
+    # ORI Y is .. and Z is .., Orientation takes the Z and X directions.
+    aX = (theY[1] * theZ[2] - theY[2] * theZ[1], theY[2] * theZ[0] - theY[0] * theZ[2], theY[0] * theZ[1] - theY[1] * theZ[0])
+    return Orientation(theZ[0], theZ[1], theZ[2], aX[0], aX[1], aX[2])
+# PmlOrientation
 
-    # PML Macro Content.
-    exportEquipment(aTreeItem, aPmlFile)
+class PmlImportJob(Job):
+    name = "Import PDMS PML"
 
-    exportCatalogue(aTreeItem, aPmlFile)
+    def __init__(self, theTreeItem, theFileName):
+        self.treeItem = theTreeItem
+        self.fileName = theFileName
+    # __init__
 
-    aPmlFile.write("\nINPUT END %s" % aTreeItem.Type)
-    aPmlFile.write("\nINPUT FINISH\n")
+    def Work(self, theSnapshot, theContext):
+        # Parsing does not touch the host, run it in the worker.
+        aProgress = lambda theCount: theContext.Progress(theCount, 0, "Read %d statements" % theCount)
+        return ReadPml(self.fileName, aProgress)
+    # Work
 
-    # Handle Exception.
-    aPmlFile.write("\n-- Switch synonyms back on if an error occurs.")
-    aPmlFile.write("\nLABEL /ERROR3")
-    aPmlFile.write("\nhandle ANY")
-    aPmlFile.write("\n$S+")
-    aPmlFile.write("\nRETURN ERROR")
-    aPmlFile.write("\nendhandle\n")
+    def Finish(self, theTree, theContext):
+        aProgress = lambda theCount, theTotal: theContext.Progress(theCount, theTotal, "Create %d/%d items" % (theCount, theTotal))
+        aValues = {"Position": Position, "Orientation": PmlOrientation}
+        return CreatePml(theTree, PipeCad, self.treeItem, aValues, aProgress)
+    # Finish
+# PmlImportJob
 
-    # PML Macro Footer.
-    aPmlFile.write("\n-- End Data Listing    Date : " + time.asctime(time.localtime(time.time())))
-    aPmlFile.write("\n$S+  -- Synonym translation ON")
-    aPmlFile.write("\n-- ----------------------------------------------------------------")
-    aPmlFile.write("\n")
+def Import():
+    aTreeItem = PipeCad.CurrentItem()
+    if aTreeItem is None:
+        QMessageBox.critical(PipeCad, "", PipeCad.tr("Please select item to import into!"))
+        return
+    # if
 
-    aPmlFile.close()
+    aFileName = QFileDialog.getOpenFileName(PipeCad, PipeCad.tr("Import PDMS PML"), "", PipeCad.tr("PDMS PML Macro (*.pml *.mac)"))
+    if len(aFileName) < 1:
+        return
+    # if
 
-    QMessageBox.information(PipeCad, "", "Export PDMS PML Finished!")
-# Export
+    aResult = RunJob(PmlImportJob(aTreeItem, aFileName))
+    if aResult.cancelled or len(aResult.error) > 0:
+        return
+    # if
+
+    aStat = aResult.result
+    QMessageBox.information(PipeCad, "", "Import PDMS PML Finished!\n%d items in %.2fs (%.0f items/s)" % (aStat["items"], aStat["seconds"], aStat["rate"]))
+# Import
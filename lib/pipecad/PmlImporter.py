@@ -0,0 +1,428 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Pure Python PML macro importer, no PythonQt dependency.
+# ReadPml() tokenizes the macro in one streaming pass and builds a tree of
+# PmlNode, following $M includes (e.g. the index macro of a split export).
+# CreatePml() then creates the tree in the host under one transaction.
+# It walks the tree with an explicit stack and switches the current item only
+# when the owner changes; references are resolved after all items exist.
+
+import os
+import time
+
+from pipecad.PmlWriter import PML_ELEMENTS
+
+# PML keyword: element type, for the catalogue see PmlWriter.PML_ELEMENTS.
+PML_TYPES = dict((aKeyword, aType) for (aType, (aKeyword, aWriter, aMembers)) in PML_ELEMENTS.items())
+PML_TYPES.update({
+    "EQUIPMENT": "EQUI",
+    "CYLINDER": "CYLI",
+    "BOX": "BOX",
+    "DISH": "DISH",
+    "CONE": "CONE",
+    "EXTR": "EXTR",
+    "NXTR": "NXTR",
+    "LOOP": "LOOP",
+    "VERT": "VERT",
+    "NOZZ": "NOZZ",
+})
+
+# Element type: types which may own it, a NEW goes up the tree to the first one.
+PML_OWNERS = dict()
+for (aType, (aKeyword, aWriter, aMembers)) in PML_ELEMENTS.items():
+    for aMember in aMembers:
+        PML_OWNERS.setdefault(aMember, set()).add(aType)
+    # for
+# for
+PML_OWNERS.update({
+    "CYLI": {"EQUI"},
+    "BOX": {"EQUI"},
+    "DISH": {"EQUI"},
+    "CONE": {"EQUI"},
+    "EXTR": {"EQUI"},
+    "NOZZ": {"EQUI"},
+    "LOOP": {"EXTR", "NXTR"},
+    "NXTR": {"EXTR"},
+    "VERT": {"LOOP"},
+})
+
+# Attribute keyword (upper case): (attribute, value type).
+PML_ATTRIBUTES = {
+    "PURP": ("Purpose", "word"),
+    "DESC": ("Description", "text"),
+    "GTYP": ("Gtype", "word"),
+    "PARA": ("Param", "line"),
+    "SKEY": ("Skey", "text"),
+    "RTEX": ("Rtext", "text"),
+    "STEX": ("Stext", "text"),
+    "NUMB": ("Number", "int"),
+    "PCON": ("Connection", "word"),
+    "PBOR": ("Bore", "word"),
+    "PTCDIRECTION": ("Direction", "word"),
+    "PX": ("Px", "param"),
+    "PY": ("Py", "param"),
+    "PZ": ("Pz", "param"),
+    "PDIS": ("Distance", "param"),
+    "PAXI": ("Axis", "word"),
+    "TUFLAG": ("Tuflag", "bool"),
+    "PXLENGTH": ("Pxlength", "param"),
+    "PYLENGTH": ("Pylength", "param"),
+    "PZLENGTH": ("Pzlength", "param"),
+    "PDISTANCE": ("Distance", "param"),
+    "PDIAMETER": ("Diameter", "param"),
+    "PHEIGHT": ("Height", "param"),
+    "PRADIUS": ("Radius", "param"),
+    "PAXIS": ("Axis", "word"),
+    "PTDISTANCE": ("Tdistance", "param"),
+    "PBDISTANCE": ("Bdistance", "param"),
+    "PTDIAMETER": ("Tdiameter", "param"),
+    "PBDIAMETER": ("Bdiameter", "param"),
+    "POFFSET": ("Offset", "param"),
+    "PAAXIS": ("Aaxis", "word"),
+    "PBAXIS": ("Baxis", "word"),
+    "DIAM": ("Diameter", "float"),
+    "HEIG": ("Height", "float"),
+    "RADI": ("Radius", "float"),
+    "XLEN": ("Xlength", "float"),
+    "YLEN": ("Ylength", "float"),
+    "ZLEN": ("Zlength", "float"),
+    "DTOP": ("Tdiameter", "float"),
+    "DBOT": ("Bdiameter", "float"),
+}
+
+# Statements which only control the macro run.
+PML_CONTROLS = ("$S", "$P", "ONERROR", "INPUT", "LABEL", "RETURN", "--")
+
+# Direction variable components, see PmlExporter.exportEquipment.
+PML_COMPONENTS = {"east": 0, "north": 1, "up": 2}
+
+
+class PmlError(Exception):
+    pass
+# PmlError
+
+class PmlNode(object):
+    __slots__ = ("type", "name", "owner", "attributes", "references", "members", "line")
+
+    def __init__(self, theType, theName, theOwner, theLine):
+        self.type = theType
+        self.name = theName
+        self.owner = theOwner
+        self.attributes = dict()
+        self.references = dict()
+        self.members = []
+        self.line = theLine
+    # __init__
+# PmlNode
+
+class PmlTree(object):
+    # Items read from one macro, roots are the elements without an owner in it.
+
+    def __init__(self):
+        self.roots = []
+        self.names = dict()
+        self.count = 0
+        self.statements = 0
+        self.files = []
+    # __init__
+# PmlTree
+
+def PmlStatements(theFileName, theFiles = None):
+    # Yield (file, line number, statement) of the macro and its $M includes,
+    # skipping the handle ... endhandle blocks.
+    if theFiles != None:
+        theFiles.append(theFileName)
+    # if
+
+    aHandle = False
+    with open(theFileName, "r") as aPmlFile:
+        for aLineNo, aLine in enumerate(aPmlFile, 1):
+            aStatement = aLine.strip()
+            if len(aStatement) < 1:
+                continue
+            # if
+
+            aKeyword = aStatement.split(None, 1)[0].lower()
+            if aHandle:
+                aHandle = aKeyword != "endhandle"
+                continue
+            elif aKeyword == "handle":
+                aHandle = True
+                continue
+            # if
+
+            if aKeyword == "$m":
+                aInclude = aStatement[2:].strip()
+                if aInclude.startswith("/"):
+                    aInclude = aInclude[1:]
+                # if
+                if not os.path.isabs(aInclude):
+                    aInclude = os.path.join(os.path.dirname(theFileName), aInclude)
+                # if
+                yield from PmlStatements(aInclude, theFiles)
+                continue
+            # if
+
+            yield (theFileName, aLineNo, aStatement)
+        # for
+    # with
+# PmlStatements
+
+def PmlValue(theText, theValueType):
+    if theValueType == "line":
+        return theText
+    elif theValueType == "int":
+        return int(theText)
+    elif theValueType == "float":
+        return float(theText)
+    elif theValueType == "bool":
+        return theText.upper() in ("TRUE", "T", "YES")
+    # if
+
+    if len(theText) > 1 and theText[0] == "(" and theText[-1] == ")":
+        theText = theText[1:-1]
+    # if
+    if len(theText) > 1 and theText[0] == theText[-1] and theText[0] in "|'":
+        theText = theText[1:-1]
+    # if
+
+    if theValueType == "param":
+        # Reverse of PmlWriter.PmlParam, "DDX TIMES 2" is "2*DDX".
+        aSplits = theText.split(" TIMES ")
+        if len(aSplits) == 2:
+            return "%s*%s" % (aSplits[1], aSplits[0])
+        # if
+    # if
+
+    return theText
+# PmlValue
+
+def PmlPosition(theWords):
+    # E x N y U z, also W/S/D for negative values.
+    aXyz = [0.0, 0.0, 0.0]
+    for aWord in theWords:
+        aAxis = aWord[:1].upper()
+        aSign = 1.0
+        if aAxis in "WSD":
+            aSign = -1.0
+        # if
+        aXyz["EWNSUD".index(aAxis) // 2] = aSign * float(aWord[1:])
+    # for
+    return tuple(aXyz)
+# PmlPosition
+
+def PmlReadAttributes(theNode, theWords):
+    # Inline attributes of a NEW statement, e.g. NEW BOX XLEN 1 YLEN 2 ZLEN 3.
+    i = 0
+    while i < len(theWords):
+        aKey = theWords[i].upper()
+        if aKey == "POS":
+            theNode.attributes["Position"] = PmlPosition(theWords[i + 1:i + 4])
+            i += 4
+        elif aKey in PML_ATTRIBUTES and i + 1 < len(theWords):
+            aAttribute, aValueType = PML_ATTRIBUTES[aKey]
+            theNode.attributes[aAttribute] = PmlValue(theWords[i + 1], aValueType)
+            i += 2
+        else:
+            raise PmlError("Unknown attribute %s" % theWords[i])
+        # if
+    # while
+# PmlReadAttributes
+
+def ReadPml(theFileName, theProgress = None, theStep = 5000):
+    # Parse the macro into a PmlTree, raise PmlError with the file and line.
+    aTree = PmlTree()
+    aCurrent = None
+    aVariables = dict()
+
+    for (aFileName, aLineNo, aStatement) in PmlStatements(theFileName, aTree.files):
+        aTree.statements += 1
+        if theProgress != None and aTree.statements % theStep == 0:
+            theProgress(aTree.statements)
+        # if
+
+        try:
+            aWords = aStatement.split()
+            aKey = aWords[0].upper()
+
+            if aKey.startswith(PML_CONTROLS):
+                continue
+            elif aKey == "NEW":
+                aType = PML_TYPES.get(aWords[1].upper(), aWords[1].upper())
+                aName = ""
+                aRest = aWords[2:]
+                if len(aRest) > 0 and aRest[0].startswith("/"):
+                    # The exporter writes /Name, the item name has no slash.
+                    aName = aRest[0][1:]
+                    aRest = aRest[1:]
+                # if
+
+                # Go up to the owner, like the NEW command does on the current element.
+                aOwners = PML_OWNERS.get(aType)
+                aOwner = aCurrent
+                while aOwner != None and aOwners != None and aOwner.type not in aOwners:
+                    aOwner = aOwner.owner
+                # while
+
+                aCurrent = PmlNode(aType, aName, aOwner, aLineNo)
+                if aOwner == None:
+                    aTree.roots.append(aCurrent)
+                else:
+                    aOwner.members.append(aCurrent)
+                # if
+                if len(aName) > 0:
+                    aTree.names["/" + aName] = aCurrent
+                # if
+                aTree.count += 1
+
+                PmlReadAttributes(aCurrent, aRest)
+            elif aKey == "END":
+                if aCurrent != None:
+                    aCurrent = aCurrent.owner
+                # if
+            elif aKey.startswith("!"):
+                aCurrent = ReadAssignment(aStatement, aCurrent, aVariables)
+            elif aCurrent == None:
+                raise PmlError("No current element")
+            elif aKey == "POS":
+                aCurrent.attributes["Position"] = PmlPosition(aWords[1:4])
+            elif aKey == "ORI":
+                # ORI Y is $!aDy and Z is $!aDz
+                aY = aVariables[aWords[3].lstrip("$!")]
+                aZ = aVariables[aWords[7].lstrip("$!")]
+                aCurrent.attributes["Orientation"] = (tuple(aY), tuple(aZ))
+            elif aKey == "CATR":
+                aCurrent.references["Catref"] = aWords[-1]
+            elif aKey in PML_ATTRIBUTES:
+                aAttribute, aValueType = PML_ATTRIBUTES[aKey]
+                aText = aStatement[len(aWords[0]):].strip()
+                aCurrent.attributes[aAttribute] = PmlValue(aText, aValueType)
+            else:
+                raise PmlError("Unknown statement")
+            # if
+        except (PmlError, ValueError, IndexError, KeyError) as e:
+            raise PmlError("%s:%d: %s (%s)" % (aFileName, aLineNo, aStatement, e))
+        # try
+    # for
+
+    return aTree
+# ReadPml
+
+def ReadAssignment(theStatement, theCurrent, theVariables):
+    # PML variable statements written by the exporter, returns the current node.
+    aLeft, aRight = [aPart.strip() for aPart in theStatement.split("=", 1)]
+    aTarget, aDot, aAttribute = aLeft.lstrip("!").partition(".")
+    aRightName = aRight.lstrip("!")
+
+    if aRight.lower() == "ce":
+        aValue = theCurrent
+    elif aRight.lower() == "nulref":
+        aValue = None
+    elif aRight.lower().startswith("object direction"):
+        aValue = [0.0, 0.0, 0.0]
+    elif aRight.startswith("!"):
+        aValue = theVariables[aRightName]
+    else:
+        aValue = float(aRight)
+    # if
+
+    if aTarget == "ce":
+        if len(aAttribute) < 1:
+            # !!ce = !aVar
+            return aValue
+        # if
+        theCurrent.references[aAttribute] = aValue
+    elif len(aAttribute) < 1:
+        theVariables[aTarget] = aValue
+    elif aAttribute in PML_COMPONENTS:
+        theVariables[aTarget][PML_COMPONENTS[aAttribute]] = aValue
+    elif theVariables[aTarget] != None:
+        theVariables[aTarget].references[aAttribute] = aValue
+    # if
+
+    return theCurrent
+# ReadAssignment
+
+def CreatePml(theTree, theHost, theRoot, theValues = None, theProgress = None, theStep = 200):
+    # Create the tree below theRoot in one transaction, return a dict with
+    # the item count, the time and the items per second.
+    # theValues converts tuple attributes, e.g. {"Position": Position}.
+    aStartTime = time.perf_counter()
+    aValues = theValues or dict()
+    aItems = dict()
+    aCount = 0
+
+    theHost.StartTransaction("Import PML")
+    try:
+        aCurrent = theRoot
+        theHost.SetCurrentItem(theRoot)
+
+        aStack = list(reversed(theTree.roots))
+        while len(aStack) > 0:
+            aNode = aStack.pop()
+
+            # CreateItem makes the new item current, so only the first member
+            # of an item is created without switching back to its owner.
+            aOwner = theRoot if aNode.owner == None else aItems[id(aNode.owner)]
+            if aOwner is not aCurrent:
+                theHost.SetCurrentItem(aOwner)
+            # if
+
+            aCurrent = theHost.CreateItem(aNode.type, aNode.name)
+            if aCurrent is None:
+                aCurrent = theHost.CurrentItem()
+            # if
+            aItems[id(aNode)] = aCurrent
+
+            for (aAttribute, aValue) in aNode.attributes.items():
+                if aAttribute in aValues:
+                    aValue = aValues[aAttribute](*aValue)
+                # if
+                setattr(aCurrent, aAttribute, aValue)
+            # for
+
+            aStack.extend(reversed(aNode.members))
+
+            aCount += 1
+            if theProgress != None and aCount % theStep == 0:
+                theProgress(aCount, theTree.count)
+            # if
+        # while
+
+        # References may point forward, set them once everything exists.
+        aStack = list(theTree.roots)
+        while len(aStack) > 0:
+            aNode = aStack.pop()
+            for (aAttribute, aTarget) in aNode.references.items():
+                if isinstance(aTarget, PmlNode):
+                    aTarget = aItems[id(aTarget)]
+                elif isinstance(aTarget, str):
+                    aTarget = aItems[id(theTree.names[aTarget])] if aTarget in theTree.names else theHost.GetItem(aTarget)
+                # if
+                if aTarget is not None:
+                    setattr(aItems[id(aNode)], aAttribute, aTarget)
+                # if
+            # for
+            aStack.extend(aNode.members)
+        # while
+    finally:
+        # No rollback in the host API, the import is undone as one transaction.
+        theHost.CommitTransaction()
+    # try
+
+    aTime = time.perf_counter() - aStartTime
+    return {"items": aCount, "seconds": aTime, "rate": aCount / aTime if aTime > 0 else 0.0}
+# CreatePml
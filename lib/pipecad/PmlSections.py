@@ -0,0 +1,285 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Parallel per-section PML catalogue export, no PythonQt dependency.
+# Each SECT subtree is copied from the host on the main thread into plain
+# PmlItem objects, the copies are formatted in worker processes into one
+# .pml file per section, and a master macro runs them in order with $M.
+# Header, catalogue statements and the section files concatenated give the
+# same bytes as the serial PmlWriter export.
+#
+#   python -m pipecad.PmlSections catalogue.pml [-j 4]
+# imports a PML catalogue into a HeadlessHost and compares the serial and
+# the parallel export.
+
+import os
+import sys
+import time
+import argparse
+import concurrent.futures
+
+from pipecad.PmlWriter import *
+from pipecad.PmlDelta import PmlState
+from pipecad.PcfBatch import CreateExecutor
+
+
+class PmlItem(object):
+    # Plain, picklable copy of a host item with the attributes of its writer.
+
+    def __init__(self, theType, theName, theRefNo):
+        self.Type = theType
+        self.Name = theName
+        self.RefNo = theRefNo
+        self.Member = []
+    # __init__
+# PmlItem
+
+class PmlStream(object):
+    # Single file PML writer for a worker, sections are never split.
+
+    def __init__(self, theFile):
+        self.file = theFile
+        self.total = 0
+    # __init__
+
+    def write(self, theText):
+        self.file.write(theText)
+        self.total += len(theText)
+    # write
+
+    def Boundary(self):
+        pass
+    # Boundary
+# PmlStream
+
+def CopyItem(theItem, theType):
+    aCopy = PmlItem(theType, theItem.Name, theItem.RefNo)
+    for aAttribute in PML_ITEM_ATTRIBUTES[theType]:
+        setattr(aCopy, aAttribute, getattr(theItem, aAttribute))
+    # for
+    return aCopy
+# CopyItem
+
+def SnapshotSection(theSection):
+    # Copy the exported part of a SECT subtree, reads the host.
+    aRoot = CopyItem(theSection, "SECT")
+    aStack = [(theSection, aRoot)]
+    while len(aStack) > 0:
+        aItem, aCopy = aStack.pop()
+        aMemberTypes = PML_ELEMENTS[aCopy.Type][2]
+        for aMember in aItem.Member:
+            aMemberType = aMember.Type
+            if aMemberType in aMemberTypes:
+                aMemberCopy = CopyItem(aMember, aMemberType)
+                aCopy.Member.append(aMemberCopy)
+                aStack.append((aMember, aMemberCopy))
+            # if
+        # for
+    # while
+    return aRoot
+# SnapshotSection
+
+def WriteSection(theIndex, theSection, theFileName):
+    # Run in the worker, return (index, file name, state entries, error message).
+    aTempName = theFileName + ".tmp"
+    try:
+        aState = PmlState()
+        with open(aTempName, "w", buffering=PML_BUFFER_SIZE) as aPmlFile:
+            WritePml(theSection, PmlStream(aPmlFile), None, aState)
+        # with
+        os.replace(aTempName, theFileName)
+        return (theIndex, theFileName, aState.entries, "")
+    except Exception as e:
+        if os.path.exists(aTempName):
+            os.remove(aTempName)
+        # if
+        return (theIndex, theFileName, [], "%s: %s" % (type(e).__name__, e))
+    # try
+# WriteSection
+
+def SectionFileName(theFileName, theIndex):
+    aRoot, aExt = os.path.splitext(theFileName)
+    return "%s_%03d%s" % (aRoot, theIndex, aExt or ".pml")
+# SectionFileName
+
+class PmlSections(object):
+    # Snapshot() on the main thread, then Write() anywhere. The state of the
+    # written tree is kept for the next delta export, see PmlDelta.
+
+    def __init__(self, theFileName, theWorkers = None):
+        self.fileName = theFileName
+        self.workers = theWorkers
+        self.type = "CATA"
+        self.lines = []
+        self.sections = []
+        self.state = PmlState()
+        self.timing = dict()
+    # __init__
+
+    def Snapshot(self, theCatalogue, theProgress = None):
+        aStartTime = time.perf_counter()
+
+        self.type = theCatalogue.Type
+        PmlElement(theCatalogue, "CATA", self.lines)
+        self.state.Add(theCatalogue.RefNo, "CATA", theCatalogue.Name, None, self.lines)
+
+        aSections = [aItem for aItem in theCatalogue.Member if aItem.Type == "SECT"]
+        for i, aSection in enumerate(aSections):
+            self.sections.append(SnapshotSection(aSection))
+            if theProgress != None:
+                theProgress(i + 1, len(aSections))
+            # if
+        # for
+
+        self.timing["snapshot"] = time.perf_counter() - aStartTime
+    # Snapshot
+
+    def Write(self, theProgress = None):
+        # Format the sections in parallel, then write the master macro.
+        # theProgress(done, total) may raise to cancel, returns the file names.
+        aStartTime = time.perf_counter()
+        aFileNames = [SectionFileName(self.fileName, i + 1) for i in range(len(self.sections))]
+
+        aExecutor = CreateExecutor(self.workers)
+        try:
+            aFutures = set()
+            for i, aSection in enumerate(self.sections):
+                aFutures.add(aExecutor.submit(WriteSection, i, aSection, aFileNames[i]))
+            # for
+
+            aErrors = []
+            aEntries = [None] * len(self.sections)
+            aDone = 0
+            while len(aFutures) > 0:
+                aFinished, aFutures = concurrent.futures.wait(aFutures, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED)
+                for aFuture in aFinished:
+                    aIndex, aFileName, aEntries[aIndex], aError = aFuture.result()
+                    if len(aError) > 0:
+                        aErrors.append("%s: %s" % (aFileName, aError))
+                    # if
+                    aDone += 1
+                # for
+                if theProgress != None:
+                    theProgress(aDone, len(self.sections))
+                # if
+            # while
+
+            if len(aErrors) > 0:
+                raise IOError("\n".join(aErrors))
+            # if
+        except:
+            for aFuture in aFutures:
+                aFuture.cancel()
+            # for
+            aExecutor.shutdown(wait=True)
+            self.Discard(aFileNames)
+            raise
+        # try
+        aExecutor.shutdown(wait=True)
+
+        # The sections were written from the SECT down, hang them below the catalogue.
+        aRefNo = self.state.Root()[0]
+        for aSectionEntries in aEntries:
+            aSectionEntries[0][3] = aRefNo
+            self.state.entries.extend(aSectionEntries)
+        # for
+
+        self.timing["format"] = time.perf_counter() - aStartTime
+
+        aTempName = self.fileName + ".tmp"
+        with open(aTempName, "w", buffering=PML_BUFFER_SIZE) as aPmlFile:
+            aPmlFile.write(PmlHeader())
+            aPmlFile.write("".join(self.lines))
+            for aFileName in aFileNames:
+                aPmlFile.write("\n$M /%s" % os.path.abspath(aFileName))
+            # for
+            aPmlFile.write(PmlFooter(self.type))
+        # with
+        os.replace(aTempName, self.fileName)
+
+        return [self.fileName] + aFileNames
+    # Write
+
+    def Discard(self, theFileNames):
+        for aFileName in theFileNames:
+            if os.path.exists(aFileName):
+                os.remove(aFileName)
+            # if
+        # for
+    # Discard
+# PmlSections
+
+def main(theArgs = None):
+    from pipecad.HeadlessHost import HeadlessHost
+    from pipecad.PmlImporter import ReadPml, CreatePml
+
+    aParser = argparse.ArgumentParser(description="Compare the serial and the parallel PML catalogue export.")
+    aParser.add_argument("catalogue", help="PML catalogue macro to import")
+    aParser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    aParser.add_argument("-o", "--output", default="sections.pml", help="master macro of the parallel export")
+    aArgs = aParser.parse_args(theArgs)
+
+    aHost = HeadlessHost()
+    aHost.Install()
+    aTree = ReadPml(aArgs.catalogue)
+    CreatePml(aTree, aHost, aHost.world)
+
+    # The host gives every attribute a default, the stand-in only has the imported ones.
+    for aItem in aHost.items:
+        for aAttribute in PML_ITEM_ATTRIBUTES.get(aItem.Type, ()):
+            aItem.attributes.setdefault(aAttribute, 0 if aAttribute == "Number" else "")
+        # for
+    # for
+
+    aCatalogues = [aItem for aItem in aHost.world.Member if aItem.Type == "CATA"]
+    if len(aCatalogues) < 1:
+        aParser.error("No catalogue in " + aArgs.catalogue)
+    # if
+    aCatalogue = aCatalogues[0]
+
+    aStartTime = time.perf_counter()
+    aSerialName = os.path.splitext(aArgs.output)[0] + "_serial.pml"
+    aPmlFile = PmlPartWriter(aSerialName, 0)
+    WritePml(aCatalogue, aPmlFile)
+    aPmlFile.Close("", "")
+    aSerialTime = time.perf_counter() - aStartTime
+
+    aStartTime = time.perf_counter()
+    aSections = PmlSections(aArgs.output, aArgs.workers)
+    aSections.Snapshot(aCatalogue)
+    aFileNames = aSections.Write()
+    aParallelTime = time.perf_counter() - aStartTime
+
+    with open(aSerialName, "r") as aPmlFile:
+        aSerial = aPmlFile.read()
+    # with
+    aParallel = "".join(aSections.lines)
+    for aFileName in aFileNames[1:]:
+        with open(aFileName, "r") as aPmlFile:
+            aParallel += aPmlFile.read()
+        # with
+    # for
+
+    print("%d sections, %d characters" % (len(aSections.sections), len(aSerial)))
+    print("serial   %.3fs" % aSerialTime)
+    print("parallel %.3fs (snapshot %.3fs, format %.3fs)" % (aParallelTime, aSections.timing["snapshot"], aSections.timing["format"]))
+    print("identical" if aSerial == aParallel else "DIFFERENT")
+
+    return 0 if aSerial == aParallel else 1
+# main
+
+if __name__ == "__main__":
+    sys.exit(main())
+# if
@@ -0,0 +1,416 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Pure Python PML catalogue writer, no PythonQt dependency.
+# The catalogue tree is walked with an explicit stack, every element type is
+# written by one entry of PML_ELEMENTS. Each element is formatted into a list
+# of statements and handed to the writer as a single string.
+# PmlPartWriter streams the statements to disk and can split a huge catalogue
+# into size-capped part files, run in order by an index macro ($M).
+
+import os
+import time
+import shutil
+
+# Buffer size of the PML files, statements are flushed in large blocks.
+PML_BUFFER_SIZE = 1 << 20
+
+# Default size cap of one PML part file, 0 keeps everything in one file.
+PML_PART_SIZE = 64 << 20
+
+# Element types a new part file may start with.
+PML_BOUNDARIES = ("SECT", "CATE")
+
+# Report progress every so many elements.
+PML_PROGRESS_STEP = 200
+
+
+def PmlExpression(theText):
+    return theText.replace("math.tan", "TAN").replace("math.pi", "180")
+# PmlExpression
+
+def PmlParam(theLines, theKey, theValue):
+    if len(theValue) < 1:
+        return
+    # if
+
+    if theValue.startswith("DD"):
+        aSplits = theValue.split("*")
+        if len(aSplits) > 1:
+            theLines.append("\n%s %s TIMES %s" % (theKey, aSplits[1], aSplits[0]))
+        else:
+            theLines.append("\n%s %s" % (theKey, theValue))
+        #if
+    else:
+        theLines.append("\n%s (%s)" % (theKey, theValue))
+    # if
+# PmlParam
+
+def PmlDesign(theLines, theKey, theValue):
+    # Design parameter, DD... is written as is.
+    if len(theValue) < 1:
+        return
+    # if
+
+    if theValue.startswith("DD"):
+        theLines.append("\n%s %s" % (theKey, theValue))
+    else:
+        theLines.append("\n%s (%s)" % (theKey, theValue))
+    # if
+# PmlDesign
+
+def PmlValue(theLines, theFormat, theValue):
+    if len(theValue) > 0:
+        theLines.append(theFormat % theValue)
+    # if
+# PmlValue
+
+def PmlCata(theItem, theLines):
+    PmlValue(theLines, "\nPURP %s", theItem.Purpose)
+# PmlCata
+
+def PmlCate(theItem, theLines):
+    PmlValue(theLines, "\nPURP %s", theItem.Purpose)
+
+    theLines.append("\nDESC |%s|" % theItem.Description)
+    theLines.append("\nGTYP %s" % theItem.Gtype)
+    theLines.append("\n!aCategory = ce")
+    theLines.append("\n!aPtref = nulref")
+    theLines.append("\n!aGmref = nulref")
+# PmlCate
+
+def PmlSdte(theItem, theLines):
+    theLines.append("\nSKEY '%s'" % theItem.Skey)
+    theLines.append("\nRTEX (|%s|)" % theItem.Rtext)
+    theLines.append("\nSTEX |%s|" % theItem.Stext)
+# PmlSdte
+
+def PmlText(theItem, theLines):
+    theLines.append("\nSTEX |%s|" % theItem.Stext)
+# PmlText
+
+def PmlScom(theItem, theLines):
+    theLines.append("\n!!ce.Ptref = !aPtref")
+    theLines.append("\n!!ce.Gmref = !aGmref")
+
+    theLines.append("\nGTYP %s" % theItem.Gtype)
+    theLines.append("\nPARA %s" % theItem.Param)
+# PmlScom
+
+def PmlPtse(theItem, theLines):
+    theLines.append("\n!aCategory.Ptref = ce")
+    theLines.append("\n!aPtref = ce")
+# PmlPtse
+
+def PmlPtca(theItem, theLines):
+    theLines.append("\nNUMB %d" % theItem.Number)
+
+    PmlValue(theLines, "\nPCON %s", theItem.Connection)
+    PmlValue(theLines, "\nPBOR %s", theItem.Bore)
+    PmlValue(theLines, "\nPtcdirection %s", theItem.Direction)
+
+    PmlDesign(theLines, "PX", PmlExpression(theItem.Px))
+    PmlDesign(theLines, "PY", PmlExpression(theItem.Py))
+    PmlDesign(theLines, "PZ", PmlExpression(theItem.Pz))
+# PmlPtca
+
+def PmlPtax(theItem, theLines):
+    aPdis = PmlExpression(theItem.Distance)
+
+    theLines.append("\nNUMB %d" % theItem.Number)
+
+    PmlValue(theLines, "\nPCON %s", theItem.Connection)
+    PmlValue(theLines, "\nPBOR %s", theItem.Bore)
+    PmlDesign(theLines, "PDIS", aPdis)
+    PmlValue(theLines, "\nPAXI %s", theItem.Axis)
+# PmlPtax
+
+def PmlGmse(theItem, theLines):
+    theLines.append("\n!aCategory.Gmref = ce")
+    theLines.append("\n!aGmref = ce")
+# PmlGmse
+
+def PmlSbox(theItem, theLines):
+    theLines.append("\nTuflag True")
+
+    PmlValue(theLines, "\nPx (%s)", theItem.Px)
+    PmlValue(theLines, "\nPy (%s)", theItem.Py)
+    PmlValue(theLines, "\nPz (%s)", theItem.Pz)
+    PmlValue(theLines, "\nPxlength (%s)", theItem.Pxlength)
+    PmlValue(theLines, "\nPylength (%s)", theItem.Pylength)
+    PmlValue(theLines, "\nPzlength (%s)", theItem.Pzlength)
+# PmlSbox
+
+def PmlScyl(theItem, theLines):
+    theLines.append("\nTuflag True")
+
+    PmlValue(theLines, "\nPdistance (%s)", theItem.Distance)
+    PmlValue(theLines, "\nPdiameter (%s)", theItem.Diameter)
+    PmlValue(theLines, "\nPheight (%s)", theItem.Height)
+    PmlValue(theLines, "\nPaxis %s", theItem.Axis)
+# PmlScyl
+
+def PmlLsno(theItem, theLines):
+    theLines.append("\nTuflag True")
+
+    PmlParam(theLines, "Ptdistance", theItem.Tdistance)
+    PmlParam(theLines, "Pbdistance", theItem.Bdistance)
+    PmlParam(theLines, "Ptdiameter", theItem.Tdiameter)
+    PmlParam(theLines, "Pbdiameter", theItem.Bdiameter)
+    PmlParam(theLines, "Poffset", theItem.Offset)
+
+    PmlValue(theLines, "\nPaaxis %s", theItem.Aaxis)
+    PmlValue(theLines, "\nPbaxis %s", theItem.Baxis)
+# PmlLsno
+
+def PmlSdsh(theItem, theLines):
+    theLines.append("\nTuflag True")
+
+    PmlValue(theLines, "\nPaxis %s", theItem.Axis)
+
+    PmlParam(theLines, "Pdistance", theItem.Distance)
+    PmlParam(theLines, "Pheight", theItem.Height)
+    PmlParam(theLines, "Pradius", theItem.Radius)
+    PmlParam(theLines, "Pdiameter", theItem.Diameter)
+# PmlSdsh
+
+def PmlScto(theItem, theLines):
+    theLines.append("\nTuflag True")
+
+    PmlValue(theLines, "\nPaaxis %s", theItem.Aaxis)
+    PmlValue(theLines, "\nPbaxis %s", theItem.Baxis)
+
+    PmlParam(theLines, "Pdiameter", theItem.Diameter)
+# PmlScto
+
+# Type: (PML keyword, attribute writer, member types to export).
+PML_ELEMENTS = {
+    "CATA": ("CATALOGUE", PmlCata, ("SECT",)),
+    "SECT": ("SECTION", PmlCata, ("CATE",)),
+    "CATE": ("CATEGORY", PmlCate, ("SDTE", "TEXT", "PTSE", "GMSE", "SCOM")),
+    "SDTE": ("SDTEXT", PmlSdte, ()),
+    "TEXT": ("TEXT", PmlText, ()),
+    "SCOM": ("SCOMPONENT", PmlScom, ()),
+    "PTSE": ("PTSET", PmlPtse, ("PTCA", "PTAX")),
+    "PTCA": ("PTCAR", PmlPtca, ()),
+    "PTAX": ("PTAXIS", PmlPtax, ()),
+    "GMSE": ("GMSET", PmlGmse, ("SBOX", "SCYL", "LSNO", "SDSH", "SCTO")),
+    "SBOX": ("SBOX", PmlSbox, ()),
+    "SCYL": ("SCYLINDER", PmlScyl, ()),
+    "LSNO": ("LSNOUT", PmlLsno, ()),
+    "SDSH": ("SDSH", PmlSdsh, ()),
+    "SCTO": ("SCTORUS", PmlScto, ()),
+}
+
+# Type: attributes read by its writer, for copies of the host items.
+PML_ITEM_ATTRIBUTES = {
+    "CATA": ("Purpose",),
+    "SECT": ("Purpose",),
+    "CATE": ("Purpose", "Description", "Gtype"),
+    "SDTE": ("Skey", "Rtext", "Stext"),
+    "TEXT": ("Stext",),
+    "SCOM": ("Gtype", "Param"),
+    "PTSE": (),
+    "PTCA": ("Number", "Connection", "Bore", "Direction", "Px", "Py", "Pz"),
+    "PTAX": ("Distance", "Number", "Connection", "Bore", "Axis"),
+    "GMSE": (),
+    "SBOX": ("Px", "Py", "Pz", "Pxlength", "Pylength", "Pzlength"),
+    "SCYL": ("Distance", "Diameter", "Height", "Axis"),
+    "LSNO": ("Tdistance", "Bdistance", "Tdiameter", "Bdiameter", "Offset", "Aaxis", "Baxis"),
+    "SDSH": ("Axis", "Distance", "Height", "Radius", "Diameter"),
+    "SCTO": ("Aaxis", "Baxis", "Diameter"),
+}
+
+def PmlElement(theItem, theType, theLines):
+    # Write one element, return the member types to export.
+    aKeyword, aWriter, aMemberTypes = PML_ELEMENTS[theType]
+
+    aName = theItem.Name
+    if len(aName) > 0:
+        theLines.append("\nNEW %s /%s" % (aKeyword, aName))
+    else:
+        theLines.append("\nNEW %s" % aKeyword)
+    # if
+
+    aWriter(theItem, theLines)
+
+    return aMemberTypes
+# PmlElement
+
+def WritePml(theRoot, theWriter, theProgress = None, theState = None):
+    # Depth first walk in member order without recursion, returns the element count.
+    # theState (PmlDelta.PmlState) records the items for the next delta export.
+    aCount = 0
+    aStack = [(theRoot, theRoot.Type, None)]
+
+    while len(aStack) > 0:
+        aItem, aType, aOwner = aStack.pop()
+
+        if aType in PML_BOUNDARIES:
+            theWriter.Boundary()
+        # if
+
+        aLines = []
+        aMemberTypes = PmlElement(aItem, aType, aLines)
+        theWriter.write("".join(aLines))
+
+        aRefNo = None
+        if theState != None:
+            aRefNo = aItem.RefNo
+            theState.Add(aRefNo, aType, aItem.Name, aOwner, aLines)
+        # if
+
+        if len(aMemberTypes) > 0:
+            aMembers = []
+            for aMember in aItem.Member:
+                aMemberType = aMember.Type
+                if aMemberType in aMemberTypes:
+                    aMembers.append((aMember, aMemberType, aRefNo))
+                # if
+            # for
+            aMembers.reverse()
+            aStack.extend(aMembers)
+        # if
+
+        aCount += 1
+        if theProgress != None and aCount % PML_PROGRESS_STEP == 0:
+            theProgress(aCount)
+        # if
+    # while
+
+    return aCount
+# WritePml
+
+def PmlHeader():
+    aLines = []
+    aLines.append("$S-  -- Synonym translation OFF")
+    aLines.append("\n-- ----------------------------------------------------------------")
+    aLines.append("\n-- Data Listing    Date : " + time.asctime(time.localtime(time.time())))
+    aLines.append("\n-- Exported by PipeCAD.\n")
+
+    aLines.append("\nONERROR GOLABEL /ERROR3\n")
+    aLines.append("\nINPUT BEGIN")
+    return "".join(aLines)
+# PmlHeader
+
+def PmlFooter(theType):
+    aLines = []
+    aLines.append("\nINPUT END %s" % theType)
+    aLines.append("\nINPUT FINISH\n")
+
+    # Handle Exception.
+    aLines.append("\n-- Switch synonyms back on if an error occurs.")
+    aLines.append("\nLABEL /ERROR3")
+    aLines.append("\nhandle ANY")
+    aLines.append("\n$S+")
+    aLines.append("\nRETURN ERROR")
+    aLines.append("\nendhandle\n")
+
+    # PML Macro Footer.
+    aLines.append("\n-- End Data Listing    Date : " + time.asctime(time.localtime(time.time())))
+    aLines.append("\n$S+  -- Synonym translation ON")
+    aLines.append("\n-- ----------------------------------------------------------------")
+    aLines.append("\n")
+    return "".join(aLines)
+# PmlFooter
+
+class PmlPartWriter(object):
+    # File-like PML body writer. Once a part exceeds thePartSize, the next
+    # boundary element starts a new part file. Close() writes the macro:
+    # header, body and footer in one file, or an index macro running the parts.
+
+    def __init__(self, theFileName, thePartSize = PML_PART_SIZE):
+        self.fileName = theFileName
+        self.partSize = thePartSize
+        self.parts = []
+        self.file = None
+        self.size = 0
+        self.total = 0
+        self.NewPart()
+    # __init__
+
+    def PartName(self, theIndex):
+        aRoot, aExt = os.path.splitext(self.fileName)
+        return "%s_%03d%s" % (aRoot, theIndex, aExt or ".pml")
+    # PartName
+
+    def NewPart(self):
+        if self.file != None:
+            self.file.close()
+        # if
+
+        aPartName = self.PartName(len(self.parts) + 1)
+        self.parts.append(aPartName)
+        self.file = open(aPartName, "w", buffering=PML_BUFFER_SIZE)
+        self.size = 0
+    # NewPart
+
+    def write(self, theText):
+        self.file.write(theText)
+        self.size += len(theText)
+        self.total += len(theText)
+    # write
+
+    def Boundary(self):
+        if self.partSize > 0 and self.size >= self.partSize:
+            self.NewPart()
+        # if
+    # Boundary
+
+    def Close(self, theHeader, theFooter):
+        # Returns the written file names, the macro to run comes first.
+        self.file.close()
+
+        aTempName = self.fileName + ".tmp"
+        try:
+            with open(aTempName, "w", buffering=PML_BUFFER_SIZE) as aPmlFile:
+                aPmlFile.write(theHeader)
+                if len(self.parts) == 1:
+                    with open(self.parts[0], "r") as aPartFile:
+                        shutil.copyfileobj(aPartFile, aPmlFile, PML_BUFFER_SIZE)
+                    # with
+                else:
+                    for aPartName in self.parts:
+                        aPmlFile.write("\n$M /%s" % os.path.abspath(aPartName))
+                    # for
+                # if
+                aPmlFile.write(theFooter)
+            # with
+
+            os.replace(aTempName, self.fileName)
+        except:
+            if os.path.exists(aTempName):
+                os.remove(aTempName)
+            # if
+            raise
+        # try
+
+        if len(self.parts) == 1:
+            os.remove(self.parts[0])
+            return [self.fileName]
+        # if
+
+        return [self.fileName] + self.parts
+    # Close
+
+    def Discard(self):
+        self.file.close()
+        for aPartName in self.parts:
+            if os.path.exists(aPartName):
+                os.remove(aPartName)
+            # if
+        # for
+    # Discard
+# PmlPartWriter
@@ -22,6 +22,8 @@ from PythonQt.QtSql import *
 
 from lib.pipecad import *
 
+from pipecad.CatalogueDb import CatalogueRows, CatalogueHeadings
+
 
 class SpwlDialog(QDialog):
     def __init__(self, parent = None):
@@ -150,18 +152,7 @@ class CreateDialog(QDialog):
             aSpecItem = PipeCad.CurrentItem()
             aSpecItem.Purpose = aPurpose
             
-            aDatabase = QSqlDatabase.addDatabase("QSQLITE", "PipeStd_SPEC")
-            aDatabase.setDatabaseName("catalogues/PipeStd.db")
-            aDatabase.open()
-
-            self.queryModel = QSqlQueryModel()
-            self.queryModel.setQuery("SELECT type, name FROM HEAD WHERE purpose='" + aPurpose + "'", aDatabase)
-
-            for i in range(self.queryModel.rowCount()):
-                aRecord = self.queryModel.record(i)
-                aGtype = aRecord.value("type")
-                aType = aRecord.value("name")
-
+            for aGtype, aType in CatalogueRows("SELECT type, name FROM HEAD WHERE purpose=?", (aPurpose,)):
                 PipeCad.SetCurrentItem(aSpecItem)
                 PipeCad.CreateItem("SELE", aName + "/" + aGtype)
                 aSeleItem = PipeCad.CurrentItem()
@@ -355,20 +346,14 @@ class ModifyDialog(QDialog):
         # if
 
         # Set headings.
-        aDatabase = QSqlDatabase.addDatabase("QSQLITE", "PipeStd_SPEC")
-        aDatabase.setDatabaseName("catalogues/PipeStd.db")
-        aDatabase.open()
+        aPurpose = aSpecItem.Purpose
+        aHeadings = CatalogueHeadings()
 
         self.comboBoxHeadings.clear()
         for aSeleItem in aSpecItem.Member:
-            self.queryModel = QSqlQueryModel()
-            self.queryModel.setQuery("SELECT type, head FROM HEAD WHERE purpose='" + aSpecItem.Purpose + "' AND type='" + aSeleItem.Answer + "'", aDatabase)
-
-            if self.queryModel.rowCount() > 0:
-                aRecord = self.queryModel.record(0)
-                aType = aRecord.value("type")
-                aHead = aRecord.value("head")
-
+            aType = aSeleItem.Answer
+            aHead = aHeadings.get((aPurpose, aType))
+            if aHead is not None:
                 self.comboBoxHeadings.addItem(aType, aHead)
             # if
         # for
@@ -0,0 +1,416 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Table driven builder of standard catalogue components, no PythonQt dependency.
+# A standard is described by a spec in StandardBuilds: the fixed items of
+# the category (CATE or STCA with its SDTE, TEXT, point and geometry sets)
+# and the items built for every record of the standards table (SCOM, SPRF,
+# bolt sets). Names and attribute values are templates over the record
+# columns plus {category} and {description}:
+#
+#   "{DN} {C*0.5} TUB"   column values joined as text, a column may be scaled
+#   "={BN}"              the raw column value
+#   "@{category}-PTSE"   reference to the item of that name
+#
+# Existing items are found in one walk over the category before anything is
+# created, so a rebuild updates them in place without failing creates, and
+# everything is built in one transaction. The record columns are checked
+# against the spec first, and a build that fails midway deletes the items it
+# created and restores the ones it updated. A dry run only reports the plan.
+#
+#   python -m pipecad.StandardBuilder [-n 300] [--skey TEBW]
+# times the builder against per-item lookups on a HeadlessHost.
+
+import re
+import sys
+import time
+import argparse
+
+from pipecad.StandardBuilds import STANDARD_BUILDS
+
+STANDARD_FIELD = re.compile(r"\{(\w+)(?:\*([-+0-9.eE]+))?\}")
+
+
+def StandardFormat(theTemplate, theValues):
+    def aField(theMatch):
+        aValue = theValues[theMatch.group(1)]
+        if theMatch.group(2) is not None:
+            aValue = aValue * float(theMatch.group(2))
+        # if
+        return str(aValue)
+    # aField
+
+    return STANDARD_FIELD.sub(aField, theTemplate)
+# StandardFormat
+
+def StandardNames(theItem):
+    # Names of the existing items below theItem, one pass over the members.
+    aNames = dict()
+    aStack = [theItem]
+    while len(aStack) > 0:
+        aItem = aStack.pop()
+        aName = aItem.Name
+        if len(aName) > 0:
+            aNames[aName.lstrip("/")] = aItem
+        # if
+        aStack.extend(aItem.Member)
+    # while
+
+    return aNames
+# StandardNames
+
+class StandardReport(object):
+    def __init__(self, theSkey, theDryRun):
+        self.skey = theSkey
+        self.dryRun = theDryRun
+        self.rows = 0
+        self.created = 0
+        self.updated = 0
+        self.plan = []
+        self.seconds = 0.0
+    # __init__
+
+    def Summary(self):
+        aVerb = "Would build" if self.dryRun else "Built"
+        return "%s %s from %d rows: %d created, %d updated in %.2fs." % (aVerb, self.skey, self.rows, self.created, self.updated, self.seconds)
+    # Summary
+# StandardReport
+
+class StandardBuilder(object):
+    def __init__(self, theSkey, theHost = None):
+        self.skey = theSkey
+        self.spec = STANDARD_BUILDS[theSkey]
+        self.host = theHost
+    # __init__
+
+    def Value(self, theValue, theValues):
+        if not isinstance(theValue, str) or "{" not in theValue:
+            return theValue
+        elif theValue.startswith("@"):
+            aName = StandardFormat(theValue[1:], theValues)
+            aItem = self.names.get(aName)
+            return aItem if aItem is not None or self.report.dryRun else self.host.GetItem("/" + aName)
+        elif theValue.startswith("="):
+            return theValues[STANDARD_FIELD.match(theValue, 1).group(1)]
+        # if
+
+        return StandardFormat(theValue, theValues)
+    # Value
+
+    def Item(self, theSpec, theOwner, theNew, theValues):
+        aType, aName, aAttributes = theSpec[:3]
+        aName = StandardFormat(aName, theValues)
+
+        aItem = self.names.get(aName) if len(aName) > 0 else None
+        if aItem is None and len(aName) < 1 and not theNew:
+            # Unnamed members are only built with a new owner.
+            return None, False
+        # if
+
+        aNew = aItem is None
+        if aNew:
+            self.report.created += 1
+        else:
+            self.report.updated += 1
+        # if
+
+        if self.report.dryRun:
+            self.report.plan.append(("CREATE" if aNew else "UPDATE", aType, aName))
+            aItem = aItem or aName
+        else:
+            if aNew:
+                if self.current is not theOwner:
+                    self.host.SetCurrentItem(theOwner)
+                # if
+                self.host.CreateItem(aType, aName)
+                aItem = self.host.CurrentItem()
+                self.current = aItem
+                self.created.append(aItem)
+            # if
+
+            for aAttribute, aValue in aAttributes.items():
+                aValue = self.Value(aValue, theValues)
+                if not aNew:
+                    # Keep the old value to undo a failed build, and skip unchanged ones.
+                    try:
+                        aOldValue = getattr(aItem, aAttribute)
+                    except Exception as e:
+                        aOldValue = aValue
+                    else:
+                        if aOldValue == aValue:
+                            continue
+                        # if
+                        self.changed.append((aItem, aAttribute, aOldValue))
+                    # try
+                # if
+                setattr(aItem, aAttribute, aValue)
+            # for
+        # if
+
+        if len(aName) > 0:
+            self.names[aName] = aItem
+        # if
+
+        return aItem, aNew
+    # Item
+
+    def Tree(self, theSpec, theOwner, theNew, theValues):
+        aItem, aNew = self.Item(theSpec, theOwner, theNew, theValues)
+        if aItem is not None and len(theSpec) > 3:
+            for aMember in theSpec[3]:
+                self.Tree(aMember, aItem, aNew, theValues)
+            # for
+        # if
+
+        return aItem
+    # Tree
+
+    def Columns(self):
+        # Record columns the templates of the spec refer to.
+        aColumns = set()
+        aStack = list(self.spec["Items"]) + list(self.spec["Rows"])
+        while len(aStack) > 0:
+            aSpec = aStack.pop()
+            for aValue in [aSpec[1]] + list(aSpec[2].values()):
+                if isinstance(aValue, str):
+                    aColumns.update(aMatch.group(1) for aMatch in STANDARD_FIELD.finditer(aValue))
+                # if
+            # for
+            if len(aSpec) > 3:
+                aStack.extend(aSpec[3])
+            # if
+        # while
+
+        aColumns.difference_update(("category", "description"))
+        return aColumns
+    # Columns
+
+    def Undo(self):
+        # The host has no rollback: restore the updated attributes and delete
+        # the created items, a created owner takes its created members along.
+        for aItem, aAttribute, aValue in reversed(self.changed):
+            setattr(aItem, aAttribute, aValue)
+        # for
+
+        aCreated = set(id(aItem) for aItem in self.created)
+        for aItem in reversed(self.created):
+            if id(aItem.Owner) not in aCreated:
+                self.host.SetCurrentItem(aItem)
+                self.host.DeleteItem(aItem.Type)
+            # if
+        # for
+    # Undo
+
+    def Build(self, theColumns, theRows, theCategory, theDescription, theDryRun = False, theProgress = None):
+        """Build the standard from the records theRows with the column names theColumns."""
+
+        if self.host is None:
+            self.host = PipeCad
+        # if
+
+        # A spec naming a column the table lacks fails before anything is built.
+        aMissing = self.Columns().difference(theColumns)
+        if len(aMissing) > 0:
+            raise ValueError("Standard %s needs the columns %s" % (self.skey, ", ".join(sorted(aMissing))))
+        # if
+
+        self.report = StandardReport(self.skey, theDryRun)
+        aStartTime = time.perf_counter()
+
+        aValues = {"category": theCategory, "description": theDescription}
+        aRootSpec = self.spec["Items"][0]
+        aRoot = self.host.GetItem("/" + StandardFormat(aRootSpec[1], aValues))
+
+        self.names = dict() if aRoot is None else StandardNames(aRoot)
+        self.current = self.host.CurrentItem()
+        self.created = []
+        self.changed = []
+
+        if not theDryRun:
+            self.host.StartTransaction(self.spec.get("Transaction", "Build Standard %s Components" % self.skey))
+        # if
+
+        try:
+            aRoot = self.Tree(aRootSpec, self.current, True, aValues)
+
+            aRecords = []
+            for aRow in theRows:
+                aValues = dict(zip(theColumns, aRow))
+                aValues["category"] = theCategory
+                aValues["description"] = theDescription
+                aRecords.append(aValues)
+            # for
+
+            # One pass per row spec, so all bolt sets come before the components.
+            aBuilt = set()
+            aTotal = len(aRecords) * len(self.spec["Rows"])
+            for s, aSpec in enumerate(self.spec["Rows"]):
+                for r, aValues in enumerate(aRecords):
+                    aName = StandardFormat(aSpec[1], aValues)
+                    # Rows sharing a bolt set build it once.
+                    if aName not in aBuilt:
+                        aBuilt.add(aName)
+                        self.Item(aSpec, aRoot, False, aValues)
+                    # if
+
+                    if theProgress is not None:
+                        theProgress(s * len(aRecords) + r + 1, aTotal)
+                    # if
+                # for
+            # for
+
+            self.report.rows = len(aRecords)
+        except:
+            if not theDryRun:
+                self.Undo()
+            # if
+            raise
+        finally:
+            if not theDryRun:
+                self.host.CommitTransaction()
+            # if
+        # try
+
+        self.report.seconds = time.perf_counter() - aStartTime
+
+        return self.report
+    # Build
+# StandardBuilder
+
+def LegacyBuild(theHost, theSkey, theColumns, theRows, theCategory, theDescription):
+    # The access pattern of the per-standard build methods, for the benchmark:
+    # try to create each item and fall back on a lookup by name.
+    aSpec = STANDARD_BUILDS[theSkey]
+
+    def aCreate(theType, theName, theOwner):
+        theHost.SetCurrentItem(theOwner)
+        try:
+            theHost.CreateItem(theType, theName)
+            return theHost.CurrentItem(), True
+        except Exception as e:
+            theHost.SetCurrentItem("/" + theName)
+            return theHost.CurrentItem(), False
+        # try
+    # aCreate
+
+    def aValue(theValue, theValues):
+        if isinstance(theValue, str) and theValue.startswith("@"):
+            return theHost.GetItem("/" + StandardFormat(theValue[1:], theValues))
+        elif isinstance(theValue, str) and theValue.startswith("="):
+            return theValues[STANDARD_FIELD.match(theValue, 1).group(1)]
+        elif isinstance(theValue, str):
+            return StandardFormat(theValue, theValues)
+        # if
+        return theValue
+    # aValue
+
+    def aTree(theItemSpec, theOwner, theNew, theValues):
+        if len(theItemSpec[1]) < 1 and not theNew:
+            return
+        # if
+        aItem, aNew = aCreate(theItemSpec[0], StandardFormat(theItemSpec[1], theValues), theOwner)
+        for aAttribute, aAttributeValue in theItemSpec[2].items():
+            setattr(aItem, aAttribute, aValue(aAttributeValue, theValues))
+        # for
+        for aMember in (theItemSpec[3] if len(theItemSpec) > 3 else ()):
+            aTree(aMember, aItem, aNew, theValues)
+        # for
+        return aItem
+    # aTree
+
+    theHost.StartTransaction(aSpec.get("Transaction", ""))
+    aValues = {"category": theCategory, "description": theDescription}
+    aRoot = aTree(aSpec["Items"][0], theHost.CurrentItem(), True, aValues)
+    for aItemSpec in aSpec["Rows"]:
+        for aRow in theRows:
+            aValues = dict(zip(theColumns, aRow))
+            aValues["category"] = theCategory
+            aValues["description"] = theDescription
+            aTree(aItemSpec, aRoot, False, aValues)
+        # for
+    # for
+    theHost.CommitTransaction()
+# LegacyBuild
+
+def SampleRows(theSkey, theCount):
+    # Records with every column the spec uses, numbered so each row gets its own SCOM.
+    aColumns = []
+    for aSpec in STANDARD_BUILDS[theSkey]["Rows"]:
+        for aValue in [aSpec[1]] + list(aSpec[2].values()):
+            if isinstance(aValue, str):
+                for aMatch in STANDARD_FIELD.finditer(aValue):
+                    if aMatch.group(1) not in aColumns and aMatch.group(1) not in ("category", "description"):
+                        aColumns.append(aMatch.group(1))
+                    # if
+                # for
+            # if
+        # for
+    # for
+
+    aRows = []
+    for r in range(theCount):
+        aRows.append(tuple(("%s%05d" % (theSkey, r)) if aColumn == "ItemCode" else float(r % 40 + 1) for aColumn in aColumns))
+    # for
+
+    return aColumns, aRows
+# SampleRows
+
+def main(theArgs = None):
+    from pipecad.HeadlessHost import HeadlessHost
+
+    aParser = argparse.ArgumentParser(description="Time the table driven standard builder.")
+    aParser.add_argument("--skey", default="TEBW", help="standard to build (default: %(default)s)")
+    aParser.add_argument("-n", "--rows", type=int, default=300, help="records in the table")
+    aParser.add_argument("--dry-run", action="store_true", help="print the plan of a first build")
+    aArgs = aParser.parse_args(theArgs)
+
+    aColumns, aRows = SampleRows(aArgs.skey, aArgs.rows)
+    aCategory = "BENCH-" + aArgs.skey
+
+    if aArgs.dry_run:
+        aHost = HeadlessHost()
+        aReport = StandardBuilder(aArgs.skey, aHost).Build(aColumns, aRows, aCategory, "Benchmark", True)
+        for aAction, aType, aName in aReport.plan:
+            print("%-6s %s %s" % (aAction, aType, aName))
+        # for
+        print(aReport.Summary())
+        return 0
+    # if
+
+    for aName, aBuild in (("per-item", None), ("builder", StandardBuilder)):
+        aHost = HeadlessHost()
+        aSection = aHost.CreateItem("SECT", "BENCH")
+
+        aTimes = []
+        for aPass in ("create", "rebuild"):
+            aHost.SetCurrentItem(aSection)
+            aHost.calls = 0
+            aStartTime = time.perf_counter()
+            if aBuild is None:
+                LegacyBuild(aHost, aArgs.skey, aColumns, aRows, aCategory, "Benchmark")
+            else:
+                aBuild(aArgs.skey, aHost).Build(aColumns, aRows, aCategory, "Benchmark")
+            # if
+            aTimes.append("%s %.3fs %d host calls" % (aPass, time.perf_counter() - aStartTime, aHost.calls))
+        # for
+
+        print("%-8s %d items, %s" % (aName, len(aHost.items), ", ".join(aTimes)))
+    # for
+
+    return 0
+# main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1516 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Build specs of the standard components, see StandardBuilder.
+#
+#   "Transaction": name of the undo transaction, "Build Standard <SKEY>
+#                  Components" when not given.
+#   "Items":       (type, name, attributes, members) built once per category,
+#                  the first one is the category itself. Unnamed members are
+#                  only built with a new owner.
+#   "Rows":        (type, name, attributes) built for every record, owned by
+#                  the category, one spec after the other: the bolt sets of
+#                  all records come before the components. Items of the same
+#                  name are built once.
+#
+# Templates: "{COL}" column value as text, "{COL*f}" scaled, "={COL}" raw
+# value, "@name" reference to the item of that name. The category name and
+# description are {category} and {description}.
+
+STANDARD_BUILDS = dict()
+
+STANDARD_BUILDS["TUBE"] = {
+    "Transaction": "Build Standard Tube Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "TUBE", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "TUBE", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOM SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "PIPE O/D"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONN TYPE"}),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "TUBE", "Param": "{DN} {OD} TUB"}),
+    ),
+}
+
+STANDARD_BUILDS["ELBW"] = {
+    "Transaction": "Build Standard ELBW Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "ELBO", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "ELBW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "CENTRE TO FACE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "OUTSIDE DIAM"}),
+            ("TEXT", "{category}-PA5", {"Stext": "ANGLE"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2 * math.tan(PARAM5 * math.pi / 360)", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2 * math.tan(PARAM5 * math.pi / 360)", "Axis": "X PARAM5 Y"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCTO", "", {"Aaxis": "P1", "Baxis": "P2", "Diameter": "PARAM4"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "ELBO", "Param": "{DN} {A} {C} {D} {Angle}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["ELSW"] = {
+    "Transaction": "Build ELSW",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "ELBO", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "ELSW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "CENTRE TO BOTTOM OF SOCKET"}),
+            ("TEXT", "{category}-PA3", {"Stext": "INSERTION DEPTH"}),
+            ("TEXT", "{category}-PA4", {"Stext": "SOCKET OUTSIDE DIAM"}),
+            ("TEXT", "{category}-PA5", {"Stext": "BODY DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "ANGLE"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X PARAM7 Y"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCTO", "", {"Aaxis": "P1", "Baxis": "P2", "Diameter": "PARAM6"}),
+                ("SCYL", "", {"Axis": "P1", "Distance": "-0.4 * PARAM4", "Height": "1.4 * PARAM4", "Diameter": "PARAM5"}),
+                ("SCYL", "", {"Axis": "P2", "Distance": "-0.4 * PARAM4", "Height": "1.4 * PARAM4", "Diameter": "PARAM5"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "ELBO", "Param": "{DN} {A} {CT} {B} {C} {D} {Angle}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["TEBW"] = {
+    "Transaction": "Build Standard TEBW Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "TEE", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "TEBW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL RUN SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "NOMINAL BRANCH SIZE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "RUN CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "BRANCH CONN TYPE"}),
+            ("TEXT", "{category}-PA5", {"Stext": "CENTRE TO RUN END"}),
+            ("TEXT", "{category}-PA6", {"Stext": "CENTRE TO BRANCH END"}),
+            ("TEXT", "{category}-PA7", {"Stext": "RUN OUTSIDE DIAM"}),
+            ("TEXT", "{category}-PA8", {"Stext": "BRANCH OUTSIDE DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM5", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM5", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "PARAM4", "Bore": "PARAM2", "Distance": "PARAM6", "Axis": "Z"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "Z", "Distance": "0", "Height": "PARAM6", "Diameter": "PARAM8"}),
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-2 * PARAM5", "Diameter": "PARAM7"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "TEE", "Param": "{N1} {N2} {C1} {C2} {L1} {L2} {D1} {D2}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["TESW"] = {
+    "Transaction": "Build Standard TESW Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "TEE", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "TESW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL RUN SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "NOMINAL BRANCH SIZE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "HALF RUN LAY LENGTH"}),
+            ("TEXT", "{category}-PA5", {"Stext": "BRANCH LAY LENGTH"}),
+            ("TEXT", "{category}-PA6", {"Stext": "BODY OUTSIDE DIAM"}),
+            ("TEXT", "{category}-PA7", {"Stext": "INSERTION DEPTH"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM4", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM4", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "PARAM3", "Bore": "PARAM2", "Distance": "PARAM4", "Axis": "Z"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P3", "Distance": "PARAM7", "Height": "(PARAM7 + PARAM4) * -1", "Diameter": "PARAM6"}),
+                ("SCYL", "", {"Axis": "-X", "Distance": "-1 * (PARAM4 + PARAM7)", "Height": "2 * (PARAM4 + PARAM7)", "Diameter": "PARAM6"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "TEE", "Param": "{N1} {N2} {CT} {L1} {L2} {BD} {LD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["FLWN"] = {
+    "Transaction": "Build Standard FLWN Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "FLAN", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "FLWN", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "OVERALL LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "FACE CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "TUBE CONN TYPE"}),
+            ("TEXT", "{category}-PA5", {"Stext": "FLANGE THICKNESS"}),
+            ("TEXT", "{category}-PA6", {"Stext": "HUB SMALL DIAM"}),
+            ("TEXT", "{category}-PA7", {"Stext": "FLANGE DIAM"}),
+            ("TEXT", "{category}-PA8", {"Stext": "HUB LARGE DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM4", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-PARAM5", "Diameter": "PARAM7"}),
+                ("LSNO", "", {"Aaxis": "X", "Baxis": "Z", "Tdistance": "PARAM2", "Bdistance": "PARAM5", "Tdiameter": "PARAM6", "Bdiameter": "PARAM8", "Offset": "0"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("BTSE", "{category}-{BN}-{BD}", {"Btype": "BOLT", "Noff": "={BN}", "Bdiameter": "{BD}", "Bthickness": "PARAM5"}),
+        ("SCOM", "{ItemCode}", {"Gtype": "FLAN", "Param": "{DN} {OL} {FC} {PC} {FT} {PD} {FD} {HD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE", "Blref": "@{category}-{BN}-{BD}"}),
+    ),
+}
+
+STANDARD_BUILDS["FLSW"] = {
+    "Transaction": "Build Standard FLSW Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "FLAN", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "FLSW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "FACE CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "TUBE CONN TYPE"}),
+            ("TEXT", "{category}-PA5", {"Stext": "FLANGE DIAMETER"}),
+            ("TEXT", "{category}-PA6", {"Stext": "OVERALL THICKNESS"}),
+            ("TEXT", "{category}-PA7", {"Stext": "FLANGE THICKNESS"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM4", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "X", "Distance": "0", "Height": "PARAM7", "Diameter": "PARAM5"}),
+                ("SCYL", "", {"Axis": "X", "Distance": "0", "Height": "PARAM6", "Diameter": "PARAM5 * 0.65"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("BTSE", "{category}-{BN}-{BD}", {"Btype": "BOLT", "Noff": "={BN}", "Bdiameter": "{BD}", "Bthickness": "PARAM7"}),
+        ("SCOM", "{ItemCode}", {"Gtype": "FLAN", "Param": "{DN} {TL} {FC} {PC} {FD} {TA} {FT}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE", "Blref": "@{category}-{BN}-{BD}"}),
+    ),
+}
+
+STANDARD_BUILDS["FLSO"] = {
+    "Transaction": "Build Standard FLSO Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "FLAN", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "FLSO", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "FACE CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "TUBE CONN TYPE"}),
+            ("TEXT", "{category}-PA5", {"Stext": "FLANGE DIAMETER"}),
+            ("TEXT", "{category}-PA6", {"Stext": "OVERALL THICKNESS"}),
+            ("TEXT", "{category}-PA7", {"Stext": "FLANGE THICKNESS"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM4", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "X", "Distance": "0", "Height": "PARAM7", "Diameter": "PARAM5"}),
+                ("SCYL", "", {"Axis": "X", "Distance": "0", "Height": "PARAM6", "Diameter": "(PARAM1 + 15) * 1.075"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("BTSE", "{category}-{BN}-{BD}", {"Btype": "BOLT", "Noff": "={BN}", "Bdiameter": "{BD}", "Bthickness": "PARAM7"}),
+        ("SCOM", "{ItemCode}", {"Gtype": "FLAN", "Param": "{DN} {DA} {FC} {PC} {DD} {DB} {DC}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE", "Blref": "@{category}-{BN}-{BD}"}),
+    ),
+}
+
+STANDARD_BUILDS["VTFL"] = {
+    "Transaction": "Build Standard VTFL Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "VTFL", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "HALF FACE TO FACE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "HANDWHEEL HEIGHT"}),
+            ("TEXT", "{category}-PA5", {"Stext": "HANDWHEEL DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "FLANGE OUTSIDE DIAM"}),
+            ("TEXT", "{category}-PA7", {"Stext": "FLANGE THICKNESS"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "", "Bore": "", "Distance": "PARAM4", "Axis": "Z"}),
+                ("PTCA", "{category}-P4", {"Number": 4, "Connection": "", "Bore": "", "Px": "PARAM5 * 0.5", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+                ("PTCA", "{category}-P5", {"Number": 5, "Connection": "", "Bore": "", "Px": "PARAM5 * -0.5", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+                ("PTCA", "{category}-P6", {"Number": 6, "Connection": "", "Bore": "", "Px": "0", "Py": "0", "Pz": "PARAM4", "Direction": "-X"}),
+                ("PTCA", "{category}-P7", {"Number": 7, "Connection": "", "Bore": "", "Px": "0", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-PARAM7", "Diameter": "PARAM6"}),
+                ("SCYL", "", {"Axis": "P2", "Distance": "0", "Height": "-PARAM7", "Diameter": "PARAM6"}),
+                ("SCYL", "", {"Axis": "Z", "Distance": "0", "Height": "0.3 * PARAM4", "Diameter": "PARAM2"}),
+                ("SCYL", "", {"Axis": "P1", "Distance": "-PARAM7", "Height": "(PARAM2 - PARAM7) * -2", "Diameter": "PARAM6 * 0.6"}),
+                ("SCYL", "", {"Axis": "Z", "Distance": "0", "Height": "PARAM4", "Diameter": "PARAM7"}),
+                ("SCYL", "", {"Axis": "P6", "Distance": "-0.5 * PARAM5", "Height": "PARAM5", "Diameter": "PARAM7 * 0.3"}),
+                ("SCYL", "", {"Axis": "P7", "Distance": "-0.5 * PARAM5", "Height": "PARAM5", "Diameter": "PARAM7 * 0.3"}),
+                ("SBOX", "", {"Px": "0", "Py": "0", "Pz": "0.35 * PARAM4", "Pxlength": "PARAM2 * 1.3", "Pylength": "PARAM2 * 1.3", "Pzlength": "PARAM7 * 3"}),
+                ("SBOX", "", {"Px": "0", "Py": "0", "Pz": "0.6 * PARAM4", "Pxlength": "PARAM2 * 0.5", "Pylength": "PARAM2 * 1", "Pzlength": "PARAM4 * 0.5"}),
+                ("SDSH", "", {"Axis": "-Z", "Diameter": "1.3 * PARAM2", "Height": "0.5 * PARAM6", "Radius": "PARAM2", "Distance": "0"}),
+                ("SCTO", "", {"Aaxis": "P4", "Baxis": "P5", "Diameter": "PARAM7 * 0.5"}),
+                ("SCTO", "", {"Aaxis": "-P4", "Baxis": "-P5", "Diameter": "PARAM7 * 0.5"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("BTSE", "{category}-{BN}-{BD}", {"Btype": "BOLT", "Noff": "={BN}", "Bdiameter": "{BD}", "Bthickness": "PARAM7"}),
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {C*0.5} {FC} {H} {D} {A} {B}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE", "Blref": "@{category}-{BN}-{BD}"}),
+    ),
+}
+
+STANDARD_BUILDS["VTBW"] = {
+    "Transaction": "Build BW GATE Valve",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "VTBW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "HALF FACE TO FACE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "HANDLE HEIGHT"}),
+            ("TEXT", "{category}-PA5", {"Stext": "HANDLE DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "BODY DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Distance": "PARAM4", "Axis": "Z"}),
+                ("PTCA", "{category}-P4", {"Number": 4, "Connection": "NULL", "Bore": "0", "Px": "PARAM5 * 0.5", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+                ("PTCA", "{category}-P5", {"Number": 5, "Connection": "NULL", "Bore": "0", "Px": "PARAM5 * -0.5", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+                ("PTCA", "{category}-P6", {"Number": 6, "Connection": "NULL", "Bore": "0", "Px": "0", "Py": "0", "Pz": "PARAM4", "Direction": "-X"}),
+                ("PTCA", "{category}-P7", {"Number": 7, "Connection": "NULL", "Bore": "0", "Px": "0", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-2 * PARAM2", "Diameter": "PARAM6"}),
+                ("SCYL", "", {"Axis": "Z", "Distance": "0", "Height": "0.3 * PARAM4", "Diameter": "0.6 * PARAM5"}),
+                ("SCYL", "", {"Axis": "P3", "Distance": "0", "Height": "-0.5 * PARAM4", "Diameter": "0.35 * PARAM6"}),
+                ("SBOX", "", {"Pxlength": "PARAM2 * 1.6", "Pylength": "PARAM6", "Pzlength": "PARAM6 * 2.5", "Px": "0", "Py": "0", "Pz": "0.35 * PARAM4"}),
+                ("SBOX", "", {"Pxlength": "PARAM2 * 0.5", "Pylength": "PARAM6 * 0.7", "Pzlength": "PARAM4 * 0.5", "Px": "0", "Py": "0", "Pz": "0.6 * PARAM4"}),
+                ("SDSH", "", {"Axis": "-Z", "Diameter": "0.6 * PARAM5", "Height": "0.65 * PARAM6", "Radius": "0", "Distance": "0"}),
+                ("SCTO", "", {"Aaxis": "P4", "Baxis": "P5", "Diameter": "25"}),
+                ("SCTO", "", {"Aaxis": "-P4", "Baxis": "-P5", "Diameter": "25"}),
+                ("SCYL", "", {"Axis": "P6", "Distance": "-0.5 * PARAM5", "Height": "PARAM5", "Diameter": "20"}),
+                ("SCYL", "", {"Axis": "P7", "Distance": "-0.5 * PARAM5", "Height": "PARAM5", "Diameter": "20"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {LL} {CT} {HH} {HD} {BD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["VGFL"] = {
+    "Transaction": "Build Standard VGFL Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "VGFL", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "HALF FACE TO FACE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "HANDWHEEL HEIGHT"}),
+            ("TEXT", "{category}-PA5", {"Stext": "HANDWHEEL DIAMETER"}),
+            ("TEXT", "{category}-PA6", {"Stext": "FLANGE THICKNESS"}),
+            ("TEXT", "{category}-PA7", {"Stext": "FLANGE OUTSIDE DIAMETER"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "", "Bore": "", "Distance": "PARAM4", "Axis": "Z"}),
+                ("PTCA", "{category}-P4", {"Number": 4, "Connection": "", "Bore": "", "Px": "PARAM5 * 0.5", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+                ("PTCA", "{category}-P5", {"Number": 5, "Connection": "", "Bore": "", "Px": "PARAM5 * -0.5", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+                ("PTCA", "{category}-P6", {"Number": 6, "Connection": "", "Bore": "", "Px": "0", "Py": "0", "Pz": "PARAM4", "Direction": "-X"}),
+                ("PTCA", "{category}-P7", {"Number": 7, "Connection": "", "Bore": "", "Px": "0", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "-P1", "Distance": "0", "Height": "PARAM6", "Diameter": "PARAM7"}),
+                ("SCYL", "", {"Axis": "-P2", "Distance": "0", "Height": "PARAM6", "Diameter": "PARAM7"}),
+                ("SCYL", "", {"Axis": "-P1", "Distance": "0", "Height": "PARAM2 * 2", "Diameter": "PARAM7 * 0.7"}),
+                ("LSNO", "", {"Aaxis": "Z", "Baxis": "Y", "Tdistance": "PARAM4 * 0.8", "Bdistance": "0", "Tdiameter": "PARAM5 * 0.15", "Bdiameter": "PARAM2 * 1.25", "Offset": "0"}),
+                ("SDSH", "", {"Axis": "-Z", "Diameter": "1.25 * PARAM2", "Height": "0.5 * PARAM7", "Radius": "0.5 * PARAM2", "Distance": "0"}),
+                ("SCYL", "", {"Axis": "Z", "Distance": "0.5 * PARAM7", "Height": "1.3 * PARAM6", "Diameter": "PARAM2 * 1.4"}),
+                ("SCYL", "", {"Axis": "P3", "Distance": "0", "Height": "PARAM4 * -0.2", "Diameter": "PARAM5 * 0.1"}),
+                ("SCTO", "", {"Aaxis": "P4", "Baxis": "P5", "Diameter": "PARAM5 * 0.075"}),
+                ("SCTO", "", {"Aaxis": "-P4", "Baxis": "-P5", "Diameter": "PARAM5 * 0.075"}),
+                ("SCYL", "", {"Axis": "P6", "Distance": "PARAM5 * -0.5", "Height": "PARAM5", "Diameter": "PARAM5 * 0.05"}),
+                ("SCYL", "", {"Axis": "P7", "Distance": "PARAM5 * -0.5", "Height": "PARAM5", "Diameter": "PARAM5 * 0.05"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("BTSE", "{category}-{BN}-{BD}", {"Btype": "BOLT", "Noff": "={BN}", "Bdiameter": "{BD}", "Bthickness": "PARAM6"}),
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {C} {FC} {H} {D} {B} {A}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE", "Blref": "@{category}-{BN}-{BD}"}),
+    ),
+}
+
+STANDARD_BUILDS["VGBW"] = {
+    "Transaction": "Build Butt Weld Globe VALVE",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "VGBW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "HALF LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "HANDWHEEL HEIGHT"}),
+            ("TEXT", "{category}-PA5", {"Stext": "HANDWHEEL DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "BODY DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Distance": "PARAM4", "Axis": "Z"}),
+                ("PTCA", "{category}-P4", {"Number": 4, "Connection": "NULL", "Bore": "0", "Direction": "Y", "Px": "0.5 * PARAM5", "Py": "0", "Pz": "PARAM4"}),
+                ("PTCA", "{category}-P5", {"Number": 5, "Connection": "NULL", "Bore": "0", "Direction": "Y", "Px": "-0.5 * PARAM5", "Py": "0", "Pz": "PARAM4"}),
+                ("PTCA", "{category}-P6", {"Number": 6, "Connection": "NULL", "Bore": "0", "Direction": "-X", "Px": "0", "Py": "0", "Pz": "PARAM4"}),
+                ("PTCA", "{category}-P7", {"Number": 7, "Connection": "NULL", "Bore": "0", "Direction": "Y", "Px": "0", "Py": "0", "Pz": "PARAM4"}),
+                ("PTCA", "{category}-P8", {"Number": 8, "Connection": "NULL", "Bore": "0", "Direction": "Y", "Px": "0", "Py": "0", "Pz": "0"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P3", "Distance": "0", "Height": "-0.05 * PARAM5", "Diameter": "PARAM5"}),
+                ("LSNO", "", {"Aaxis": "X", "Baxis": "Z", "Tdistance": "PARAM2", "Bdistance": "0", "Tdiameter": "PARAM1 + 10", "Bdiameter": "PARAM1 + 30", "Offset": "0"}),
+                ("LSNO", "", {"Aaxis": "-X", "Baxis": "Z", "Tdistance": "PARAM2", "Bdistance": "0", "Tdiameter": "PARAM1 + 10", "Bdiameter": "PARAM1 + 30", "Offset": "0"}),
+                ("LSNO", "", {"Aaxis": "Z", "Baxis": "X", "Tdistance": "0.8 * PARAM4", "Bdistance": "0", "Tdiameter": "PARAM1 * 0.5", "Bdiameter": "PARAM6", "Offset": "0"}),
+                ("SCYL", "", {"Axis": "Z", "Distance": "0", "Height": "PARAM4", "Diameter": "0.5 * PARAM1"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {LL} {CT} {HH} {HD} {BD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["VGSW"] = {
+    "Transaction": "Build SW GLOBE Valve",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "VGSW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "HALF LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "HANDLE HEIGHT"}),
+            ("TEXT", "{category}-PA5", {"Stext": "HANDLE DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "INSERTION DEPTH"}),
+            ("TEXT", "{category}-PA7", {"Stext": "BODY DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Distance": "PARAM4", "Axis": "Z"}),
+                ("PTMI", "{category}-P4", {"Number": 4, "Connection": "NULL", "Bore": "0", "Px": "0", "Py": "0", "Pz": "PARAM4", "Axis": "X DDANGLE Y"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P3", "Distance": "0", "Height": "-0.05 * PARAM5", "Diameter": "PARAM5"}),
+                ("LSNO", "", {"Aaxis": "X", "Baxis": "Z", "Tdistance": "PARAM2 + PARAM6", "Bdistance": "0", "Tdiameter": "PARAM1 + 10", "Bdiameter": "PARAM1 * 3", "Offset": "0"}),
+                ("LSNO", "", {"Aaxis": "-X", "Baxis": "Z", "Tdistance": "PARAM2 + PARAM6", "Bdistance": "0", "Tdiameter": "PARAM1 + 10", "Bdiameter": "PARAM1 * 3", "Offset": "0"}),
+                ("LSNO", "", {"Aaxis": "Z", "Baxis": "X", "Tdistance": "PARAM4 * 0.8", "Bdistance": "0", "Tdiameter": "PARAM1 * 0.5", "Bdiameter": "PARAM1 * 2", "Offset": "0"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {LL} {CT} {HH} {HD} {LD} {BD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["CVFL"] = {
+    "Transaction": "Build Standard CVFL Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "CVFL", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "HALF FACE TO FACE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "FLANGE THICKNESS"}),
+            ("TEXT", "{category}-PA5", {"Stext": "FLANGE DIAMETER"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "", "Bore": "", "Distance": "DDHEIGHT", "Axis": "Z"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-PARAM4", "Diameter": "PARAM5"}),
+                ("SCYL", "", {"Axis": "P2", "Distance": "0", "Height": "-PARAM4", "Diameter": "PARAM5"}),
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "PARAM2 * -2", "Diameter": "PARAM5 * 0.7"}),
+                ("LSNO", "", {"Aaxis": "Z", "Baxis": "X", "Tdistance": "PARAM5", "Bdistance": "0", "Tdiameter": "DDRADIUS * 0.3", "Bdiameter": "PARAM5 * 0.6", "Offset": "0"}),
+                ("LSNO", "", {"Aaxis": "Z", "Baxis": "X", "Tdistance": "PARAM5 * 0.4", "Bdistance": "PARAM5 * -0.4", "Tdiameter": "PARAM5 * 0.9", "Bdiameter": "PARAM5 * 0.2", "Offset": "0"}),
+                ("LSNO", "", {"Aaxis": "P3", "Baxis": "X", "Tdistance": "DDHEIGHT * -0.05", "Bdistance": "DDHEIGHT * -0.1", "Tdiameter": "DDRADIUS", "Bdiameter": "DDRADIUS * 0.5", "Offset": "0"}),
+                ("LCYL", "", {"Axis": "Z", "Bdistance": "PARAM5 * 0.4", "Tdistance": "PARAM5 * 0.6", "Diameter": "PARAM5 * 0.9"}),
+                ("LCYL", "", {"Axis": "P3", "Bdistance": "PARAM5 - DDHEIGHT", "Tdistance": "-0.1 * DDHEIGHT", "Diameter": "0.5 * DDRADIUS"}),
+                ("SDSH", "", {"Axis": "P3", "Diameter": "DDRADIUS", "Height": "DDHEIGHT * 0.1", "Radius": "DDRADIUS * 0.3", "Distance": "DDHEIGHT * -0.05"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("BTSE", "{category}-{BN}-{BD}", {"Btype": "BOLT", "Noff": "={BN}", "Bdiameter": "{BD}", "Bthickness": "PARAM4"}),
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {A} {FC} {B} {C}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE", "Blref": "@{category}-{BN}-{BD}"}),
+    ),
+}
+
+STANDARD_BUILDS["VTSW"] = {
+    "Transaction": "Build Standard VTSW Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "VTSW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "HALF LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "HANDWHEEL HEIGHT"}),
+            ("TEXT", "{category}-PA5", {"Stext": "HANDWHEEL DIAMETER"}),
+            ("TEXT", "{category}-PA6", {"Stext": "SOCKET DEPTH"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "", "Bore": "", "Distance": "PARAM4", "Axis": "Z"}),
+                ("PTCA", "{category}-P4", {"Number": 4, "Connection": "", "Bore": "", "Px": "PARAM5 * 0.5", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+                ("PTCA", "{category}-P5", {"Number": 5, "Connection": "", "Bore": "", "Px": "PARAM5 * -0.5", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+                ("PTCA", "{category}-P6", {"Number": 6, "Connection": "", "Bore": "", "Px": "0", "Py": "0", "Pz": "PARAM4", "Direction": "-Y"}),
+                ("PTCA", "{category}-P7", {"Number": 7, "Connection": "", "Bore": "", "Px": "0", "Py": "0", "Pz": "PARAM4", "Direction": "X"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "PARAM6", "Height": "-2 * (PARAM2 + PARAM6)", "Diameter": "PARAM1 + 30"}),
+                ("SCYL", "", {"Axis": "P3", "Distance": "0", "Height": "-2 * (PARAM2 + PARAM6)", "Diameter": "PARAM5 * 0.1"}),
+                ("SCTO", "", {"Aaxis": "P4", "Baxis": "P5", "Diameter": "PARAM5 * 0.1"}),
+                ("SCTO", "", {"Aaxis": "-P4", "Baxis": "-P5", "Diameter": "PARAM5 * 0.1"}),
+                ("SCYL", "", {"Axis": "P6", "Distance": "PARAM5 * -0.5", "Height": "PARAM5", "Diameter": "PARAM5 * 0.075"}),
+                ("SCYL", "", {"Axis": "P7", "Distance": "PARAM5 * -0.5", "Height": "PARAM5", "Diameter": "PARAM5 * 0.075"}),
+                ("SBOX", "", {"Px": "0", "Py": "0", "Pz": "0.3 * PARAM4", "Pxlength": "PARAM2 * 0.7", "Pylength": "PARAM1 * 2", "Pzlength": "PARAM4"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {A} {CT} {H} {D} {B}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["VYFL"] = {
+    "Transaction": "Build BUFFERFLY VALVE",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "VYFL", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "HANDWHEEL HEIGHT"}),
+            ("TEXT", "{category}-PA5", {"Stext": "GEARBOX OFFSET"}),
+            ("TEXT", "{category}-PA6", {"Stext": "FLANGE DIAMETER"}),
+            ("TEXT", "{category}-PA7", {"Stext": "HANDWHEEL LENGTH"}),
+            ("TEXT", "{category}-PA8", {"Stext": "HANDWHEEL DIAMETER"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTCA", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Px": "-1.0 * PARAM5", "Py": "0", "Pz": "PARAM4", "Direction": "Y"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "X", "Distance": "-1.0  * PARAM2", "Height": "2.0 * PARAM2", "Diameter": "PARAM6"}),
+                ("SCYL", "", {"Axis": "P3", "Distance": "PARAM7", "Height": "-0.05 * PARAM8", "Diameter": "PARAM8"}),
+                ("SCYL", "", {"Axis": "P3", "Distance": "0", "Height": "PARAM7", "Diameter": "0.2 * PARAM8"}),
+                ("SBOX", "", {"Pxlength": "2.0 * (PARAM2 + PARAM5)", "Pylength": "PARAM5 * 2", "Pzlength": "PARAM5", "Px": "-1 * PARAM2", "Py": "0", "Pz": "PARAM4"}),
+                ("LCYL", "", {"Axis": "Z", "Bdistance": "PARAM6 * -0.6", "Tdistance": "PARAM4", "Diameter": "PARAM2 * 1.5"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {LL} {CT} {HH} {GO} {FD} {HL} {HD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["GASK"] = {
+    "Transaction": "Build GASKET Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "GASK", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "GASK", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "COMPRESSED THICKNESS"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONNECTION TYPE ARRIVE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "CONNECTION TYPE LEAVE"}),
+            ("TEXT", "{category}-PA5", {"Stext": "OUTSIDE DIAMETER"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM4", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-PARAM2", "Diameter": "PARAM5"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "GASK", "Param": "{DN} {TK} {CA} {CL} {DM}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["REBW"] = {
+    "Transaction": "Build REBW Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "REDU", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "REBW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL LARGE SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "NOMINAL REDUCED SIZE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "OVERALL LENGTH"}),
+            ("TEXT", "{category}-PA5", {"Stext": "LARGE OUTSIDE DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "REDUCED OUTSIDE DIAM"}),
+            ("TEXT", "{category}-PA7", {"Stext": "OFFSET"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTCA", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM2", "Direction": "X", "Px": "PARAM4", "Py": "0", "Pz": "-PARAM7"}),
+                ("PTCA", "{category}-P3", {"Number": 3, "Connection": "", "Bore": "", "Direction": "-Z", "Px": "PARAM4", "Py": "0", "Pz": "-PARAM7"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("LSNO", "", {"Aaxis": "X", "Baxis": "-Z", "Tdistance": "PARAM4", "Bdistance": "0", "Tdiameter": "PARAM6", "Bdiameter": "PARAM5", "Offset": "PARAM7"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "REDU", "Param": "{NA} {NB} BWD {L} {A} {B} {F}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["RCBW"] = {
+    "Transaction": "Build RCBW Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "REDU", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "RCBW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL LARGE SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "NOMINAL REDUCED SIZE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "OVERALL LENGTH"}),
+            ("TEXT", "{category}-PA5", {"Stext": "LARGE OUTSIDE DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "REDUCED OUTSIDE DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM2", "Distance": "PARAM4", "Axis": "X"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("LSNO", "", {"Aaxis": "X", "Baxis": "-Z", "Tdistance": "PARAM4", "Bdistance": "0", "Tdiameter": "PARAM6", "Bdiameter": "PARAM5", "Offset": "0"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "REDU", "Param": "{NA} {NB} BWD {L} {A} {B}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["ESBW"] = {
+    "Transaction": "Build ESBW Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "REDU", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "ESBW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL LARGE SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "NOMINAL SMALL SIZE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "OVERALL LENGTH"}),
+            ("TEXT", "{category}-PA5", {"Stext": "OFFSET"}),
+            ("TEXT", "{category}-PA6", {"Stext": "LARGE OUTSIDE DIAM"}),
+            ("TEXT", "{category}-PA7", {"Stext": "SMALL OUTSIDE DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTCA", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM2", "Direction": "X", "Px": "PARAM4", "Py": "0", "Pz": "-PARAM5"}),
+                ("PTCA", "{category}-P3", {"Number": 3, "Connection": "", "Bore": "", "Direction": "-Z", "Px": "PARAM4", "Py": "0", "Pz": "-PARAM5"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-0.6 * PARAM4", "Diameter": "PARAM6"}),
+                ("SCYL", "", {"Axis": "P2", "Distance": "0", "Height": "-0.2 * PARAM4", "Diameter": "PARAM7"}),
+                ("LSNO", "", {"Aaxis": "X", "Baxis": "-Z", "Tdistance": "PARAM4 * 0.8", "Bdistance": "PARAM4 * 0.6", "Tdiameter": "PARAM7", "Bdiameter": "PARAM6", "Offset": "PARAM5"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "REDU", "Param": "{N1} {N2} {CT} {LT} {LO} {D1} {D2}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["KABW"] = {
+    "Transaction": "Build KABW Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "CAP", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "KABW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL LARGE SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "OVERALL LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "MAIN CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "OUTLET CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA5", {"Stext": "DIAMETER"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM4", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-0.5 * PARAM2", "Diameter": "PARAM5"}),
+                ("SDSH", "", {"Axis": "P2", "Diameter": "PARAM5", "Height": "0.5 * PARAM2", "Radius": "0.3 * PARAM1", "Distance": "-0.5 * PARAM2"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "CAP", "Param": "{DN} {A} BWD CLOS {B}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["NZFL"] = {
+    "Transaction": "Build Standard NZFL Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "NOZZ", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "NZFL", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "FACE CONN TYPE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "FLANGE DIAM"}),
+            ("TEXT", "{category}-PA4", {"Stext": "FLANGE THICKNESS"}),
+            ("TEXT", "{category}-PA5", {"Stext": "TUBE OUTSIDE DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM2", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "", "Bore": "", "Distance": "DDHEIGHT", "Axis": "X"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "X", "Distance": "0", "Height": "PARAM4", "Diameter": "PARAM3"}),
+                ("SCYL", "", {"Axis": "X", "Distance": "0", "Height": "DDHEIGHT", "Diameter": "PARAM5"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "NOZZ", "Param": "{DN} {FC} {FD} {FT} {TD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["NZBW"] = {
+    "Transaction": "Build Standard NZBW Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "NOZZ", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "NZBW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "OUTSIDE DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM2", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "NULL", "Bore": "0", "Distance": "DDHEIGHT", "Axis": "X"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "X", "Distance": "0", "Height": "DDHEIGHT", "Diameter": "PARAM3"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "NOZZ", "Param": "{DN} {CT} {OD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["SEIM"] = {
+    "Transaction": "Build SEI Man Hole",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "NOZZ", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "MANH", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "FACE CONN TYPE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "FLANGE DIAM"}),
+            ("TEXT", "{category}-PA4", {"Stext": "FLANGE THICKNESS"}),
+            ("TEXT", "{category}-PA5", {"Stext": "TUBE OUTSIDE DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM2", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "NULL", "Bore": "0", "Distance": "DDHEIGHT", "Axis": "X"}),
+                ("PTCA", "{category}-P3", {"Number": 3, "Connection": "0", "Bore": "0", "Px": "0", "Py": "PARAM3 * 0.5", "Pz": "0", "Direction": "Z"}),
+                ("PTCA", "{category}-P4", {"Number": 4, "Connection": "0", "Bore": "0", "Px": "PARAM4 * -1", "Py": "PARAM3 * -0.35", "Pz": "50", "Direction": "X"}),
+                ("PTCA", "{category}-P5", {"Number": 5, "Connection": "0", "Bore": "0", "Px": "PARAM4 * -1", "Py": "PARAM3 * -0.35", "Pz": "-50", "Direction": "X"}),
+                ("PTCA", "{category}-P6", {"Number": 6, "Connection": "0", "Bore": "0", "Px": "PARAM4 * -1", "Py": "0", "Pz": "PARAM3 * -0.4", "Direction": "-X"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "X", "Distance": "0", "Height": "PARAM4", "Diameter": "PARAM3"}),
+                ("LCYL", "", {"Axis": "-X", "Bdistance": "5", "Tdistance": "PARAM4 + 5", "Diameter": "PARAM3"}),
+                ("SCYL", "", {"Axis": "X", "Distance": "0", "Height": "DDHEIGHT", "Diameter": "PARAM5"}),
+                ("SCYL", "", {"Axis": "P3", "Distance": "-0.1 * PARAM3", "Height": "PARAM3 * 0.2", "Diameter": "PARAM4"}),
+                ("SCYL", "", {"Axis": "P3", "Distance": "PARAM3 * 0.1 + 2", "Height": "PARAM3 * 0.2", "Diameter": "PARAM4"}),
+                ("SCYL", "", {"Axis": "-P3", "Distance": "PARAM3 * 0.1 + 2", "Height": "PARAM3 * 0.2", "Diameter": "PARAM4"}),
+                ("SCTO", "", {"Aaxis": "P4", "Baxis": "P5", "Diameter": "10"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "NOZZ", "Param": "{DN} {CT} {FD} {FT} {TD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["STEA"] = {
+    "Items": (
+        ("STCA", "{category}", {"Gtype": "ANG", "Description": "Angle Section"}, (
+            ("TEXT", "{category}-PA1", {"Stext": "Leg Length Y-Axis"}),
+            ("TEXT", "{category}-PA2", {"Stext": "Leg Length X-Axis"}),
+            ("TEXT", "{category}-PA3", {"Stext": "Thickness"}),
+            ("TEXT", "{category}-PA4", {"Stext": "X-Axis Offset"}),
+            ("TEXT", "{category}-PA5", {"Stext": "Y-Axis Offset"}),
+            ("TEXT", "{category}-PA6", {"Stext": "Unit Weight"}),
+            ("TEXT", "{category}-PA7", {"Stext": "Root Radius"}),
+            ("TEXT", "{category}-PA8", {"Stext": "Toe Radius"}),
+            ("TEXT", "{category}-PA9", {"Stext": "Vertical Backmark"}),
+            ("TEXT", "{category}-PA10", {"Stext": "Horizontal Backmark"}),
+            ("PTSS", "{category}-PTSS", {}, (
+                ("PLIN", "", {"Pkey": "NA", "Plaxis": "Y", "Px": "0", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LOA", "Plaxis": "-Y", "Px": "PARAM3 - PARAM5", "Py": "PARAM4 - PARAM3", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAT", "Plaxis": "Y", "Px": "0", "Py": "PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAB", "Plaxis": "-Y", "Px": "0", "Py": "PARAM4 - PARAM3", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAL", "Plaxis": "-X", "Px": "-PARAM5", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAR", "Plaxis": "X", "Px": "PARAM3 - PARAM5", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TOAY", "Plaxis": "-Y", "Px": "-PARAM5", "Py": "PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TOAX", "Plaxis": "X", "Px": "-PARAM5", "Py": "PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LBOA", "Plaxis": "-Y", "Px": "-PARAM5", "Py": "PARAM4 - PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RBOA", "Plaxis": "-Y", "Px": "PARAM3 - PARAM5", "Py": "PARAM4 - PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTTA", "Plaxis": "X", "Px": "PARAM2 - PARAM5", "Py": "PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTOA", "Plaxis": "X", "Px": "PARAM2 - PARAM5", "Py": "PARAM4 - PARAM3", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "HOA", "Plaxis": "X", "Px": "PARAM3 - PARAM5", "Py": "PARAM4 - PARAM9", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "HBA", "Plaxis": "-Y", "Px": "PARAM10 - PARAM5", "Py": "PARAM4 - PARAM3", "Dx": "0", "Dy": "0"}),
+            )),
+            ("GMSS", "{category}-GMSS", {}, (
+                ("SPRO", "", {"Plaxis": "Y"}, (
+                    ("SPVE", "", {"Px": "-PARAM5", "Py": "PARAM4 - PARAM1"}),
+                    ("SPVE", "", {"Px": "PARAM3 - PARAM5", "Py": "PARAM4 - PARAM1", "Pradius": "PARAM8"}),
+                    ("SPVE", "", {"Px": "PARAM3 - PARAM5", "Py": "PARAM4 - PARAM3", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "PARAM4 - PARAM3", "Pradius": "PARAM8"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "PARAM4"}),
+                    ("SPVE", "", {"Px": "-PARAM5", "Py": "PARAM4"}),
+                )),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SPRF", "{ItemCode}", {"Param": "{PARA1} {PARA2} {PARA3} {PARA4} {PARA5} {PARA6} {PARA7} {PARA8} {PARA9} {PARA10}", "Gtype": "ANG"}),
+    ),
+}
+
+STANDARD_BUILDS["STUA"] = {
+    "Items": (
+        ("STCA", "{category}", {"Gtype": "ANG", "Description": "Angle Section"}, (
+            ("TEXT", "{category}-PA1", {"Stext": "Leg Length Y-Axis"}),
+            ("TEXT", "{category}-PA2", {"Stext": "Leg Length X-Axis"}),
+            ("TEXT", "{category}-PA3", {"Stext": "Thickness"}),
+            ("TEXT", "{category}-PA4", {"Stext": "X-Axis Offset"}),
+            ("TEXT", "{category}-PA5", {"Stext": "Y-Axis Offset"}),
+            ("TEXT", "{category}-PA6", {"Stext": "Unit Weight"}),
+            ("TEXT", "{category}-PA7", {"Stext": "Root Radius"}),
+            ("TEXT", "{category}-PA8", {"Stext": "Toe Radius"}),
+            ("TEXT", "{category}-PA9", {"Stext": "Vertical Backmark"}),
+            ("TEXT", "{category}-PA10", {"Stext": "Horizontal Backmark"}),
+            ("PTSS", "{category}-PTSS", {}, (
+                ("PLIN", "", {"Pkey": "NA", "Plaxis": "Y", "Px": "0", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LOA", "Plaxis": "-Y", "Px": "PARAM3 - PARAM5", "Py": "PARAM4 - PARAM3", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAT", "Plaxis": "Y", "Px": "0", "Py": "PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAB", "Plaxis": "-Y", "Px": "0", "Py": "PARAM4 - PARAM3", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAL", "Plaxis": "-X", "Px": "-PARAM5", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAR", "Plaxis": "X", "Px": "PARAM3 - PARAM5", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TOAY", "Plaxis": "-Y", "Px": "-PARAM5", "Py": "PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TOAX", "Plaxis": "X", "Px": "-PARAM5", "Py": "PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LBOA", "Plaxis": "-Y", "Px": "-PARAM5", "Py": "PARAM4 - PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RBOA", "Plaxis": "-Y", "Px": "PARAM3 - PARAM5", "Py": "PARAM4 - PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTTA", "Plaxis": "X", "Px": "PARAM2 - PARAM5", "Py": "PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTOA", "Plaxis": "X", "Px": "PARAM2 - PARAM5", "Py": "PARAM4 - PARAM3", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "HOA", "Plaxis": "X", "Px": "PARAM3 - PARAM5", "Py": "PARAM4 - PARAM9", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "HBA", "Plaxis": "-Y", "Px": "PARAM10 - PARAM5", "Py": "PARAM4 - PARAM3", "Dx": "0", "Dy": "0"}),
+            )),
+            ("GMSS", "{category}-GMSS", {}, (
+                ("SPRO", "", {"Plaxis": "Y"}, (
+                    ("SPVE", "", {"Px": "-PARAM5", "Py": "PARAM4 - PARAM1"}),
+                    ("SPVE", "", {"Px": "PARAM3 - PARAM5", "Py": "PARAM4 - PARAM1", "Pradius": "PARAM8"}),
+                    ("SPVE", "", {"Px": "PARAM3 - PARAM5", "Py": "PARAM4 - PARAM3", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "PARAM4 - PARAM3", "Pradius": "PARAM8"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "PARAM4"}),
+                    ("SPVE", "", {"Px": "-PARAM5", "Py": "PARAM4"}),
+                )),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SPRF", "{ItemCode}", {"Param": "{PARA1} {PARA2} {PARA3} {PARA4} {PARA5} {PARA6} {PARA7} {PARA8} {PARA9} {PARA10}", "Gtype": "ANG"}),
+    ),
+}
+
+STANDARD_BUILDS["JISH"] = {
+    "Items": (
+        ("STCA", "{category}", {"Gtype": "BEAM", "Description": "H profiles"}, (
+            ("TEXT", "{category}-PA1", {"Stext": "Depth"}),
+            ("TEXT", "{category}-PA2", {"Stext": "Width"}),
+            ("TEXT", "{category}-PA3", {"Stext": "Web Thickness"}),
+            ("TEXT", "{category}-PA4", {"Stext": "Flange Thickness"}),
+            ("TEXT", "{category}-PA5", {"Stext": "Unit Weight"}),
+            ("TEXT", "{category}-PA6", {"Stext": "Root Radius"}),
+            ("TEXT", "{category}-PA7", {"Stext": "Cross Sectional Area"}),
+            ("TEXT", "{category}-PA8", {"Stext": "Depth Between Fillets"}),
+            ("TEXT", "{category}-PA9", {"Stext": "Nominal Depth"}),
+            ("TEXT", "{category}-PA10", {"Stext": "Nominal Width"}),
+            ("TEXT", "{category}-PA11", {"Stext": "Surface Area per metre"}),
+            ("TEXT", "{category}-PA12", {"Stext": "Backmark"}),
+            ("PTSS", "{category}-PTSS", {}, (
+                ("PLIN", "", {"Pkey": "TOS", "Plaxis": "Y", "Px": "0", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TRW", "Plaxis": "Y", "Px": "0.5 * PARAM3", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TRWB", "Plaxis": "-Y", "Px": "0.5 * PARAM3", "Py": "0.5 * (PARAM1 - 2.0 * PARAM4)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TLW", "Plaxis": "Y", "Px": "-0.5 * PARAM3", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TLWB", "Plaxis": "-Y", "Px": "0.5 * PARAM3", "Py": "0.5 * (PARAM1 - 2.0 * PARAM4)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LTOS", "Plaxis": "Y", "Px": "-0.5 * PARAM2", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTOS", "Plaxis": "Y", "Px": "0.5 * PARAM2", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTBS", "Plaxis": "-Y", "Px": "0.5 * PARAM2", "Py": "0.5 * (PARAM1 - 2.0 * PARAM4)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LTBS", "Plaxis": "-Y", "Px": "0.5 * PARAM2", "Py": "0.5 * (PARAM1 - 2.0 * PARAM4)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BOS", "Plaxis": "-Y", "Px": "0", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RBOS", "Plaxis": "-Y", "Px": "0.5 * PARAM2", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RBTS", "Plaxis": "Y", "Px": "0.5 * PARAM2", "Py": "-0.5 * (PARAM1 - 2.0 * PARAM4)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BRWT", "Plaxis": "Y", "Px": "0.5 * PARAM3", "Py": "-0.5 * (PARAM1 - 2.0 * PARAM4)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BLWT", "Plaxis": "Y", "Px": "-0.5 * PARAM3", "Py": "-0.5 * (PARAM1 - 2.0 * PARAM4)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BLW", "Plaxis": "-Y", "Px": "-0.5 * PARAM3", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BRW", "Plaxis": "-Y", "Px": "0.5 * PARAM3", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LBTS", "Plaxis": "Y", "Px": "-0.5 * PARAM2", "Py": "-0.5 * (PARAM1 - 2.0 * PARAM4)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LBOS", "Plaxis": "-Y", "Px": "-0.5 * PARAM2", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NA", "Plaxis": "Y", "Px": "0", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAL", "Plaxis": "-X", "Px": "-0.5 * PARAM3", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAR", "Plaxis": "X", "Px": "0.5 * PARAM3", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NARO", "Plaxis": "X", "Px": "0.5 * PARAM2", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NALO", "Plaxis": "-X", "Px": "-0.5 * PARAM2", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TBHL", "Plaxis": "-Y", "Px": "-0.5 * PARAM12", "Py": "0.5 * PARAM1 - PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TBHR", "Plaxis": "-Y", "Px": "0.5 * PARAM12", "Py": "0.5 * PARAM1 - PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BBHL", "Plaxis": "Y", "Px": "-0.5 * PARAM12", "Py": "-0.5 * PARAM1 + PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BBHR", "Plaxis": "Y", "Px": "0.5 * PARAM12", "Py": "-0.5 * PARAM1 + PARAM4", "Dx": "0", "Dy": "0"}),
+            )),
+            ("GMSS", "{category}-GMSS", {}, (
+                ("SPRO", "", {"Plaxis": "Y"}, (
+                    ("SPVE", "", {"Px": "-0.5 * PARAM2", "Py": "0.5 * PARAM1"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM2", "Py": "0.5 * PARAM1"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM2", "Py": "0.5 * PARAM8 + PARAM6"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM3", "Py": "0.5 * PARAM8 + PARAM6", "Pradius": "PARAM6"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM3", "Py": "-0.5 * PARAM8 - PARAM6", "Pradius": "PARAM6"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM2", "Py": "-0.5 * PARAM8 - PARAM6"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM2", "Py": "-0.5 * PARAM1"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM2", "Py": "-0.5 * PARAM1"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM2", "Py": "-0.5 * PARAM8 - PARAM6"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM3", "Py": "-0.5 * PARAM8 - PARAM6", "Pradius": "PARAM6"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM3", "Py": "0.5 * PARAM8 + PARAM6", "Pradius": "PARAM6"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM2", "Py": "0.5 * PARAM8 + PARAM6"}),
+                )),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SPRF", "{ItemCode}", {"Param": "{PARA1} {PARA2} {PARA3} {PARA4} {PARA5} {PARA6} {PARA7} {PARA8} {PARA9} {PARA10} {PARA11} {PARA12}", "Gtype": "BEAM"}),
+    ),
+}
+
+STANDARD_BUILDS["JISI"] = {
+    "Items": (
+        ("STCA", "{category}", {"Gtype": "JISI", "Description": "I profiles"}, (
+            ("TEXT", "{category}-PA1", {"Stext": "Depth"}),
+            ("TEXT", "{category}-PA2", {"Stext": "Width"}),
+            ("TEXT", "{category}-PA3", {"Stext": "Web Thickness"}),
+            ("TEXT", "{category}-PA4", {"Stext": "Flange Thickness"}),
+            ("TEXT", "{category}-PA5", {"Stext": "Unit Weight"}),
+            ("TEXT", "{category}-PA6", {"Stext": "Root Radius"}),
+            ("TEXT", "{category}-PA7", {"Stext": "Toe Radius"}),
+            ("TEXT", "{category}-PA8", {"Stext": "Taper in degress"}),
+            ("TEXT", "{category}-PA9", {"Stext": "Backmark"}),
+            ("PTSS", "{category}-PTSS", {}, (
+                ("PLIN", "", {"Pkey": "NA", "Plaxis": "Y", "Px": "0", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TOS", "Plaxis": "Y", "Px": "0", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BOS", "Plaxis": "-Y", "Px": "0", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAL", "Plaxis": "-X", "Px": "-0.5 * PARAM3", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAR", "Plaxis": "X", "Px": "0.5 * PARAM3", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LTOS", "Plaxis": "Y", "Px": "-0.5 * PARAM2", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTOS", "Plaxis": "Y", "Px": "0.5 * PARAM2", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RBOS", "Plaxis": "-Y", "Px": "0.5 * PARAM2", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LBOS", "Plaxis": "-Y", "Px": "-0.5 * PARAM2", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TBHL", "Plaxis": "-Y", "Px": "-0.5 * PARAM9", "Py": "0.5 * PARAM1 - PARAM4 + (PARAM9 * 0.5 - (PARAM2 + PARAM3) / 4) * math.tan(PARAM8 * math.pi / 180)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TBHR", "Plaxis": "-Y", "Px": "0.5 * PARAM9", "Py": "0.5 * PARAM1 - PARAM4 + (PARAM9 * 0.5 - (PARAM2 + PARAM3) / 4) * math.tan(PARAM8 * math.pi / 180)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BBHR", "Plaxis": "Y", "Px": "0.5 * PARAM9", "Py": "-(0.5 * PARAM1 - PARAM4 + (PARAM9 * 0.5 - (PARAM2 + PARAM3) / 4) * math.tan(PARAM8 * math.pi / 180))", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BBHL", "Plaxis": "Y", "Px": "-0.5 * PARAM9", "Py": "-(0.5 * PARAM1 - PARAM4 + (PARAM9 * 0.5 - (PARAM2 + PARAM3) / 4) * math.tan(PARAM8 * math.pi / 180))", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NARO", "Plaxis": "X", "Px": "0.5 * PARAM2", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NALO", "Plaxis": "-X", "Px": "-0.5 * PARAM2", "Py": "0", "Dx": "0", "Dy": "0"}),
+            )),
+            ("GMSS", "{category}-GMSS", {}, (
+                ("SPRO", "", {"Plaxis": "Y"}, (
+                    ("SPVE", "", {"Px": "0.5 * PARAM2", "Py": "0.5 * PARAM1"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM2", "Py": "0.5 * PARAM1 - PARAM4 + (PARAM2 - PARAM3) / 4 * math.tan(PARAM8 * math.pi / 180)", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM3", "Py": "0.5 * PARAM1 - PARAM4 - (PARAM2 - PARAM3) / 4 * math.tan(PARAM8 * math.pi / 180)", "Pradius": "PARAM6"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM3", "Py": "-(0.5 * PARAM1 - PARAM4 - (PARAM2 - PARAM3) / 4 * math.tan(PARAM8 * math.pi / 180))", "Pradius": "PARAM6"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM2", "Py": "-(0.5 * PARAM1 - PARAM4 + (PARAM2 - PARAM3) / 4 * math.tan(PARAM8 * math.pi / 180))", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM2", "Py": "-0.5 * PARAM1", "Pradius": "0"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM2", "Py": "-0.5 * PARAM1", "Pradius": "0"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM2", "Py": "-(0.5 * PARAM1 - PARAM4 + (PARAM2 - PARAM3) / 4 * math.tan(PARAM8 * math.pi / 180))", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM3", "Py": "-(0.5 * PARAM1 - PARAM4 - (PARAM2 - PARAM3) / 4 * math.tan(PARAM8 * math.pi / 180))", "Pradius": "PARAM6"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM3", "Py": "0.5 * PARAM1 - PARAM4 - (PARAM2 - PARAM3) / 4 * math.tan(PARAM8 * math.pi / 180)", "Pradius": "PARAM6"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM2", "Py": "0.5 * PARAM1 - PARAM4 + (PARAM2 - PARAM3) / 4 * math.tan(PARAM8 * math.pi / 180)", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM2", "Py": "0.5 * PARAM1", "Pradius": "0"}),
+                )),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SPRF", "{ItemCode}", {"Param": "{PARA1} {PARA2} {PARA3} {PARA4} {PARA5} {PARA6} {PARA7} {PARA8} {PARA9}", "Gtype": "JISI"}),
+    ),
+}
+
+STANDARD_BUILDS["JIST"] = {
+    "Items": (
+        ("STCA", "{category}", {"Gtype": "JIST", "Description": "T profiles"}, (
+            ("TEXT", "{category}-PA1", {"Stext": "Depth"}),
+            ("TEXT", "{category}-PA2", {"Stext": "Width"}),
+            ("TEXT", "{category}-PA3", {"Stext": "Web Thickness"}),
+            ("TEXT", "{category}-PA4", {"Stext": "Flange Thickness"}),
+            ("TEXT", "{category}-PA5", {"Stext": "Distance to neutral axis"}),
+            ("TEXT", "{category}-PA6", {"Stext": "Unit Weight"}),
+            ("TEXT", "{category}-PA7", {"Stext": "Root Radius"}),
+            ("TEXT", "{category}-PA8", {"Stext": "Nominal Width"}),
+            ("TEXT", "{category}-PA9", {"Stext": "Nominal Depth"}),
+            ("TEXT", "{category}-PA10", {"Stext": "Original Depth"}),
+            ("TEXT", "{category}-PA11", {"Stext": "Original Width"}),
+            ("TEXT", "{category}-PA12", {"Stext": "Original Weight"}),
+            ("TEXT", "{category}-PA13", {"Stext": "Backmark"}),
+            ("PTSS", "{category}-PTSS", {}, (
+                ("PLIN", "", {"Pkey": "CGEO", "Plaxis": "X", "Px": "0", "Py": "PARAM5 - PARAM2 * 0.5", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TOS", "Plaxis": "Y", "Px": "0", "Py": "PARAM5", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LTOS", "Plaxis": "Y", "Px": "PARAM1 * -0.5", "Py": "PARAM5", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LTBS", "Plaxis": "-Y", "Px": "PARAM1 * -0.5", "Py": "PARAM5 - PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTOS", "Plaxis": "Y", "Px": "PARAM1 * 0.5", "Py": "PARAM5", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTBS", "Plaxis": "-Y", "Px": "PARAM1 * 0.5", "Py": "PARAM5 - PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TRWB", "Plaxis": "-Y", "Px": "PARAM3 * 0.5", "Py": "PARAM5 - PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TLWB", "Plaxis": "-Y", "Px": "PARAM3 * -0.5", "Py": "PARAM5 - PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BOS", "Plaxis": "-Y", "Px": "0", "Py": "PARAM5 - PARAM2", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RBOS", "Plaxis": "-Y", "Px": "PARAM3 * 0.5", "Py": "PARAM5 - PARAM2", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LBOS", "Plaxis": "-Y", "Px": "PARAM3 * -0.5", "Py": "PARAM5 - PARAM2", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NA", "Plaxis": "Y", "Px": "0", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TBHL", "Plaxis": "Y", "Px": "PARAM13 * -0.5", "Py": "PARAM5 - PARAM4", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TBHR", "Plaxis": "Y", "Px": "PARAM13 * 0.5", "Py": "PARAM5 - PARAM4", "Dx": "0", "Dy": "0"}),
+            )),
+            ("GMSS", "{category}-GMSS", {}, (
+                ("SPRO", "", {"Plaxis": "Y"}, (
+                    ("SPVE", "", {"Px": "-0.5 * PARAM1", "Py": "PARAM5"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM1", "Py": "PARAM5"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM1", "Py": "PARAM5 - PARAM4"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM3", "Py": "PARAM5 - PARAM4", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM3", "Py": "PARAM5 - PARAM2"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM3", "Py": "PARAM5 - PARAM2"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM3", "Py": "PARAM5 - PARAM4", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM1", "Py": "PARAM5 - PARAM4"}),
+                )),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SPRF", "{ItemCode}", {"Param": "{PARA1} {PARA2} {PARA3} {PARA4} {PARA5} {PARA6} {PARA7} {PARA8} {PARA9} {PARA10} {PARA11} {PARA12} {PARA13}", "Gtype": "JIST"}),
+    ),
+}
+
+STANDARD_BUILDS["JISB"] = {
+    "Items": (
+        ("STCA", "{category}", {"Gtype": "JIST", "Description": "Bulb Profiles"}, (
+            ("TEXT", "{category}-PA1", {"Stext": "Leg Length"}),
+            ("TEXT", "{category}-PA2", {"Stext": "Bulb Thickness"}),
+            ("TEXT", "{category}-PA3", {"Stext": "Bulb Width"}),
+            ("TEXT", "{category}-PA4", {"Stext": "Root Radius"}),
+            ("TEXT", "{category}-PA5", {"Stext": "Bulb Radius"}),
+            ("TEXT", "{category}-PA6", {"Stext": "Toe Radius"}),
+            ("TEXT", "{category}-PA7", {"Stext": "X Axis Offset"}),
+            ("TEXT", "{category}-PA8", {"Stext": "Y Axis Offset"}),
+            ("TEXT", "{category}-PA9", {"Stext": "Taper Angle"}),
+            ("PTSS", "{category}-PTSS", {}, (
+                ("PLIN", "", {"Pkey": "CGEO", "Plaxis": "Y", "Px": "(PARAM2 + PARAM3 + PARAM5) * 0.5 - math.tan(PARAM8 * math.pi / 180)", "Py": "PARAM7 - PARAM1 * 0.5", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NA", "Plaxis": "Y", "Px": "0", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LOA", "Plaxis": "Y", "Px": "PARAM2 - PARAM8", "Py": "PARAM7 - (PARAM3 + PARAM5 * (1 / math.tan(PARAM9 * 0.5 * math.pi / 180) - 1) * math.tan(PARAM9 * math.pi / 180))", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAT", "Plaxis": "Y", "Px": "0", "Py": "PARAM7", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAL", "Plaxis": "-X", "Px": "-PARAM8", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAR", "Plaxis": "X", "Px": "PARAM2 - PARAM8", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TOAY", "Plaxis": "-Y", "Px": "-PARAM8", "Py": "PARAM7", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TOAX", "Plaxis": "X", "Px": "-PARAM8", "Py": "PARAM7", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LBOA", "Plaxis": "-Y", "Px": "-PARAM8", "Py": "PARAM7 - PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RBOA", "Plaxis": "-Y", "Px": "PARAM2 - PARAM8", "Py": "PARAM7 - PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTTA", "Plaxis": "Y", "Px": "PARAM2 + PARAM3 + PARAM5 * (1 / math.tan(PARAM9 * 0.5 * math.pi / 180) - 1) - PARAM8", "Py": "PARAM7", "Dx": "0", "Dy": "0"}),
+            )),
+            ("GMSS", "{category}-GMSS", {}, (
+                ("SPRO", "", {"Plaxis": "Y"}, (
+                    ("SPVE", "", {"Px": "-PARAM8", "Py": "PARAM7 - PARAM1"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM8", "Py": "PARAM7 - PARAM1"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM8", "Py": "PARAM7 - (PARAM3 + PARAM5 * (1 / math.tan(PARAM9 * 0.5 * math.pi / 180) - 1) * math.tan(PARAM9 * math.pi / 180))", "Pradius": "PARAM4"}),
+                    ("SPVE", "", {"Px": "PARAM2 + PARAM3 + PARAM5 * (1 / math.tan(PARAM9 * 0.5 * math.pi / 180) - 1) - PARAM8", "Py": "PARAM7", "Pradius": "PARAM5"}),
+                    ("SPVE", "", {"Px": "-PARAM8", "Py": "PARAM7", "Pradius": "PARAM6"}),
+                )),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SPRF", "{ItemCode}", {"Param": "{PARA1} {PARA2} {PARA3} {PARA4} {PARA5} {PARA6} {PARA7} {PARA8} {PARA9}", "Gtype": "JISB"}),
+    ),
+}
+
+STANDARD_BUILDS["JISC"] = {
+    "Transaction": "Build JIS Channel",
+    "Items": (
+        ("STCA", "{category}", {"Gtype": "JISC", "Description": "{description}"}, (
+            ("TEXT", "{category}-PA1", {"Stext": "Depth"}),
+            ("TEXT", "{category}-PA2", {"Stext": "Width"}),
+            ("TEXT", "{category}-PA3", {"Stext": "Web Thickness"}),
+            ("TEXT", "{category}-PA4", {"Stext": "Flange Thickness"}),
+            ("TEXT", "{category}-PA5", {"Stext": "\"ey\" X-axis Offset"}),
+            ("TEXT", "{category}-PA6", {"Stext": "Unit Weight"}),
+            ("TEXT", "{category}-PA7", {"Stext": "Root Radius"}),
+            ("TEXT", "{category}-PA8", {"Stext": "Toe Radius"}),
+            ("TEXT", "{category}-PA9", {"Stext": "Flange Taper"}),
+            ("TEXT", "{category}-PA10", {"Stext": "Backmark"}),
+            ("PTSS", "{category}-PTSS", {}, (
+                ("PLIN", "", {"Pkey": "CGEO", "Plaxis": "Y", "Px": "0", "Py": "PARAM2 * 0.5 - PARAM5", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TOC", "Plaxis": "Y", "Px": "0", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BOC", "Plaxis": "-Y", "Px": "0", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "FOC", "Plaxis": "-X", "Px": "-1 * PARAM5", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LTOC", "Plaxis": "Y", "Px": "-1.0 * PARAM5", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LBOC", "Plaxis": "-Y", "Px": "-1.0 * PARAM5", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RBOC", "Plaxis": "-Y", "Px": "PARAM2 - PARAM5", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTOC", "Plaxis": "Y", "Px": "PARAM2 - PARAM5", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NA", "Plaxis": "Y", "Px": "0", "Py": "0", "Dx": "0", "Dy": "0"}),
+            )),
+            ("GMSS", "{category}-GMSS", {}, (
+                ("SPRO", "", {"Plaxis": "Y"}, (
+                    ("SPVE", "", {"Px": "-1.0 * PARAM5", "Py": "0.5 * PARAM1"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "0.5 * PARAM1"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "0.5 * PARAM1 - PARAM4 + (PARAM2 - PARAM3) / 2 * math.tan(PARAM9 * math.pi / 180)", "Pradius": "PARAM8"}),
+                    ("SPVE", "", {"Px": "PARAM3 - PARAM5", "Py": "0.5 * PARAM1 - PARAM4 - (PARAM2 - PARAM3) / 2 * math.tan(PARAM9 * math.pi / 180)", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "PARAM3 - PARAM5", "Py": "-0.5 * PARAM1 + PARAM4 - (PARAM2 - PARAM3) / 2 * math.tan(PARAM9 * math.pi / 180)", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "-0.5 * PARAM1 + PARAM4 - (PARAM2 - PARAM3) / 2 * math.tan(PARAM9 * math.pi / 180)", "Pradius": "PARAM8"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "-0.5 * PARAM1"}),
+                    ("SPVE", "", {"Px": "-1 * PARAM5", "Py": "-0.5 * PARAM1"}),
+                )),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SPRF", "{ItemCode}", {"Param": "{PARA1} {PARA2} {PARA3} {PARA4} {PARA5} {PARA6} {PARA7} {PARA8} {PARA9} {PARA10}", "Gtype": "BSSC"}),
+    ),
+}
+
+STANDARD_BUILDS["BSSC"] = {
+    "Transaction": "Build Britsh Channel",
+    "Items": (
+        ("STCA", "{category}", {"Gtype": "BSSC", "Description": "{description}"}, (
+            ("TEXT", "{category}-PA1", {"Stext": "Depth"}),
+            ("TEXT", "{category}-PA2", {"Stext": "Width"}),
+            ("TEXT", "{category}-PA3", {"Stext": "Web Thickness"}),
+            ("TEXT", "{category}-PA4", {"Stext": "Flange Thickness"}),
+            ("TEXT", "{category}-PA5", {"Stext": "\"ey\" X-axis Offset"}),
+            ("TEXT", "{category}-PA6", {"Stext": "Unit Weight"}),
+            ("TEXT", "{category}-PA7", {"Stext": "Root Radius"}),
+            ("TEXT", "{category}-PA8", {"Stext": "Toe Radius"}),
+            ("TEXT", "{category}-PA9", {"Stext": "Flange Taper"}),
+            ("TEXT", "{category}-PA10", {"Stext": "Depth between fillets"}),
+            ("TEXT", "{category}-PA11", {"Stext": "Nominal Depth"}),
+            ("TEXT", "{category}-PA12", {"Stext": "Nominal Width"}),
+            ("TEXT", "{category}-PA13", {"Stext": "Backmark"}),
+            ("PTSS", "{category}-PTSS", {}, (
+                ("PLIN", "", {"Pkey": "CGEO", "Plaxis": "X", "Px": "0", "Py": "PARAM5 - PARAM2 * 0.5", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TOC", "Plaxis": "Y", "Px": "0", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TBH", "Plaxis": "-Y", "Px": "PARAM13 - PARAM5", "Py": "0.5 * PARAM1 - PARAM4 - (PARAM2 - PARAM3 * 0.5 - PARAM13) * math.tan(PARAM9 * math.pi / 180)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BBH", "Plaxis": "Y", "Px": "PARAM13 - PARAM5", "Py": "-0.5 * PARAM1 + PARAM4 + (PARAM2 - PARAM3 * 0.5 - PARAM13) * math.tan(PARAM9 * math.pi / 180)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BOC", "Plaxis": "-Y", "Px": "0", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "FOC", "Plaxis": "-X", "Px": "-1 * PARAM5", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "IOC", "Plaxis": "X", "Px": "PARAM3 - PARAM5", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "ROC", "Plaxis": "X", "Px": "PARAM2 - PARAM5", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LTOC", "Plaxis": "Y", "Px": "-1.0 * PARAM5", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LBOC", "Plaxis": "-Y", "Px": "-1.0 * PARAM5", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RBOC", "Plaxis": "-Y", "Px": "PARAM2 - PARAM5", "Py": "-0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTOC", "Plaxis": "Y", "Px": "PARAM2 - PARAM5", "Py": "0.5 * PARAM1", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NA", "Plaxis": "Y", "Px": "0", "Py": "0", "Dx": "0", "Dy": "0"}),
+            )),
+            ("GMSS", "{category}-GMSS", {}, (
+                ("SPRO", "", {"Plaxis": "Y"}, (
+                    ("SPVE", "", {"Px": "-1.0 * PARAM5", "Py": "0.5 * PARAM1"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "0.5 * PARAM1"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "0.5 * PARAM1 - PARAM4 + (PARAM2 - PARAM3) / 2 * math.tan(PARAM9 * math.pi / 180)", "Pradius": "PARAM8"}),
+                    ("SPVE", "", {"Px": "PARAM3 - PARAM5", "Py": "0.5 * PARAM1 - PARAM4 - (PARAM2 - PARAM3) / 2 * math.tan(PARAM9 * math.pi / 180)", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "PARAM3 - PARAM5", "Py": "-0.5 * PARAM1 + PARAM4 - (PARAM2 - PARAM3) / 2 * math.tan(PARAM9 * math.pi / 180)", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "-0.5 * PARAM1 + PARAM4 - (PARAM2 - PARAM3) / 2 * math.tan(PARAM9 * math.pi / 180)", "Pradius": "PARAM8"}),
+                    ("SPVE", "", {"Px": "PARAM2 - PARAM5", "Py": "-0.5 * PARAM1"}),
+                    ("SPVE", "", {"Px": "-1 * PARAM5", "Py": "-0.5 * PARAM1"}),
+                )),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SPRF", "{ItemCode}", {"Param": "{PARA1} {PARA2} {PARA3} {PARA4} {PARA5} {PARA6} {PARA7} {PARA8} {PARA9} {PARA10} {PARA11} {PARA12} {PARA13}", "Gtype": "BSSC"}),
+    ),
+}
+
+STANDARD_BUILDS["DINT"] = {
+    "Transaction": "Build DINT",
+    "Items": (
+        ("STCA", "{category}", {"Gtype": "DINT", "Description": "{description}"}, (
+            ("TEXT", "{category}-PA1", {"Stext": "Depth"}),
+            ("TEXT", "{category}-PA2", {"Stext": "Width"}),
+            ("TEXT", "{category}-PA3", {"Stext": "Web Thickness"}),
+            ("TEXT", "{category}-PA4", {"Stext": "Flange Thickness"}),
+            ("TEXT", "{category}-PA5", {"Stext": "Distance to neutral axis"}),
+            ("TEXT", "{category}-PA6", {"Stext": "Unit Weight"}),
+            ("TEXT", "{category}-PA7", {"Stext": "Root Radius"}),
+            ("TEXT", "{category}-PA8", {"Stext": "Nominal Width"}),
+            ("TEXT", "{category}-PA9", {"Stext": "Nominal Depth"}),
+            ("TEXT", "{category}-PA10", {"Stext": "Original Depth"}),
+            ("TEXT", "{category}-PA11", {"Stext": "Original Width"}),
+            ("TEXT", "{category}-PA12", {"Stext": "Original Weight"}),
+            ("TEXT", "{category}-PA13", {"Stext": "Backmark"}),
+            ("TEXT", "{category}-PA14", {"Stext": "Flange Radius"}),
+            ("TEXT", "{category}-PA15", {"Stext": "Web Radius"}),
+            ("TEXT", "{category}-PA16", {"Stext": "Flange Slope"}),
+            ("TEXT", "{category}-PA17", {"Stext": "Flange Slope"}),
+            ("PTSS", "{category}-PTSS", {}, (
+                ("PLIN", "", {"Pkey": "CGEO", "Plaxis": "X", "Px": "0", "Py": "PARAM5 - PARAM2 * 0.5", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NA", "Plaxis": "Y", "Px": "0", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TOS", "Plaxis": "Y", "Px": "0", "Py": "PARAM5", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "BOS", "Plaxis": "-Y", "Px": "0", "Py": "PARAM5 - PARAM2", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "LTOS", "Plaxis": "Y", "Px": "PARAM1 * -0.5", "Py": "PARAM5", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "RTOS", "Plaxis": "Y", "Px": "PARAM1 * 0.5", "Py": "PARAM5", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAR", "Plaxis": "X", "Px": "PARAM3 * 0.5 - PARAM17 / 100 * (PARAM5 - PARAM2 * 0.5)", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NARO", "Plaxis": "X", "Px": "PARAM1 * 0.5", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NALO", "Plaxis": "-X", "Px": "PARAM1 * -0.5", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "NAL", "Plaxis": "-X", "Px": "PARAM3 * -0.5 + PARAM17 / 100 * (PARAM5 - PARAM2 * 0.5)", "Py": "0", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TBHL", "Plaxis": "-Y", "Px": "PARAM13 * -0.5", "Py": "PARAM5 - PARAM4 + PARAM16 / 100 * (PARAM13 / 2 - PARAM1 / 4)", "Dx": "0", "Dy": "0"}),
+                ("PLIN", "", {"Pkey": "TBHR", "Plaxis": "-Y", "Px": "PARAM13 * 0.5", "Py": "PARAM5 - PARAM4 + PARAM16 / 100 * (PARAM13 / 2 - PARAM1 / 4)", "Dx": "0", "Dy": "0"}),
+            )),
+            ("GMSS", "{category}-GMSS", {}, (
+                ("SPRO", "", {"Plaxis": "Y"}, (
+                    ("SPVE", "", {"Px": "-0.5 * PARAM1", "Py": "PARAM5"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM1", "Py": "PARAM5"}),
+                    ("SPVE", "", {"Px": "0.5 * PARAM1", "Py": "PARAM5 - PARAM4 + PARAM1 / 4 * PARAM16 / 100", "Pradius": "PARAM14"}),
+                    ("SPVE", "", {"Px": "( PARAM2 * PARAM17 * 100 - PARAM17 * PARAM16 * PARAM1 / 4 - PARAM4 * PARAM17 * 100 + PARAM3 * 5000) / ( 10000 - PARAM17 * PARAM16 )", "Py": "( PARAM5 - PARAM4 + PARAM16 / 100 * ( ( PARAM2 * PARAM17 * 100 - PARAM17 * PARAM16 * PARAM1 / 4 - PARAM4 * PARAM17 * 100 + PARAM3 * 5000 ) / ( 10000 - PARAM16 * PARAM17 ) - PARAM1 / 2 ) )", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "PARAM3 / 2 - PARAM2 / 2 * PARAM17 / 100", "Py": "PARAM5 - PARAM2", "Pradius": "PARAM15"}),
+                    ("SPVE", "", {"Px": "-1 * ( PARAM3 / 2 - PARAM2 / 2 * PARAM17 / 100 )", "Py": "PARAM5 - PARAM2", "Pradius": "PARAM15"}),
+                    ("SPVE", "", {"Px": "-1 * ( PARAM2 * PARAM17 * 100 - PARAM17 * PARAM16 * PARAM1 / 4 - PARAM4 * PARAM17 * 100 + PARAM3 * 5000 ) / ( 10000 - PARAM17 * PARAM16 )", "Py": "( PARAM5 - PARAM4 + PARAM16 / 100 * ( ( PARAM2 * PARAM17 * 100 - PARAM17 * PARAM16 * PARAM1 / 4 - PARAM4 * PARAM17 * 100 + PARAM3 * 5000 ) / ( 10000 - PARAM16 * PARAM17 ) - PARAM1 / 2 ) )", "Pradius": "PARAM7"}),
+                    ("SPVE", "", {"Px": "-0.5 * PARAM1", "Py": "PARAM5 - PARAM4 + PARAM1 / 4 * PARAM16 / 100", "Pradius": "PARAM14"}),
+                )),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SPRF", "{ItemCode}", {"Param": "{PARA1} {PARA2} {PARA3} {PARA4} {PARA5} {PARA6} {PARA7} {PARA8} {PARA9} {PARA10} {PARA11} {PARA12} {PARA13} {PARA14} {PARA15} {PARA16} {PARA17}", "Gtype": "DINT"}),
+    ),
+}
+
+STANDARD_BUILDS["BOLT"] = {
+    "Transaction": "Build Standard Bolt",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "BOLT", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "BOLT", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOM BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "UNIT"}),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "BOLT", "Param": "{Diameter} MM"}),
+    ),
+}
+
+STANDARD_BUILDS["WTBW"] = {
+    "Transaction": "Build Standard VGFL Components",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "OLET", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "WTBW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL RUN SIZE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "NOMINAL BRANCH SIZE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "RUN CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "BRANCH CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA5", {"Stext": "LAY LENGTH"}),
+            ("TEXT", "{category}-PA6", {"Stext": "BRANCH O/D"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "0", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "0", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "PARAM4", "Bore": "PARAM2", "Distance": "PARAM5", "Axis": "Z"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("LSNO", "", {"Aaxis": "Z", "Baxis": "Y", "Tdistance": "PARAM7", "Bdistance": "0", "Tdiameter": "PARAM6 * 1.2", "Bdiameter": "PARAM1 * 0.2", "Offset": "0"}),
+                ("LSNO", "", {"Aaxis": "Z", "Baxis": "Y", "Tdistance": "PARAM5", "Bdistance": "PARAM7", "Tdiameter": "PARAM6", "Bdiameter": "PARAM6 * 1.2", "Offset": "0"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "OLET", "Param": "{N1} {N2} {CT1} {CT2} {LL} {BD} {WL}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["FYFL"] = {
+    "Transaction": "Build Filter",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "FILT", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "FIFL", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "ARRIVE LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "LEAVE LAY LENGTH"}),
+            ("TEXT", "{category}-PA5", {"Stext": "BODY OUTSIDE DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "FLANGE THICKNESS"}),
+            ("TEXT", "{category}-PA7", {"Stext": "FLANGE DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM4", "Axis": "X"}),
+                ("PTCA", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Px": "PARAM4 * 0.5", "Py": "0", "Pz": "PARAM4 * -0.5", "Direction": "-Z"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-1.0 * PARAM6", "Diameter": "PARAM7"}),
+                ("SCYL", "", {"Axis": "P2", "Distance": "0", "Height": "-1.0 * PARAM6", "Diameter": "PARAM7"}),
+                ("LCYL", "", {"Axis": "X", "Bdistance": "PARAM6 - PARAM2", "Tdistance": "PARAM4 - PARAM6", "Diameter": "PARAM5"}),
+                ("LCYL", "", {"Axis": "D45X", "Bdistance": "0", "Tdistance": "PARAM2 * 1.3", "Diameter": "PARAM5"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "FILT", "Param": "{DN} {AL} {CT} {LL} {BD} {FT} {FD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["FTFL"] = {
+    "Transaction": "Build Filter",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "FILT", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "FIFL", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "ARRIVE LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "LEAVE LAY LENGTH"}),
+            ("TEXT", "{category}-PA5", {"Stext": "BODY OUTSIDE DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "FLANGE THICKNESS"}),
+            ("TEXT", "{category}-PA7", {"Stext": "FLANGE DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM4", "Axis": "X"}),
+                ("PTMI", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Px": "0", "Py": "0", "Pz": "PARAM2", "Axis": "Z"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-1.0 * PARAM6", "Diameter": "PARAM7"}),
+                ("SCYL", "", {"Axis": "P2", "Distance": "0", "Height": "-1.0 * PARAM6", "Diameter": "PARAM7"}),
+                ("LCYL", "", {"Axis": "P1", "Bdistance": "PARAM4 * -1.0", "Tdistance": "0", "Diameter": "PARAM5"}),
+                ("LCYL", "", {"Axis": "Z", "Bdistance": "0", "Tdistance": "PARAM2", "Diameter": "PARAM5"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "FILT", "Param": "{DN} {AL} {CT} {LL} {BD} {FT} {FD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["VBFL"] = {
+    "Transaction": "Build Ball Valve",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "VBFL", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "ENTRY TO CENTRE"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CENTRE TO END"}),
+            ("TEXT", "{category}-PA4", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA5", {"Stext": "CENTRE TO TOP"}),
+            ("TEXT", "{category}-PA6", {"Stext": "HANDLE LENGTH"}),
+            ("TEXT", "{category}-PA7", {"Stext": "FLANGE DIAM"}),
+            ("TEXT", "{category}-PA8", {"Stext": "FLANGE THICKNESS"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM4", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM4", "Bore": "PARAM1", "Distance": "PARAM3", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Distance": "PARAM5", "Axis": "Z"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-1.0 * PARAM8", "Diameter": "PARAM7"}),
+                ("SCYL", "", {"Axis": "P2", "Distance": "0", "Height": "-1.0 * PARAM8", "Diameter": "PARAM7"}),
+                ("SCYL", "", {"Axis": "P3", "Distance": "0", "Height": "-0.5 * PARAM8", "Diameter": "0.7 * PARAM1"}),
+                ("SCYL", "", {"Axis": "Z", "Distance": "0", "Height": "PARAM5", "Diameter": "0.4 * PARAM1"}),
+                ("LSNO", "", {"Aaxis": "P1", "Baxis": "Y", "Tdistance": "-1.0 * PARAM8", "Bdistance": "PARAM8 - PARAM2", "Tdiameter": "PARAM1 + 20", "Bdiameter": "PARAM1", "Offset": "0"}),
+                ("SBOX", "", {"Px": "0.5 * PARAM6", "Py": "0", "Pz": "PARAM5", "Pxlength": "PARAM6", "Pylength": "PARAM8", "Pzlength": "PARAM8"}),
+                ("LCYL", "", {"Axis": "X", "Bdistance": "-2.0 * PARAM8", "Tdistance": "PARAM3 - PARAM8", "Diameter": "PARAM1 + 20"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {EC} {CE} {CT} {TT} {HL} {FD} {FT}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["VBBW"] = {
+    "Transaction": "Build Ball Valve",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "VBBW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "ARRIVE LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "LEAVE LAY LENGTH"}),
+            ("TEXT", "{category}-PA4", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA5", {"Stext": "HANDLE HEIGHT"}),
+            ("TEXT", "{category}-PA6", {"Stext": "HANDLE LENGTH"}),
+            ("TEXT", "{category}-PA7", {"Stext": "BODY OUTSIDE DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM4", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM4", "Bore": "PARAM1", "Distance": "PARAM3", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Distance": "PARAM5", "Axis": "Z"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "Z", "Distance": "0", "Height": "PARAM5", "Diameter": "PARAM1 * 0.2"}),
+                ("SBOX", "", {"Px": "0", "Py": "0", "Pz": "PARAM5 * 0.4", "Pxlength": "PARAM1", "Pylength": "PARAM1", "Pzlength": "PARAM5 * 0.8"}),
+                ("SBOX", "", {"Px": "0.5 * PARAM6", "Py": "0", "Pz": "PARAM5", "Pxlength": "PARAM6", "Pylength": "PARAM1 * 0.5", "Pzlength": "PARAM1 * 0.5"}),
+                ("LCYL", "", {"Axis": "X", "Bdistance": "-1.0 * PARAM2", "Tdistance": "PARAM3", "Diameter": "PARAM7"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {AL} {LL} {CT} {HH} {HL} {BD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["TIFL"] = {
+    "Transaction": "Build Trap",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "TRAP", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "TIFL", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "HALF RUN LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "BODY HEIGHT"}),
+            ("TEXT", "{category}-PA5", {"Stext": "FLANGE DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "FLANGE THICKNESS"}),
+            ("TEXT", "{category}-PA7", {"Stext": "BODY DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Distance": "PARAM4", "Axis": "-Z"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-2.0 * PARAM2", "Diameter": "0.5 * PARAM5"}),
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-1.0 * PARAM6", "Diameter": "PARAM5"}),
+                ("SCYL", "", {"Axis": "P2", "Distance": "0", "Height": "-1.0 * PARAM6", "Diameter": "PARAM5"}),
+                ("SCYL", "", {"Axis": "P3", "Distance": "0", "Height": "-0.5 * PARAM4", "Diameter": "PARAM7"}),
+                ("LCYL", "", {"Axis": "Z", "Bdistance": "PARAM4 * -0.6", "Tdistance": "PARAM4 * 0.5", "Diameter": "PARAM7 * 0.6"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "TRAP", "Param": "{DN} {HL} {CT} {BH} {FD} {FT} {BD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["TJFL"] = {
+    "Transaction": "Build Trap",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "TRAP", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "TIFL", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "HALF RUN LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "BODY HEIGHT"}),
+            ("TEXT", "{category}-PA5", {"Stext": "FLANGE DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "FLANGE THICKNESS"}),
+            ("TEXT", "{category}-PA7", {"Stext": "BODY DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Distance": "PARAM4", "Axis": "Z"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-2.0 * PARAM2", "Diameter": "0.5 * PARAM5"}),
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-1.0 * PARAM6", "Diameter": "PARAM5"}),
+                ("SCYL", "", {"Axis": "P2", "Distance": "0", "Height": "-1.0 * PARAM6", "Diameter": "PARAM5"}),
+                ("SCYL", "", {"Axis": "P3", "Distance": "0", "Height": "-0.5 * PARAM4", "Diameter": "PARAM7"}),
+                ("LCYL", "", {"Axis": "Z", "Bdistance": "PARAM5 * -0.35", "Tdistance": "PARAM4 * 0.5", "Diameter": "PARAM7 * 0.6"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "TRAP", "Param": "{DN} {HL} {CT} {BH} {FD} {FT} {BD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["SB"] = {
+    "Transaction": "Build SPECTACLE BLIND",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "PCOM", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "SB", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "Thickness"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONNECTION TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "END TO CENTRE"}),
+            ("TEXT", "{category}-PA5", {"Stext": "DIAMETER"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2 * 0.5", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2 * 0.5", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Distance": "PARAM4", "Axis": "Y"}),
+                ("PTCA", "{category}-P4", {"Number": 4, "Connection": "NULL", "Bore": "0", "Px": "0", "Py": "PARAM4", "Pz": "0", "Direction": "X"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "X", "Distance": "-0.5  * PARAM2", "Height": "PARAM2", "Diameter": "PARAM5"}),
+                ("SBOX", "", {"Px": "0", "Py": "0.5 * PARAM4", "Pz": "0", "Pxlength": "PARAM2", "Pylength": "PARAM5 * 0.5", "Pzlength": "PARAM5 * 0.3"}),
+                ("LCYL", "", {"Axis": "P4", "Bdistance": "PARAM2 * -0.5", "Tdistance": "PARAM2 * 0.5", "Diameter": "PARAM5"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "PCOM", "Param": "{DN} {BT} {CT} {CL} {BD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["CKFL"] = {
+    "Transaction": "Build FLANGED CHECK Valve",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "CKFL", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "HALF LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "CENTRE TO TOP"}),
+            ("TEXT", "{category}-PA5", {"Stext": "FLANGE THICKNESS"}),
+            ("TEXT", "{category}-PA6", {"Stext": "TOP FLANGE DIAM"}),
+            ("TEXT", "{category}-PA7", {"Stext": "FLANGE DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Distance": "PARAM4", "Axis": "Z"}),
+                ("PTMI", "{category}-P4", {"Number": 4, "Connection": "NULL", "Bore": "0", "Px": "0", "Py": "0", "Pz": "PARAM4", "Axis": "X DDANGLE Y"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "P3", "Distance": "0", "Height": "-2 * PARAM5", "Diameter": "PARAM6"}),
+                ("SCYL", "", {"Axis": "Z", "Distance": "0", "Height": "PARAM4", "Diameter": "0.7 * PARAM6"}),
+                ("SCYL", "", {"Axis": "P1", "Distance": "0", "Height": "-1 * PARAM5", "Diameter": "PARAM7"}),
+                ("SCYL", "", {"Axis": "P2", "Distance": "0", "Height": "-1 * PARAM5", "Diameter": "PARAM7"}),
+                ("LSNO", "", {"Aaxis": "-X", "Baxis": "Z", "Tdistance": "PARAM2", "Bdistance": "0.5 * PARAM2", "Tdiameter": "PARAM1 + 20", "Bdiameter": "PARAM4 * 1.2", "Offset": "0"}),
+                ("LSNO", "", {"Aaxis": "X", "Baxis": "Z", "Tdistance": "PARAM2", "Bdistance": "0.5 * PARAM2", "Tdiameter": "PARAM1 + 20", "Bdiameter": "PARAM4 * 1.2", "Offset": "0"}),
+                ("SDSH", "", {"Axis": "-Z", "Diameter": "1.6 * PARAM2", "Height": "0.8 * PARAM4", "Radius": "0.5 * PARAM2", "Distance": "0"}),
+                ("SDSH", "", {"Axis": "Z", "Diameter": "1.6 * PARAM2", "Height": "0.8 * PARAM4", "Radius": "0.5 * PARAM2", "Distance": "0"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {LL} {CT} {CH} {FT} {TD} {FD}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
+
+STANDARD_BUILDS["CKSW"] = {
+    "Transaction": "Build SOCKET WELD CHECK VALVE",
+    "Items": (
+        ("CATE", "{category}", {"Gtype": "VALV", "Description": "{description}"}, (
+            ("SDTE", "{category}-D", {"Skey": "CKSW", "Rtext": "{description}"}),
+            ("TEXT", "{category}-PA1", {"Stext": "NOMINAL BORE"}),
+            ("TEXT", "{category}-PA2", {"Stext": "HALF LAY LENGTH"}),
+            ("TEXT", "{category}-PA3", {"Stext": "CONN TYPE"}),
+            ("TEXT", "{category}-PA4", {"Stext": "BONNET HEIGHT"}),
+            ("TEXT", "{category}-PA5", {"Stext": "BONNET DIAM"}),
+            ("TEXT", "{category}-PA6", {"Stext": "INSERTION DEPTH"}),
+            ("TEXT", "{category}-PA7", {"Stext": "BODY DIAM"}),
+            ("PTSE", "{category}-PTSE", {}, (
+                ("PTAX", "{category}-P1", {"Number": 1, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "-X"}),
+                ("PTAX", "{category}-P2", {"Number": 2, "Connection": "PARAM3", "Bore": "PARAM1", "Distance": "PARAM2", "Axis": "X"}),
+                ("PTAX", "{category}-P3", {"Number": 3, "Connection": "NULL", "Bore": "0", "Distance": "PARAM4", "Axis": "Z"}),
+                ("PTMI", "{category}-P4", {"Number": 4, "Connection": "NULL", "Bore": "0", "Px": "0", "Py": "0", "Pz": "PARAM4", "Axis": "X DDANGLE Y"}),
+            )),
+            ("GMSE", "{category}-GMSE", {}, (
+                ("SCYL", "", {"Axis": "Z", "Distance": "0", "Height": "0.8 * PARAM4", "Diameter": "PARAM7"}),
+                ("LSNO", "", {"Aaxis": "-X", "Baxis": "Z", "Tdistance": "PARAM2 + PARAM6", "Bdistance": "0", "Tdiameter": "PARAM1 + 20", "Bdiameter": "PARAM1 * 4", "Offset": "0"}),
+                ("LSNO", "", {"Aaxis": "X", "Baxis": "Z", "Tdistance": "PARAM2 + PARAM6", "Bdistance": "0", "Tdiameter": "PARAM1 + 20", "Bdiameter": "PARAM1 * 4", "Offset": "0"}),
+                ("LCYL", "", {"Axis": "Z", "Bdistance": "PARAM4 * 0.8", "Tdistance": "PARAM4", "Diameter": "PARAM5"}),
+            )),
+        )),
+    ),
+    "Rows": (
+        ("SCOM", "{ItemCode}", {"Gtype": "VALV", "Param": "{DN} {LL} {CT} {BH} {BD} {LD} {BL}", "Ptref": "@{category}-PTSE", "Gmref": "@{category}-GMSE"}),
+    ),
+}
@@ -0,0 +1,228 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Streaming export of standard records, no PythonQt dependency.
+# Records are read from a SQL cursor in chunks and written as they arrive,
+# to CSV or to an openpyxl write-only workbook, so memory does not grow
+# with the table. The whole catalogue goes to one workbook, one sheet per
+# standards table, in a single pass over the database.
+#
+#   python -m pipecad.StandardExport catalogues/PipeStd.db catalogue.xlsx
+# exports every standards table.
+
+import os
+import sys
+import csv
+import time
+import sqlite3
+import argparse
+
+# Rows fetched from the cursor at a time.
+EXPORT_CHUNK_SIZE = 5000
+
+# Tables of the catalogue tree, every other table with a pid holds standards.
+EXPORT_TREE_TABLES = ("SECT", "CATE", "SDTE")
+
+# Leading column of the catalogue sheets, the standard of each record.
+EXPORT_STANDARD_COLUMN = "Standard"
+
+
+class CsvSheets(object):
+    def __init__(self, theFileName):
+        self.file = open(theFileName, "w", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.file)
+    # __init__
+
+    def Sheet(self, theName, theHeader):
+        self.writer.writerow(theHeader)
+    # Sheet
+
+    def Append(self, theRows):
+        self.writer.writerows(theRows)
+    # Append
+
+    def Close(self):
+        self.file.close()
+    # Close
+# CsvSheets
+
+class XlsxSheets(object):
+    def __init__(self, theFileName):
+        from openpyxl import Workbook
+
+        self.fileName = theFileName
+        self.workbook = Workbook(write_only=True)
+        self.sheet = None
+    # __init__
+
+    def Sheet(self, theName, theHeader):
+        # Sheet names are limited to 31 characters.
+        self.sheet = self.workbook.create_sheet(theName[:31])
+        self.sheet.append(theHeader)
+    # Sheet
+
+    def Append(self, theRows):
+        for aRow in theRows:
+            self.sheet.append(aRow)
+        # for
+    # Append
+
+    def Close(self):
+        if self.sheet is None:
+            self.workbook.create_sheet("Sheet")
+        # if
+
+        self.workbook.save(self.fileName)
+    # Close
+# XlsxSheets
+
+def OpenSheets(theFileName, theTempName = None):
+    # The type follows theFileName, the sheets are written to theTempName.
+    aFileName = theTempName or theFileName
+    if theFileName.endswith(".xlsx"):
+        return XlsxSheets(aFileName)
+    elif theFileName.endswith(".csv"):
+        return CsvSheets(aFileName)
+    # if
+
+    raise ValueError("Unsupported file type: " + theFileName)
+# OpenSheets
+
+def RemoveFile(theFileName):
+    if os.path.exists(theFileName):
+        os.remove(theFileName)
+    # if
+# RemoveFile
+
+def RecordColumns(theConnection, theTable):
+    # Record columns without the keys, in table order.
+    return [aRow[1] for aRow in theConnection.execute("PRAGMA table_info(\"%s\")" % theTable) if aRow[1].lower() not in ("id", "pid")]
+# RecordColumns
+
+def StandardTables(theConnection):
+    aTables = []
+    for aRow in theConnection.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"):
+        aColumns = [aColumn[1].lower() for aColumn in theConnection.execute("PRAGMA table_info(\"%s\")" % aRow[0])]
+        if "pid" in aColumns and aRow[0].upper() not in EXPORT_TREE_TABLES:
+            aTables.append(aRow[0])
+        # if
+    # for
+
+    return aTables
+# StandardTables
+
+def StreamRows(theCursor, theSheets, theDone, theTotal, theProgress):
+    while True:
+        aRows = theCursor.fetchmany(EXPORT_CHUNK_SIZE)
+        if len(aRows) < 1:
+            break
+        # if
+
+        theSheets.Append(aRows)
+        theDone += len(aRows)
+        if theProgress is not None:
+            theProgress(theDone, theTotal, "Export row %d/%d" % (theDone, theTotal))
+        # if
+    # while
+
+    return theDone
+# StreamRows
+
+def ExportRecords(theDatabase, theTable, thePid, theFileName, theSheetName = None, theProgress = None):
+    """Write the records of one standard to CSV or XLSX, return the row count."""
+
+    # Write to a temp file beside the target, then rename it into place, so
+    # a failed or cancelled export never leaves a truncated file.
+    aTempName = theFileName + ".tmp"
+    aConnection = sqlite3.connect(theDatabase)
+    try:
+        aSheets = OpenSheets(theFileName, aTempName)
+        try:
+            aColumns = RecordColumns(aConnection, theTable)
+            aTotal = aConnection.execute("SELECT COUNT(*) FROM \"%s\" WHERE pid=?" % theTable, (thePid,)).fetchone()[0]
+
+            aSheets.Sheet(theSheetName or theTable, aColumns)
+            aCursor = aConnection.execute("SELECT %s FROM \"%s\" WHERE pid=? ORDER BY id" % (", ".join("\"%s\"" % aName for aName in aColumns), theTable), (thePid,))
+            aRows = StreamRows(aCursor, aSheets, 0, aTotal, theProgress)
+        finally:
+            aSheets.Close()
+        # try
+
+        os.replace(aTempName, theFileName)
+    except:
+        RemoveFile(aTempName)
+        raise
+    finally:
+        aConnection.close()
+    # try
+
+    return aRows
+# ExportRecords
+
+def ExportCatalogue(theDatabase, theFileName, theProgress = None):
+    """Write every standards table to one workbook, return (tables, rows)."""
+
+    if not theFileName.endswith(".xlsx"):
+        raise ValueError("The catalogue is exported to an Excel workbook: " + theFileName)
+    # if
+
+    aTempName = theFileName + ".tmp"
+    aConnection = sqlite3.connect(theDatabase)
+    try:
+        aSheets = XlsxSheets(aTempName)
+        try:
+            aTables = StandardTables(aConnection)
+            aTotal = sum(aConnection.execute("SELECT COUNT(*) FROM \"%s\"" % aTable).fetchone()[0] for aTable in aTables)
+
+            aRows = 0
+            for aTable in aTables:
+                aColumns = RecordColumns(aConnection, aTable)
+                aSheets.Sheet(aTable, [EXPORT_STANDARD_COLUMN] + aColumns)
+
+                aSql = "SELECT SDTE.name, %s FROM \"%s\" AS r LEFT JOIN SDTE ON SDTE.id = r.pid ORDER BY r.pid, r.id" % (", ".join("r.\"%s\"" % aName for aName in aColumns), aTable)
+                aRows = StreamRows(aConnection.execute(aSql), aSheets, aRows, aTotal, theProgress)
+            # for
+        finally:
+            aSheets.Close()
+        # try
+
+        os.replace(aTempName, theFileName)
+    except:
+        RemoveFile(aTempName)
+        raise
+    finally:
+        aConnection.close()
+    # try
+
+    return len(aTables), aRows
+# ExportCatalogue
+
+def main(theArgs = None):
+    aParser = argparse.ArgumentParser(description="Export every standards table to one workbook.")
+    aParser.add_argument("database", help="catalogue database")
+    aParser.add_argument("file", help="Excel (.xlsx) workbook")
+    aArgs = aParser.parse_args(theArgs)
+
+    aStartTime = time.perf_counter()
+    aTables, aRows = ExportCatalogue(aArgs.database, aArgs.file)
+    aSeconds = time.perf_counter() - aStartTime
+
+    print("Exported %d rows from %d tables in %.2fs (%.0f rows/s)" % (aRows, aTables, aSeconds, aRows / aSeconds if aSeconds > 0 else 0.0))
+
+    return 0
+# main
+
+if __name__ == "__main__":
+    sys.exit(main())
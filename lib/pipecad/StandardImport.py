@@ -0,0 +1,275 @@
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# :: Welcome to PipeCAD!                                      ::
+# ::  ____                        ____     ______  ____       ::
+# :: /\  _`\   __                /\  _`\  /\  _  \/\  _`\     ::
+# :: \ \ \L\ \/\_\  _____      __\ \ \/\_\\ \ \L\ \ \ \/\ \   ::
+# ::  \ \ ,__/\/\ \/\ '__`\  /'__`\ \ \/_/_\ \  __ \ \ \ \ \  ::
+# ::   \ \ \/  \ \ \ \ \L\ \/\  __/\ \ \L\ \\ \ \/\ \ \ \_\ \ ::
+# ::    \ \_\   \ \_\ \ ,__/\ \____\\ \____/ \ \_\ \_\ \____/ ::
+# ::     \/_/    \/_/\ \ \/  \/____/ \/___/   \/_/\/_/\/___/  ::
+# ::                  \ \_\                                   ::
+# ::                   \/_/                                   ::
+# ::                                                          ::
+# ::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::::
+# PipeCAD - Piping Design Software.
+# Copyright (C) 2021 Wuhan OCADE IT. Co., Ltd.
+# Bulk import of standard records, no PythonQt dependency.
+# The rows of a spreadsheet are checked and coerced column by column in
+# pandas against the schema of the target table, then inserted through one
+# prepared statement with executemany inside a single transaction. Rows
+# that cannot be stored are left out and reported with the reason.
+#
+#   python -m pipecad.StandardImport catalogues/PipeStd.db ELBW 12 elbow.xlsx
+# imports a file into the records of one standard and prints the report.
+
+import sys
+import time
+import sqlite3
+import argparse
+
+import pandas as pd
+
+# Rows per executemany call, progress is reported between batches.
+IMPORT_BATCH_SIZE = 5000
+
+# Rejection reasons listed in the report, the rest are only counted.
+IMPORT_REASON_LIMIT = 20
+
+
+class ImportReport(object):
+    def __init__(self, theTable):
+        self.table = theTable
+        self.total = 0
+        self.rows = 0
+        self.rejected = []
+        self.ignored = []
+        self.seconds = 0.0
+    # __init__
+
+    def Rate(self):
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+    # Rate
+
+    def Summary(self):
+        aLines = ["Imported %d of %d rows into %s in %.2fs (%.0f rows/s), %d rejected." % (self.rows, self.total, self.table, self.seconds, self.Rate(), len(self.rejected))]
+        if len(self.ignored) > 0:
+            aLines.append("Ignored columns: " + ", ".join(self.ignored))
+        # if
+
+        for aRow, aReason in self.rejected[:IMPORT_REASON_LIMIT]:
+            aLines.append("Row %d: %s" % (aRow, aReason))
+        # for
+
+        if len(self.rejected) > IMPORT_REASON_LIMIT:
+            aLines.append("... %d more" % (len(self.rejected) - IMPORT_REASON_LIMIT))
+        # if
+
+        return "\n".join(aLines)
+    # Summary
+# ImportReport
+
+def ReadRecords(theFileName):
+    if theFileName.endswith(".xlsx"):
+        return pd.read_excel(theFileName)
+    elif theFileName.endswith(".csv"):
+        return pd.read_csv(theFileName)
+    # if
+
+    raise ValueError("Unsupported file type: " + theFileName)
+# ReadRecords
+
+def TableSchema(theConnection, theTable):
+    """Return the columns of a table as [(name, affinity, not null)]
+    and the single columns with a UNIQUE constraint."""
+
+    aColumns = []
+    for aRow in theConnection.execute("PRAGMA table_info(\"%s\")" % theTable):
+        aType = (aRow[2] or "").upper()
+        if "INT" in aType:
+            aAffinity = "INTEGER"
+        elif "REAL" in aType or "FLOA" in aType or "DOUB" in aType:
+            aAffinity = "REAL"
+        else:
+            aAffinity = "TEXT"
+        # if
+
+        aColumns.append((aRow[1], aAffinity, aRow[3] != 0))
+    # for
+
+    if len(aColumns) < 1:
+        raise ValueError("No table " + theTable)
+    # if
+
+    aUniques = []
+    for aIndex in theConnection.execute("PRAGMA index_list(\"%s\")" % theTable).fetchall():
+        if aIndex[2]:
+            aNames = [aRow[2] for aRow in theConnection.execute("PRAGMA index_info(\"%s\")" % aIndex[1])]
+            if len(aNames) == 1:
+                aUniques.append(aNames[0])
+            # if
+        # if
+    # for
+
+    return aColumns, aUniques
+# TableSchema
+
+def CoerceText(theSeries):
+    # Whole numbers read as float because of empty cells keep their integer text.
+    if pd.api.types.is_float_dtype(theSeries):
+        aWhole = theSeries.notna() & (theSeries % 1 == 0)
+        aText = theSeries.astype(object).where(theSeries.notna(), None)
+        aText[aWhole] = theSeries[aWhole].astype("int64").astype(str)
+        aText[theSeries.notna() & ~aWhole] = theSeries[theSeries.notna() & ~aWhole].astype(str)
+        return aText
+    # if
+
+    aText = theSeries.astype(str).str.strip()
+    return aText.where(theSeries.notna() & (aText != ""), None)
+# CoerceText
+
+def CoerceRecords(theDataFrame, theColumns, theUniques, thePid, theExisting = None):
+    """Match the file columns to the table schema and coerce the values.
+
+    Returns the frame of storable rows in table column order, the rejected
+    rows as [(file row, reason)] and the file columns that were ignored.
+    """
+
+    aFileColumns = dict((str(aName).strip().lower(), aName) for aName in theDataFrame.columns)
+    aKnown = set(aName.lower() for aName, aAffinity, aNotNull in theColumns)
+    aIgnored = [str(aName) for aKey, aName in aFileColumns.items() if aKey not in aKnown or aKey in ("id", "pid")]
+
+    aRecords = pd.DataFrame(index=theDataFrame.index)
+    aReasons = pd.Series("", index=theDataFrame.index, dtype=object)
+
+    for aName, aAffinity, aNotNull in theColumns:
+        aKey = aName.lower()
+        if aKey == "id":
+            continue
+        elif aKey == "pid":
+            aRecords[aName] = thePid
+            continue
+        # if
+
+        if aKey not in aFileColumns:
+            if aNotNull:
+                raise ValueError("Missing column " + aName)
+            # if
+
+            aRecords[aName] = None
+            continue
+        # if
+
+        aSource = theDataFrame[aFileColumns[aKey]]
+        aMissing = aSource.isna()
+        if aSource.dtype == object:
+            aMissing = aMissing | (aSource.astype(str).str.strip() == "")
+        # if
+
+        if aAffinity == "TEXT":
+            aValues = CoerceText(aSource)
+        else:
+            aValues = pd.to_numeric(aSource, errors="coerce")
+            aInvalid = aValues.isna() & ~aMissing
+            if aAffinity == "INTEGER":
+                aInvalid = aInvalid | (aValues.notna() & (aValues % 1 != 0))
+            # if
+            aReasons[aInvalid] += aName + " is not a number; "
+            aValues = aValues.astype(object).where(aValues.notna(), None)
+            if aAffinity == "INTEGER":
+                aValues = aValues.map(lambda v: v if v is None else int(v))
+            # if
+        # if
+
+        if aNotNull:
+            aReasons[aMissing] += aName + " is empty; "
+        # if
+
+        aRecords[aName] = aValues
+    # for
+
+    for aName in theUniques:
+        if aName not in aRecords.columns or aName.lower() in ("id", "pid"):
+            continue
+        # if
+
+        aValues = aRecords[aName]
+        aReasons[aValues.notna() & aValues.duplicated(keep="first")] += aName + " is repeated in the file; "
+        if theExisting is not None and aName in theExisting:
+            aReasons[aValues.isin(theExisting[aName])] += aName + " already exists; "
+        # if
+    # for
+
+    aRejected = aReasons != ""
+    # Spreadsheet row numbers: header is row 1.
+    aRejectedRows = [(int(aRow) + 2, aReason.rstrip("; ")) for aRow, aReason in aReasons[aRejected].items()]
+
+    return aRecords[~aRejected], aRejectedRows, aIgnored
+# CoerceRecords
+
+def ImportRecords(theDatabase, theTable, thePid, theDataFrame, theProgress = None):
+    """Insert the coerced rows of a frame into a table in one transaction.
+
+    theProgress(value, maximum, text) is called between batches and may
+    raise to cancel, the transaction is then rolled back.
+    """
+
+    aReport = ImportReport(theTable)
+    aReport.total = len(theDataFrame)
+    aStartTime = time.perf_counter()
+
+    aConnection = sqlite3.connect(theDatabase, isolation_level=None)
+    try:
+        aColumns, aUniques = TableSchema(aConnection, theTable)
+
+        aExisting = dict()
+        for aName in aUniques:
+            aExisting[aName] = set(aRow[0] for aRow in aConnection.execute("SELECT \"%s\" FROM \"%s\"" % (aName, theTable)))
+        # for
+
+        aRecords, aReport.rejected, aReport.ignored = CoerceRecords(theDataFrame, aColumns, aUniques, thePid, aExisting)
+
+        aNames = list(aRecords.columns)
+        aSql = "INSERT INTO \"%s\" (%s) VALUES (%s)" % (theTable, ", ".join("\"%s\"" % aName for aName in aNames), ", ".join("?" * len(aNames)))
+        aRows = list(aRecords.itertuples(index=False, name=None))
+
+        aConnection.execute("BEGIN IMMEDIATE")
+        try:
+            for aStart in range(0, len(aRows), IMPORT_BATCH_SIZE):
+                aConnection.executemany(aSql, aRows[aStart:aStart + IMPORT_BATCH_SIZE])
+                if theProgress is not None:
+                    aDone = min(aStart + IMPORT_BATCH_SIZE, len(aRows))
+                    theProgress(aDone, len(aRows), "Import row %d/%d" % (aDone, len(aRows)))
+                # if
+            # for
+            aConnection.execute("COMMIT")
+        except:
+            aConnection.execute("ROLLBACK")
+            raise
+        # try
+
+        aReport.rows = len(aRows)
+    finally:
+        aConnection.close()
+    # try
+
+    aReport.seconds = time.perf_counter() - aStartTime
+
+    return aReport
+# ImportRecords
+
+def main(theArgs = None):
+    aParser = argparse.ArgumentParser(description="Import standard records from a spreadsheet.")
+    aParser.add_argument("database", help="catalogue database")
+    aParser.add_argument("table", help="standard table, e.g. ELBW")
+    aParser.add_argument("pid", type=int, help="SDTE id of the standard")
+    aParser.add_argument("file", help="Excel (.xlsx) or CSV file")
+    aArgs = aParser.parse_args(theArgs)
+
+    aReport = ImportRecords(aArgs.database, aArgs.table, aArgs.pid, ReadRecords(aArgs.file))
+    print(aReport.Summary())
+
+    return 0
+# main
+
+if __name__ == "__main__":
+    sys.exit(main())
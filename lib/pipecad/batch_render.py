@@ -0,0 +1,182 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+import pyvista as pv
+
+from lib.pipecad.scene_store import (
+    VIEW_PRESETS, camera_position, load_scene, object_color, start_virtual_display,
+)
+
+# 出力ファイル名に使うプリセット名
+PRESET_FILE_NAMES = {
+    "正面": "front",
+    "上面": "top",
+    "右側面": "right",
+    "アイソメトリック": "iso",
+}
+
+SCENE_SUFFIXES = (".json", ".pcf")
+
+# PCF は mm 単位、ビューアは m 単位
+PCF_SCALE = 0.001
+
+# ワーカープロセス毎に1つだけ生成するプロッタ
+_plotter = None
+
+
+def load_pcf(path) -> dict:
+    """PCF の END-POINT から配管/部品を円柱として読み込む"""
+    objects = {}
+    points = []
+
+    def flush():
+        if len(points) >= 2:
+            (start, bore), (end, _) = points[0], points[1]
+            obj_id = f"pcf_{len(objects)}"
+            obj = {
+                "id": obj_id,
+                "type": "cylinder",
+                "name": obj_id,
+                "start_x": start[0], "start_y": start[1], "start_z": start[2],
+                "end_x": end[0], "end_y": end[1], "end_z": end[2],
+                "radius": max(bore * PCF_SCALE / 2.0, 0.001),
+            }
+            direction = np.subtract(end, start)
+            height = float(np.linalg.norm(direction))
+            if height > 0.0:
+                # PCF の END-POINT は両端なので中点を中心にする
+                center = np.add(start, end) / 2.0
+                obj["mesh"] = pv.Cylinder(center=center, direction=direction, height=height, radius=obj["radius"])
+                objects[obj_id] = obj
+        points.clear()
+
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if not line[:1].isspace():
+                # 行頭に空白の無い行が新しいレコードの開始
+                flush()
+                continue
+            fields = line.split()
+            if fields and fields[0] == "END-POINT" and len(fields) >= 5:
+                try:
+                    xyz = tuple(float(v) * PCF_SCALE for v in fields[1:4])
+                    bore = float(fields[4])
+                except ValueError:
+                    continue
+                points.append((xyz, bore))
+        flush()
+    return objects
+
+
+def load_objects(path: Path) -> dict:
+    if path.suffix.lower() == ".pcf":
+        return load_pcf(path)
+    return load_scene(path)
+
+
+def _init_worker(window_size):
+    global _plotter
+    start_virtual_display()
+    _plotter = pv.Plotter(off_screen=True, window_size=list(window_size))
+    _plotter.background_color = '#ffffff'
+
+
+def render_scene(path: str, output_dir: str) -> tuple:
+    """1つのシーンを読み込み、全プリセットの画像を書き出す
+
+    ジオメトリは色毎に1つのメッシュへまとめてからプロッタに1度だけ追加し、
+    全てのビューで再利用する。戻り値は (シーン, 画像数, エラー)。
+    """
+    path = Path(path)
+    try:
+        objects = load_objects(path)
+        _plotter.clear_actors()
+
+        meshes = {}
+        for obj in objects.values():
+            meshes.setdefault(object_color(obj), []).append(obj["mesh"])
+        for color, parts in meshes.items():
+            _plotter.add_mesh(pv.merge(parts) if len(parts) > 1 else parts[0], color=color, opacity=0.8)
+
+        count = 0
+        for preset_name, preset in VIEW_PRESETS.items():
+            # プリセットの視線方向を設定してからジオメトリ全体が収まるよう寄せる
+            _plotter.camera_position = camera_position(preset["azimuth"], preset["elevation"], 1.0)
+            if objects:
+                _plotter.reset_camera()
+            file_name = f"{path.stem}_{PRESET_FILE_NAMES.get(preset_name, preset_name)}.png"
+            _plotter.screenshot(str(Path(output_dir) / file_name))
+            count += 1
+        return str(path), count, None
+    except Exception as e:
+        return str(path), 0, f"{type(e).__name__}: {e}"
+
+
+def collect_scenes(inputs) -> list:
+    scenes = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            scenes.extend(sorted(p for p in path.rglob("*") if p.suffix.lower() in SCENE_SUFFIXES))
+        elif path.suffix.lower() in SCENE_SUFFIXES:
+            scenes.append(path)
+    return scenes
+
+
+def render_batch(scenes, output_dir, workers=None, window_size=(800, 600)) -> dict:
+    """シーンをプロセスプールで並列にレンダリングする"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    images = 0
+    errors = []
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tuple(window_size),)) as pool:
+        futures = [pool.submit(render_scene, str(scene), str(output_dir)) for scene in scenes]
+        for done, future in enumerate(as_completed(futures), 1):
+            scene, count, error = future.result()
+            images += count
+            if error:
+                errors.append((scene, error))
+                print(f"[{done}/{len(futures)}] {scene}: {error}")
+            else:
+                print(f"[{done}/{len(futures)}] {scene}: {count} images")
+    elapsed = time.perf_counter() - started
+
+    return {
+        "scenes": len(scenes),
+        "images": images,
+        "errors": errors,
+        "seconds": elapsed,
+        "images_per_second": images / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="シーン/PCF のビュープリセット画像を一括レンダリングする")
+    parser.add_argument("inputs", nargs="+", help="シーン (.json) / PCF (.pcf) ファイルまたはディレクトリ")
+    parser.add_argument("-o", "--output", default="renders", help="画像の出力先ディレクトリ")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="ワーカープロセス数 (既定: CPU数)")
+    parser.add_argument("--size", default="800x600", help="画像サイズ (幅x高さ)")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    scenes = collect_scenes(args.inputs)
+    if not scenes:
+        parser.error("No scene or PCF files found")
+
+    result = render_batch(scenes, args.output, args.workers, (width, height))
+    print(
+        f"Rendered {result['images']} images from {result['scenes']} scenes "
+        f"in {result['seconds']:.2f}s ({result['images_per_second']:.1f} images/s), "
+        f"{len(result['errors'])} failed"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+import json
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pyvista as pv
+
+# glTF 2.0 バイナリ (.glb) の定数
+GLB_MAGIC = 0x46546C67  # "glTF"
+GLB_VERSION = 2
+CHUNK_JSON = 0x4E4F534A  # "JSON"
+CHUNK_BIN = 0x004E4942  # "BIN\0"
+
+# アクセサの componentType
+BYTE = 5120
+SHORT = 5122
+UNSIGNED_SHORT = 5123
+UNSIGNED_INT = 5125
+FLOAT = 5126
+
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+
+# ビューアと同じ配色 (RGBA, 不透明度 0.8)
+TYPE_COLORS = {
+    "cube": (0.0, 0.0, 1.0, 0.8),
+    "cylinder": (1.0, 0.0, 0.0, 0.8),
+}
+DEFAULT_COLOR = (0.5, 0.5, 0.5, 0.8)
+
+COPY_BLOCK_SIZE = 1 << 20
+
+
+def _instance_key(obj: dict) -> tuple:
+    """同一形状を共有できるオブジェクトは同じキーを返す"""
+    if obj["type"] == "cube":
+        return ("cube", round(float(obj["size"]), 6))
+    if obj["type"] == "cylinder":
+        start = np.array((obj["start_x"], obj["start_y"], obj["start_z"]), dtype=float)
+        end = np.array((obj["end_x"], obj["end_y"], obj["end_z"]), dtype=float)
+        height = float(np.linalg.norm(end - start))
+        return ("cylinder", round(float(obj["radius"]), 6), round(height, 6))
+    # パラメトリックでない形状はインスタンス化しない
+    return ("mesh", obj["id"])
+
+
+def _canonical_mesh(key: tuple, obj: dict) -> pv.PolyData:
+    """原点に置かれた共有メッシュを生成する"""
+    if key[0] == "cube":
+        size = key[1]
+        return pv.Cube(center=(0, 0, 0), x_length=size, y_length=size, z_length=size)
+    if key[0] == "cylinder":
+        return pv.Cylinder(center=(0, 0, 0), direction=(0, 0, 1), radius=key[1], height=key[2])
+    return obj["mesh"]
+
+
+def _rotation_to(direction: np.ndarray) -> np.ndarray:
+    """Z軸を direction に向ける回転行列"""
+    length = np.linalg.norm(direction)
+    if length == 0.0:
+        return np.eye(3)
+    z = direction / length
+    axis = np.cross((0.0, 0.0, 1.0), z)
+    sin = np.linalg.norm(axis)
+    cos = z[2]
+    if sin < 1e-12:
+        return np.eye(3) if cos > 0 else np.diag((1.0, -1.0, -1.0))
+    axis = axis / sin
+    k = np.array([
+        [0.0, -axis[2], axis[1]],
+        [axis[2], 0.0, -axis[0]],
+        [-axis[1], axis[0], 0.0],
+    ])
+    return np.eye(3) + sin * k + (1.0 - cos) * (k @ k)
+
+
+def _instance_matrix(key: tuple, obj: dict) -> np.ndarray:
+    """インスタンスのワールド変換 (4x4)"""
+    matrix = np.eye(4)
+    if key[0] == "cube":
+        matrix[:3, 3] = (obj["position_x"], obj["position_y"], obj["position_z"])
+    elif key[0] == "cylinder":
+        start = np.array((obj["start_x"], obj["start_y"], obj["start_z"]), dtype=float)
+        end = np.array((obj["end_x"], obj["end_y"], obj["end_z"]), dtype=float)
+        matrix[:3, :3] = _rotation_to(end - start)
+        # ビューアは start をシリンダー中心として生成している
+        matrix[:3, 3] = start
+    return matrix
+
+
+class _BinaryChunk:
+    """BIN チャンクを一時ファイルへ逐次書き出す"""
+
+    def __init__(self):
+        self.file = tempfile.TemporaryFile()
+        self.length = 0
+        self.buffer_views = []
+
+    def add(self, data: bytes, target: int, byte_stride: int = None) -> int:
+        # bufferView は4バイト境界に揃える
+        padding = (-self.length) % 4
+        if padding:
+            self.file.write(b"\x00" * padding)
+            self.length += padding
+        view = {"buffer": 0, "byteOffset": self.length, "byteLength": len(data), "target": target}
+        if byte_stride is not None:
+            view["byteStride"] = byte_stride
+        self.file.write(data)
+        self.length += len(data)
+        self.buffer_views.append(view)
+        return len(self.buffer_views) - 1
+
+    def close(self):
+        self.file.close()
+
+
+class _GlbBuilder:
+    def __init__(self, quantize: bool):
+        self.quantize = quantize
+        self.binary = _BinaryChunk()
+        self.accessors = []
+        self.meshes = []
+        self.materials = []
+        self.nodes = []
+        self.mesh_index = {}
+        self.material_index = {}
+        # メッシュ毎の量子化パラメータ (中心, スケール)
+        self.dequantize = {}
+
+    def material(self, color: tuple) -> int:
+        if color not in self.material_index:
+            self.material_index[color] = len(self.materials)
+            self.materials.append({
+                "pbrMetallicRoughness": {
+                    "baseColorFactor": list(color),
+                    "metallicFactor": 0.0,
+                    "roughnessFactor": 0.8,
+                },
+                "alphaMode": "BLEND" if color[3] < 1.0 else "OPAQUE",
+            })
+        return self.material_index[color]
+
+    def accessor(self, view: int, component_type: int, count: int, type_name: str, normalized=False, bounds=None) -> int:
+        accessor = {"bufferView": view, "componentType": component_type, "count": count, "type": type_name}
+        if normalized:
+            accessor["normalized"] = True
+        if bounds is not None:
+            accessor["min"], accessor["max"] = bounds
+        self.accessors.append(accessor)
+        return len(self.accessors) - 1
+
+    def mesh(self, key: tuple, color: tuple, source: pv.PolyData) -> int:
+        mesh_key = (key, color)
+        if mesh_key in self.mesh_index:
+            return self.mesh_index[mesh_key]
+
+        surface = source if isinstance(source, pv.PolyData) else source.extract_surface()
+        surface = surface.triangulate().compute_normals(
+            cell_normals=False, split_vertices=True, auto_orient_normals=False
+        )
+        points = np.asarray(surface.points, dtype=np.float64)
+        normals = np.asarray(surface.point_data["Normals"], dtype=np.float64)
+        triangles = np.asarray(surface.faces).reshape(-1, 4)[:, 1:]
+
+        attributes = {}
+        if self.quantize:
+            low = points.min(axis=0)
+            high = points.max(axis=0)
+            center = (low + high) / 2.0
+            # 法線が歪まないように等方スケールを使う
+            scale = float(np.max(high - low) / 2.0) or 1.0
+            quantized = np.round((points - center) / scale * 32767.0).astype(np.int16)
+            # VEC3 の SHORT は 4 バイト境界に揃えるため 8 バイトストライド
+            padded = np.zeros((len(quantized), 4), dtype=np.int16)
+            padded[:, :3] = quantized
+            view = self.binary.add(padded.tobytes(), ARRAY_BUFFER, byte_stride=8)
+            attributes["POSITION"] = self.accessor(
+                view, SHORT, len(points), "VEC3", normalized=True,
+                bounds=(quantized.min(axis=0).tolist(), quantized.max(axis=0).tolist()),
+            )
+            packed = np.zeros((len(normals), 4), dtype=np.int8)
+            packed[:, :3] = np.round(np.clip(normals, -1.0, 1.0) * 127.0)
+            view = self.binary.add(packed.tobytes(), ARRAY_BUFFER, byte_stride=4)
+            attributes["NORMAL"] = self.accessor(view, BYTE, len(normals), "VEC3", normalized=True)
+            self.dequantize[len(self.meshes)] = (center, scale)
+        else:
+            positions = points.astype(np.float32)
+            view = self.binary.add(positions.tobytes(), ARRAY_BUFFER)
+            attributes["POSITION"] = self.accessor(
+                view, FLOAT, len(points), "VEC3",
+                bounds=(positions.min(axis=0).tolist(), positions.max(axis=0).tolist()),
+            )
+            view = self.binary.add(normals.astype(np.float32).tobytes(), ARRAY_BUFFER)
+            attributes["NORMAL"] = self.accessor(view, FLOAT, len(normals), "VEC3")
+
+        if len(points) < 65536:
+            indices = triangles.astype(np.uint16)
+            component_type = UNSIGNED_SHORT
+        else:
+            indices = triangles.astype(np.uint32)
+            component_type = UNSIGNED_INT
+        view = self.binary.add(indices.tobytes(), ELEMENT_ARRAY_BUFFER)
+        index_accessor = self.accessor(view, component_type, indices.size, "SCALAR")
+
+        self.meshes.append({
+            "name": "_".join(str(part) for part in key),
+            "primitives": [{
+                "attributes": attributes,
+                "indices": index_accessor,
+                "material": self.material(color),
+            }],
+        })
+        self.mesh_index[mesh_key] = len(self.meshes) - 1
+        return self.mesh_index[mesh_key]
+
+    def node(self, name: str, mesh: int, matrix: np.ndarray):
+        if mesh in self.dequantize:
+            center, scale = self.dequantize[mesh]
+            dequantize = np.eye(4)
+            dequantize[:3, :3] *= scale
+            dequantize[:3, 3] = center
+            matrix = matrix @ dequantize
+        node = {"name": name, "mesh": mesh}
+        if not np.allclose(matrix, np.eye(4)):
+            # glTF は列優先
+            node["matrix"] = matrix.T.reshape(-1).tolist()
+        self.nodes.append(node)
+
+    def document(self) -> dict:
+        scene = {}
+        if self.nodes:
+            scene["nodes"] = list(range(len(self.nodes)))
+        document = {
+            "asset": {"version": "2.0", "generator": "CAD-AI glTF exporter"},
+            "scene": 0,
+            "scenes": [scene],
+        }
+        # glTF の配列は空を許さず、buffer の byteLength は 1 以上が必要なので
+        # 空のシーン (何も選択していない場合など) では省略する
+        for key, value in (
+            ("nodes", self.nodes),
+            ("meshes", self.meshes),
+            ("materials", self.materials),
+            ("accessors", self.accessors),
+            ("bufferViews", self.binary.buffer_views),
+        ):
+            if value:
+                document[key] = value
+        if self.binary.length > 0:
+            document["buffers"] = [{"byteLength": self.binary.length}]
+        if self.quantize and self.meshes:
+            document["extensionsUsed"] = ["KHR_mesh_quantization"]
+            document["extensionsRequired"] = ["KHR_mesh_quantization"]
+        return document
+
+    def write(self, stream) -> int:
+        json_chunk = json.dumps(self.document(), separators=(",", ":")).encode("utf-8")
+        json_chunk += b" " * ((-len(json_chunk)) % 4)
+        bin_padding = (-self.binary.length) % 4
+        bin_length = self.binary.length + bin_padding
+        total = 12 + 8 + len(json_chunk)
+        if bin_length > 0:
+            total += 8 + bin_length
+
+        stream.write(struct.pack("<III", GLB_MAGIC, GLB_VERSION, total))
+        stream.write(struct.pack("<II", len(json_chunk), CHUNK_JSON))
+        stream.write(json_chunk)
+        if bin_length == 0:
+            # ジオメトリが無い場合は BIN チャンクを書かない
+            return total
+        stream.write(struct.pack("<II", bin_length, CHUNK_BIN))
+        # BIN チャンクは一時ファイルからブロック単位でコピーする
+        self.binary.file.seek(0)
+        shutil.copyfileobj(self.binary.file, stream, COPY_BLOCK_SIZE)
+        stream.write(b"\x00" * bin_padding)
+        return total
+
+
+def export_glb(objects: dict, target, object_ids=None, quantize: bool = True) -> dict:
+    """シーンのオブジェクトをバイナリ glTF (.glb) に書き出す
+
+    同一形状のプリミティブは1つのメッシュを共有するノードとして出力し、
+    quantize=True の場合は KHR_mesh_quantization で頂点を整数化する。
+    ジオメトリは一時ファイルに逐次書き出すため、巨大なシーンでもメモリ使用量は
+    JSON 部分に比例する。target にはパスか書き込み可能なバイナリストリームを渡す。
+    object_ids を指定するとそのオブジェクトだけを書き出す (選択のみの出力)。
+    """
+    builder = _GlbBuilder(quantize)
+    try:
+        ids = objects.keys() if object_ids is None else [i for i in object_ids if i in objects]
+        for obj_id in ids:
+            obj = objects[obj_id]
+            key = _instance_key(obj)
+            color = TYPE_COLORS.get(obj["type"], DEFAULT_COLOR)
+            mesh = builder.mesh(key, color, _canonical_mesh(key, obj))
+            builder.node(obj.get("name", obj_id), mesh, _instance_matrix(key, obj))
+
+        if hasattr(target, "write"):
+            size = builder.write(target)
+        else:
+            with open(Path(target), "wb") as stream:
+                size = builder.write(stream)
+
+        return {
+            "nodes": len(builder.nodes),
+            "meshes": len(builder.meshes),
+            "bytes": size,
+        }
+    finally:
+        builder.binary.close()
@@ -1,17 +1,27 @@
+import argparse
+import uuid
 import flet as ft
 from pathlib import Path
 from .viewer import Viewer3D
+from .scene_store import SceneStore, save_scene
 from .property_panel import PropertyPanel
 from .object_list import ObjectListPanel
 from .settings_panel import SettingsPanel
 
-def main():
+def main(server: bool = False, port: int = 8550):
+    # サーバーモードでは全セッションが1つのシーンを共有する
+    shared_scene = SceneStore() if server else None
+
     def page_setup(page: ft.Page):
         page.title = "CAD-AI"
         page.theme_mode = ft.ThemeMode.SYSTEM
         page.padding = 10
         
-        viewer = Viewer3D()
+        if shared_scene is not None:
+            viewer = Viewer3D(scene=shared_scene, session_id=uuid.uuid4().hex[:8])
+            page.on_disconnect = lambda _: viewer.close()
+        else:
+            viewer = Viewer3D()
         
         # キーボードイベントハンドラを設定
         page.on_keyboard_event = viewer.handle_key
@@ -36,14 +46,46 @@ def main():
         def create_new_project():
             # 新規プロジェクト作成の処理
             print("新規プロジェクトが作成されました")
-            # ビューアをリセット
-            viewer.objects.clear()
-            viewer.initialize_plotter()  # plotterを再初期化
+            # ビューアをリセット (共有シーンの場合は全セッションに通知される)
+            viewer.command_history.clear()
+            viewer.scene.reset(origin=viewer)
             page.update()
 
         def add_sample_geometry(_):
-            viewer.add_cube(position=(1, 1, 0))
-            viewer.add_cylinder(start=(0, 0, 0), end=(0, 0, 2))
+            viewer.create_object("cube", {"x": 1, "y": 1, "z": 0})
+            viewer.create_object("cylinder", {
+                "start_x": 0, "start_y": 0, "start_z": 0,
+                "end_x": 0, "end_y": 0, "end_z": 2,
+            })
+
+        def on_save_result(e: ft.FilePickerResultEvent):
+            if e.path:
+                save_scene(viewer.objects, e.path)
+                print(f"Scene saved to {e.path}")
+
+        save_picker = ft.FilePicker(on_result=on_save_result)
+        page.overlay.append(save_picker)
+
+        # glTF書き出し (選択のみ出力するかどうかを保持)
+        export_options = {"selection_only": False}
+
+        def on_export_result(e: ft.FilePickerResultEvent):
+            if not e.path:
+                return
+            path = e.path if e.path.lower().endswith(".glb") else e.path + ".glb"
+            stats = viewer.export_glb(path, selection_only=export_options["selection_only"])
+            print(f"Exported {stats['nodes']} nodes / {stats['meshes']} meshes to {path}")
+
+        export_picker = ft.FilePicker(on_result=on_export_result)
+        page.overlay.append(export_picker)
+
+        def export_glb(selection_only: bool):
+            export_options["selection_only"] = selection_only
+            export_picker.save_file(
+                dialog_title="glTF書き出し",
+                file_name="scene.glb",
+                allowed_extensions=["glb"],
+            )
 
         def toggle_3d_view(_):
             if content_area.content == viewer:
@@ -58,7 +100,11 @@ def main():
                 ft.IconButton(
                     icon=ft.Icons.SAVE,
                     tooltip="保存",
-                    on_click=lambda _: print("Save")
+                    on_click=lambda _: save_picker.save_file(
+                        dialog_title="保存",
+                        file_name="scene.json",
+                        allowed_extensions=["json"],
+                    )
                 ),
                 ft.VerticalDivider(width=1),
                 ft.IconButton(
@@ -93,6 +139,16 @@ def main():
                     tooltip="3Dビュー",
                     on_click=toggle_3d_view
                 ),
+                ft.IconButton(
+                    icon=ft.Icons.FILE_DOWNLOAD,
+                    tooltip="glTF書き出し",
+                    on_click=lambda _: export_glb(False)
+                ),
+                ft.IconButton(
+                    icon=ft.Icons.HIGHLIGHT_ALT,
+                    tooltip="選択をglTF書き出し",
+                    on_click=lambda _: export_glb(True)
+                ),
                 ft.IconButton(
                     icon=ft.Icons.ADD_BOX,
                     tooltip="サンプル形状追加",
@@ -155,6 +211,7 @@ def main():
             on_property_change=lambda obj_id, prop, value: viewer.update_object_property(obj_id, prop, value)
         )
         viewer.on_selection_change = property_panel.update_object
+        viewer.on_scene_change = lambda _: object_list.page and object_list.update_objects(viewer.objects)
 
         settings_panel = SettingsPanel(viewer)
 
@@ -214,7 +271,14 @@ def main():
         page.add(main_layout)
         page.update()
 
-    ft.app(target=page_setup)
+    if server:
+        ft.app(target=page_setup, view=ft.AppView.WEB_BROWSER, port=port)
+    else:
+        ft.app(target=page_setup)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="CAD-AI")
+    parser.add_argument("--server", action="store_true", help="複数のブラウザセッションでシーンを共有するサーバーモード")
+    parser.add_argument("--port", type=int, default=8550)
+    args = parser.parse_args()
+    main(server=args.server, port=args.port)
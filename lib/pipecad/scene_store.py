@@ -0,0 +1,227 @@
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+import pyvista as pv
+
+# ビュープリセット (方位角, 仰角)
+VIEW_PRESETS = {
+    "正面": {"azimuth": 0, "elevation": 0},
+    "上面": {"azimuth": 0, "elevation": 90},
+    "右側面": {"azimuth": 90, "elevation": 0},
+    "アイソメトリック": {"azimuth": 45, "elevation": 35.264},  # arctan(1/√2)
+}
+
+TYPE_COLORS = {
+    "cube": "blue",
+    "cylinder": "red",
+}
+SELECTED_COLOR = "yellow"
+GRID_ACTOR = "__grid__"
+
+
+def start_virtual_display() -> None:
+    """ディスプレイの無い Linux では X Virtual Framebuffer を開始する"""
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY") and hasattr(pv, "start_xvfb"):
+        pv.start_xvfb()
+
+
+def object_color(obj: dict) -> str:
+    return TYPE_COLORS.get(obj["type"], "gray")
+
+
+def build_mesh(obj: dict) -> pv.PolyData:
+    """オブジェクトのパラメータからメッシュを生成する"""
+    if obj["type"] == "cube":
+        position = (obj["position_x"], obj["position_y"], obj["position_z"])
+        return pv.Cube(center=position, x_length=obj["size"], y_length=obj["size"], z_length=obj["size"])
+    if obj["type"] == "cylinder":
+        start = (obj["start_x"], obj["start_y"], obj["start_z"])
+        end = (obj["end_x"], obj["end_y"], obj["end_z"])
+        direction = np.array(end) - np.array(start)
+        height = np.linalg.norm(direction)
+        return pv.Cylinder(center=start, direction=direction, height=height, radius=obj["radius"])
+    raise ValueError(f"Unknown object type: {obj['type']}")
+
+
+def camera_position(azimuth: float, elevation: float, distance: float, focal_point=(0, 0, 0)) -> list:
+    """球面座標からカメラ位置を計算する"""
+    x = distance * np.cos(np.radians(elevation)) * np.cos(np.radians(azimuth))
+    y = distance * np.cos(np.radians(elevation)) * np.sin(np.radians(azimuth))
+    z = distance * np.sin(np.radians(elevation))
+    fx, fy, fz = focal_point
+    # 真上/真下から見る場合は視線と平行にならないよう Y 軸を上にする
+    view_up = (0, 1, 0) if abs(elevation) >= 89.9 else (0, 0, 1)
+    return [(fx + x, fy + y, fz + z), tuple(focal_point), view_up]
+
+
+def save_scene(objects: dict, path) -> None:
+    """オブジェクトのパラメータを JSON で保存する (メッシュは保存しない)"""
+    data = [{k: v for k, v in obj.items() if k != "mesh"} for obj in objects.values()]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "objects": data}, f, ensure_ascii=False, indent=1)
+
+
+def load_scene(path) -> dict:
+    """save_scene で保存したシーンを読み込み、メッシュを再生成する"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    objects = {}
+    for obj in data["objects"]:
+        obj["mesh"] = build_mesh(obj)
+        objects[obj["id"]] = obj
+    return objects
+
+
+class SceneStore:
+    """複数のビューアで共有するシーン
+
+    オブジェクト、メッシュ、オフスクリーンプロッタはストアに1つだけ持ち、
+    カメラと選択はビューア (セッション) 側で保持する。レンダリングはロックの下で
+    セッションのカメラと選択を適用してから行うため、ビューアを追加しても
+    プロッタやメッシュは複製されない。
+    編集はデルタ (add / remove / update / grid / reset) として購読者に通知される。
+    """
+
+    def __init__(self, window_size=(800, 600)):
+        self.objects = {}  # id: {object_data}
+        self.plotter = None
+        self.window_size = list(window_size)
+        self.grid_size = 10
+        self.grid_spacing = 1.0
+        self.lock = threading.RLock()
+        self._listeners = []
+
+    # --- 購読 ---
+
+    def subscribe(self, listener) -> None:
+        with self.lock:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener) -> None:
+        with self.lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    @property
+    def session_count(self) -> int:
+        return len(self._listeners)
+
+    def _broadcast(self, delta: dict, origin=None) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(delta, origin)
+            except Exception as e:
+                print(f"Error broadcasting scene delta: {e}")
+
+    # --- プロッタ ---
+
+    def initialize_plotter(self) -> bool:
+        with self.lock:
+            if self.plotter is not None:
+                return True
+            try:
+                # オフスクリーンレンダリングを使用
+                start_virtual_display()
+                self.plotter = pv.Plotter(off_screen=True, window_size=self.window_size)
+                self.plotter.background_color = '#ffffff'
+
+                self._add_grid()
+
+                # 座標軸の追加
+                self.plotter.add_axes()
+
+                for obj_id, obj in self.objects.items():
+                    self.plotter.add_mesh(obj["mesh"], color=object_color(obj), opacity=0.8, name=obj_id)
+
+                print("Plotter initialized successfully")
+                return True
+            except Exception as e:
+                print(f"Error initializing plotter: {e}")
+                self.plotter = None
+                return False
+
+    def _add_grid(self) -> None:
+        extent = self.grid_size * self.grid_spacing
+        grid = pv.Plane(i_size=extent, j_size=extent, i_resolution=self.grid_size, j_resolution=self.grid_size)
+        self.plotter.add_mesh(grid, color='gray', opacity=0.5, name=GRID_ACTOR)
+
+    def render(self, path, camera, selected_id=None, grid_visible=True) -> bool:
+        """セッションのカメラと選択を適用してスクリーンショットを保存する"""
+        with self.lock:
+            if self.plotter is None:
+                return False
+            actors = self.plotter.actors
+            selected = actors.get(selected_id) if selected_id in self.objects else None
+            grid = actors.get(GRID_ACTOR)
+            if selected is not None:
+                selected.prop.color = SELECTED_COLOR
+            if grid is not None:
+                grid.SetVisibility(grid_visible)
+            try:
+                self.plotter.camera_position = camera
+                self.plotter.screenshot(str(path))
+            finally:
+                if selected is not None:
+                    selected.prop.color = object_color(self.objects[selected_id])
+                if grid is not None:
+                    grid.SetVisibility(True)
+            return True
+
+    # --- 編集 (デルタ通知) ---
+
+    def add_object(self, obj: dict, origin=None) -> str:
+        with self.lock:
+            obj_id = obj["id"]
+            if "mesh" not in obj:
+                obj["mesh"] = build_mesh(obj)
+            self.objects[obj_id] = obj
+            if self.plotter is not None:
+                self.plotter.add_mesh(obj["mesh"], color=object_color(obj), opacity=0.8, name=obj_id)
+        self._broadcast({"op": "add", "id": obj_id}, origin)
+        return obj_id
+
+    def remove_object(self, obj_id: str, origin=None) -> bool:
+        with self.lock:
+            if obj_id not in self.objects:
+                return False
+            del self.objects[obj_id]
+            if self.plotter is not None:
+                self.plotter.remove_actor(obj_id)
+        self._broadcast({"op": "remove", "id": obj_id}, origin)
+        return True
+
+    def update_object(self, obj_id: str, changes: dict, origin=None) -> bool:
+        with self.lock:
+            obj = self.objects.get(obj_id)
+            if obj is None:
+                return False
+            candidate = dict(obj)
+            candidate.update(changes)
+            mesh = build_mesh(candidate)
+            obj.update(changes)
+            obj["mesh"] = mesh
+            if self.plotter is not None:
+                self.plotter.add_mesh(mesh, color=object_color(obj), opacity=0.8, name=obj_id)
+        self._broadcast({"op": "update", "id": obj_id, "changes": changes}, origin)
+        return True
+
+    def set_grid(self, size: int = None, spacing: float = None, origin=None) -> None:
+        with self.lock:
+            if size is not None:
+                self.grid_size = max(2, min(50, size))
+            if spacing is not None:
+                self.grid_spacing = max(0.1, min(10.0, spacing))
+            if self.plotter is not None:
+                self._add_grid()
+        self._broadcast({"op": "grid", "size": self.grid_size, "spacing": self.grid_spacing}, origin)
+
+    def reset(self, origin=None) -> None:
+        with self.lock:
+            for obj_id in list(self.objects):
+                if self.plotter is not None:
+                    self.plotter.remove_actor(obj_id)
+            self.objects.clear()
+        self._broadcast({"op": "reset"}, origin)
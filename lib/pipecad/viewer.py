@@ -3,7 +3,11 @@ import numpy as np
 from pathlib import Path
 import flet as ft
 import uuid
+import base64
+import tempfile
 from lib.pipecad.commands import CommandHistory, AddObjectCommand, DeleteObjectCommand, DuplicateObjectCommand
+from lib.pipecad.gltf_export import export_glb
+from lib.pipecad.scene_store import SceneStore, VIEW_PRESETS, camera_position
 
 # PyVistaのグローバル設定
 pv.global_theme.background = 'white'
@@ -11,65 +15,76 @@ pv.global_theme.window_size = [800, 600]
 pv.global_theme.smooth_shading = True
 
 class Viewer3D(ft.UserControl):
-    def __init__(self):
+    def __init__(self, scene: SceneStore = None, session_id: str = None):
         super().__init__()
-        self.plotter = None
-        self.screenshot_path = Path("temp_screenshot.png")
+        # scene を渡すと他のビューアとシーンを共有する (サーバーモード)
+        self.scene = scene if scene is not None else SceneStore()
+        self.session_id = session_id
+        if session_id is None:
+            self.screenshot_path = Path("temp_screenshot.png")
+        else:
+            # セッション毎の画像は一時ディレクトリに置き、close() で削除する
+            self.screenshot_path = Path(tempfile.gettempdir()) / f"temp_screenshot_{session_id}.png"
+        self.image = None
         self.is_dragging = False
         self.last_x = 0
         self.last_y = 0
+        # カメラと選択はセッション毎に保持する
         self.camera_distance = 5.0
         self.azimuth = 45.0
         self.elevation = 45.0
-        self.objects = {}  # id: {object_data}
+        self.camera = camera_position(self.azimuth, self.elevation, self.camera_distance)
         self.selected_object = None
         self.on_selection_change = None
+        self.on_scene_change = None
         self.last_click_position = None
         self.command_history = CommandHistory()
         self.grid_visible = True  # グリッドの可視性を初期化
-        self.grid_size = 10
-        self.grid_spacing = 1.0
-        self.view_presets = {
-            "正面": {"azimuth": 0, "elevation": 0},
-            "上面": {"azimuth": 0, "elevation": 90},
-            "右側面": {"azimuth": 90, "elevation": 0},
-            "アイソメトリック": {"azimuth": 45, "elevation": 35.264},  # arctan(1/√2)
-        }
+        self.view_presets = dict(VIEW_PRESETS)
+        self.scene.subscribe(self.handle_scene_delta)
+
+    @property
+    def objects(self) -> dict:
+        return self.scene.objects
+
+    @property
+    def plotter(self):
+        return self.scene.plotter
+
+    @property
+    def grid_size(self) -> int:
+        return self.scene.grid_size
+
+    @property
+    def grid_spacing(self) -> float:
+        return self.scene.grid_spacing
 
     def initialize_plotter(self):
-        try:
-            # オフスクリーンレンダリングを使用
-            pv.start_xvfb()  # X Virtual Framebufferを開始
-            self.plotter = pv.Plotter(off_screen=True)
-            self.plotter.background_color = '#ffffff'
-            self.plotter.window_size = [800, 600]
-            
-            # グリッドの追加
-            grid = pv.Plane(i_size=10, j_size=10, i_resolution=10, j_resolution=10)
-            self.plotter.add_mesh(grid, color='gray', opacity=0.5)
-            
-            # 座標軸の追加
-            self.plotter.add_axes()
-            
-            self.update_camera()
-            
-            # スクリーンショットを保存
-            print(f"Saving screenshot to {self.screenshot_path}")
-            self.plotter.screenshot(str(self.screenshot_path))
-            
-            print("Plotter initialized successfully")
-            return True
-        except Exception as e:
-            print(f"Error initializing plotter: {e}")
+        # プロッタはシーンで共有し、最初のビューアが生成する
+        if not self.scene.initialize_plotter():
             return False
+        self.update_camera()
+        print(f"Saving screenshot to {self.screenshot_path}")
+        return self.scene.render(self.screenshot_path, self.camera, None, self.grid_visible)
+
+    def close(self):
+        self.scene.unsubscribe(self.handle_scene_delta)
+        if self.session_id is not None:
+            self.screenshot_path.unlink(missing_ok=True)
+
+    def handle_scene_delta(self, delta: dict, origin) -> None:
+        # 他のセッションの編集もデルタとして届く
+        if self.selected_object and self.selected_object["id"] not in self.objects:
+            self.selected_object = None
+            if self.on_selection_change:
+                self.on_selection_change(None)
+        if self.on_scene_change:
+            self.on_scene_change(delta)
+        self.update_view()
 
     def update_camera(self):
         # 球面座標からカメラ位置を計算
-        x = self.camera_distance * np.cos(np.radians(self.elevation)) * np.cos(np.radians(self.azimuth))
-        y = self.camera_distance * np.cos(np.radians(self.elevation)) * np.sin(np.radians(self.azimuth))
-        z = self.camera_distance * np.sin(np.radians(self.elevation))
-        
-        self.plotter.camera_position = [(x, y, z), (0, 0, 0), (0, 0, 1)]
+        self.camera = camera_position(self.azimuth, self.elevation, self.camera_distance)
 
     def update_view(self):
         if self.plotter is None:
@@ -77,19 +92,19 @@ class Viewer3D(ft.UserControl):
             return
         try:
             # オフスクリーンレンダリングを使用
-            self.plotter.render_offscreen = True
-            self.plotter.screenshot(str(self.screenshot_path))
+            selected_id = self.selected_object["id"] if self.selected_object else None
+            self.scene.render(self.screenshot_path, self.camera, selected_id, self.grid_visible)
             print(f"Screenshot saved to {self.screenshot_path}")
+            if self.image is not None:
+                # Web セッションでもファイルパスに依存せず表示できるようにする
+                self.image.src_base64 = base64.b64encode(self.screenshot_path.read_bytes()).decode("ascii")
             self.update()
         except Exception as e:
             print(f"Error updating view: {e}")
 
     def add_cube(self, position=(0, 0, 0), size=1.0):
         obj_id = str(uuid.uuid4())
-        cube = pv.Cube(center=position, x_length=size, y_length=size, z_length=size)
-        self.plotter.add_mesh(cube, color='blue', opacity=0.8, name=obj_id)
-        
-        self.objects[obj_id] = {
+        return self.scene.add_object({
             "id": obj_id,
             "type": "cube",
             "name": f"Cube_{len(self.objects)}",
@@ -97,25 +112,11 @@ class Viewer3D(ft.UserControl):
             "position_y": position[1],
             "position_z": position[2],
             "size": size,
-            "mesh": cube
-        }
-        
-        self.update_view()
-        command = AddObjectCommand(self, "cube", {
-            "x": position[0], "y": position[1], "z": position[2],
-            "size": size
-        })
-        self.command_history.execute(command)
-        return command.obj_id
+        }, origin=self)
 
     def add_cylinder(self, start=(0, 0, 0), end=(0, 0, 1), radius=0.5):
         obj_id = str(uuid.uuid4())
-        direction = np.array(end) - np.array(start)
-        height = np.linalg.norm(direction)
-        cylinder = pv.Cylinder(center=start, direction=direction, height=height, radius=radius)
-        self.plotter.add_mesh(cylinder, color='red', opacity=0.8, name=obj_id)
-        
-        self.objects[obj_id] = {
+        return self.scene.add_object({
             "id": obj_id,
             "type": "cylinder",
             "name": f"Cylinder_{len(self.objects)}",
@@ -126,29 +127,22 @@ class Viewer3D(ft.UserControl):
             "end_y": end[1],
             "end_z": end[2],
             "radius": radius,
-            "mesh": cylinder
-        }
-        
-        self.update_view()
-        command = AddObjectCommand(self, "cylinder", {
-            "start_x": start[0], "start_y": start[1], "start_z": start[2],
-            "end_x": end[0], "end_y": end[1], "end_z": end[2],
-            "radius": radius
-        })
+        }, origin=self)
+
+    def create_object(self, obj_type: str, params: dict):
+        # 元に戻せるようにコマンド経由で追加する
+        command = AddObjectCommand(self, obj_type, params)
         self.command_history.execute(command)
         return command.obj_id
 
     def select_object(self, obj_id):
         if obj_id in self.objects:
             self.selected_object = self.objects[obj_id]
-            # 選択オブジェクトをハイライト
-            for id, obj in self.objects.items():
-                color = 'yellow' if id == obj_id else ('blue' if obj["type"] == "cube" else 'red')
-                self.plotter.add_mesh(obj["mesh"], color=color, opacity=0.8, name=id)
-            
+
             if self.on_selection_change:
                 self.on_selection_change(self.selected_object)
-            
+
+            # 選択のハイライトはレンダリング時にこのセッションにだけ適用される
             self.update_view()
 
     def update_object_property(self, obj_id, property_name, value):
@@ -158,23 +152,8 @@ class Viewer3D(ft.UserControl):
         obj = self.objects[obj_id]
         try:
             value = float(value) if isinstance(obj[property_name], (int, float)) else value
-            obj[property_name] = value
-            
-            # オブジェクトの再生成
-            if obj["type"] == "cube":
-                position = (obj["position_x"], obj["position_y"], obj["position_z"])
-                new_mesh = pv.Cube(center=position, x_length=obj["size"], y_length=obj["size"], z_length=obj["size"])
-            elif obj["type"] == "cylinder":
-                start = (obj["start_x"], obj["start_y"], obj["start_z"])
-                end = (obj["end_x"], obj["end_y"], obj["end_z"])
-                direction = np.array(end) - np.array(start)
-                height = np.linalg.norm(direction)
-                new_mesh = pv.Cylinder(center=start, direction=direction, height=height, radius=obj["radius"])
-            
-            obj["mesh"] = new_mesh
-            self.plotter.add_mesh(new_mesh, color='yellow', opacity=0.8, name=obj_id)
-            self.update_view()
-            
+            # オブジェクトの再生成は共有シーンで行い、全セッションに通知される
+            self.scene.update_object(obj_id, {property_name: value}, origin=self)
         except (ValueError, KeyError):
             print(f"Failed to update property: {property_name}")
 
@@ -184,11 +163,11 @@ class Viewer3D(ft.UserControl):
 
         dx = e.delta_x
         dy = e.delta_y
-        
+
         # カメラの回転
         self.azimuth += dx * 0.5
         self.elevation = max(-89, min(89, self.elevation - dy * 0.5))
-        
+
         self.update_camera()
         self.update_view()
 
@@ -198,7 +177,7 @@ class Viewer3D(ft.UserControl):
             self.camera_distance *= 0.9
         else:
             self.camera_distance *= 1.1
-            
+
         self.camera_distance = max(2.0, min(20.0, self.camera_distance))
         self.update_camera()
         self.update_view()
@@ -210,43 +189,34 @@ class Viewer3D(ft.UserControl):
         x = e.local_x / width
         y = 1.0 - (e.local_y / height)  # PyVistaは下から上が正
 
-        # ピッキング
-        picked = self.plotter.picking_point(x, y)
+        # ピッキング (共有プロッタにこのセッションのカメラを適用してから行う)
+        with self.scene.lock:
+            self.plotter.camera_position = self.camera
+            picked = self.plotter.picking_point(x, y)
         if picked is not None:
             # 最も近いオブジェクトを選択
             closest_obj_id = None
             min_distance = float('inf')
-            
+
             for obj_id, obj in self.objects.items():
                 distance = np.linalg.norm(np.array(picked) - np.array(obj["mesh"].center))
                 if distance < min_distance:
                     min_distance = distance
                     closest_obj_id = obj_id
-            
+
             if closest_obj_id:
                 self.select_object(closest_obj_id)
 
     def remove_object(self, obj_id: str) -> None:
-        if obj_id in self.objects:
-            if self.selected_object and self.selected_object["id"] == obj_id:
-                self.selected_object = None
-            
-            del self.objects[obj_id]
-            self.plotter.remove_actor(obj_id)
-            self.update_view()
-            
+        if self.selected_object and self.selected_object["id"] == obj_id:
+            self.selected_object = None
             if self.on_selection_change:
                 self.on_selection_change(None)
 
+        self.scene.remove_object(obj_id, origin=self)
+
     def restore_object(self, obj_id: str, obj_data: dict) -> None:
-        self.objects[obj_id] = obj_data
-        self.plotter.add_mesh(
-            obj_data["mesh"],
-            color='blue' if obj_data["type"] == "cube" else 'red',
-            opacity=0.8,
-            name=obj_id
-        )
-        self.update_view()
+        self.scene.add_object(obj_data, origin=self)
 
     def handle_key(self, e: ft.KeyboardEvent):
         if e.key == "Delete" and self.selected_object:
@@ -277,46 +247,39 @@ class Viewer3D(ft.UserControl):
             self.update_view()
 
     def update_grid(self):
-        self.plotter.clear_actors()
-        if self.grid_visible:
-            grid = pv.Grid(
-                dimensions=(self.grid_size, self.grid_size, 1),
-                spacing=(self.grid_spacing, self.grid_spacing, self.grid_spacing)
-            )
-            self.plotter.add_mesh(grid, color='gray', opacity=0.5)
-        
-        # オブジェクトの再描画
-        for obj_id, obj in self.objects.items():
-            color = 'yellow' if obj == self.selected_object else ('blue' if obj["type"] == "cube" else 'red')
-            self.plotter.add_mesh(obj["mesh"], color=color, opacity=0.8, name=obj_id)
+        # グリッドの表示/非表示はレンダリング時にセッション毎に切り替える
+        self.update_view()
 
     def toggle_grid(self):
         self.grid_visible = not self.grid_visible
         self.update_grid()
-        self.update_view()
 
     def set_grid_settings(self, size: int = None, spacing: float = None):
-        if size is not None:
-            self.grid_size = max(2, min(50, size))
-        if spacing is not None:
-            self.grid_spacing = max(0.1, min(10.0, spacing))
-        self.update_grid()
-        self.update_view()
+        self.scene.set_grid(size=size, spacing=spacing, origin=self)
+
+    def export_glb(self, path, selection_only: bool = False, quantize: bool = True) -> dict:
+        object_ids = None
+        if selection_only:
+            object_ids = [self.selected_object["id"]] if self.selected_object else []
+        return export_glb(self.objects, path, object_ids=object_ids, quantize=quantize)
 
     def build(self):
-        if self.plotter is None:
+        if self.plotter is None or not self.screenshot_path.exists():
             success = self.initialize_plotter()
             if not success:
                 return ft.Text("Failed to initialize 3D viewer")
-            
+
+        self.image = ft.Image(
+            src=str(self.screenshot_path),
+            src_base64=base64.b64encode(self.screenshot_path.read_bytes()).decode("ascii"),
+            fit=ft.ImageFit.CONTAIN,
+            width=800,
+            height=600,
+        )
+
         return ft.GestureDetector(
             content=ft.Container(
-                content=ft.Image(
-                    src=str(self.screenshot_path),
-                    fit=ft.ImageFit.CONTAIN,
-                    width=800,
-                    height=600,
-                ),
+                content=self.image,
                 border=ft.border.all(1, ft.colors.GREY_400),
                 expand=True
             ),
@@ -325,4 +288,4 @@ class Viewer3D(ft.UserControl):
             on_pan_end=lambda _: setattr(self, 'is_dragging', False),
             on_scroll=self.handle_mouse_wheel,
             on_tap=self.handle_click,
-        ) 
\ No newline at end of file
+        )
@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lib"))
+
+from pipecad.PcfBundle import PcfBundleWriter, PcfBundleReader, BundleFormats
+
+
+# Non-ASCII and over 100 character names need PAX header blocks in tar.
+LINE_NAMES = ["/PIPE-1", "/管道-1", "/" + "L" * 120]
+
+
+@pytest.mark.parametrize("theFormat", BundleFormats())
+def test_bundle_line_names(tmp_path, theFormat):
+    aFileName = str(tmp_path / ("bundle" + theFormat))
+    aWriter = PcfBundleWriter(aFileName)
+    for i, aLine in enumerate(LINE_NAMES):
+        aPcfFile = tmp_path / ("%d.pcf" % i)
+        aPcfFile.write_bytes(("PIPELINE-REFERENCE   " + aLine + "\n").encode("utf-8") * (i + 1))
+        aWriter.AddFile(aLine, str(aPcfFile))
+    # for
+    aWriter.Close()
+
+    aReader = PcfBundleReader(aFileName)
+    try:
+        assert aReader.Lines() == sorted(LINE_NAMES)
+        for i, aLine in enumerate(LINE_NAMES):
+            assert aReader.ReadLine(aLine) == ("PIPELINE-REFERENCE   " + aLine + "\n") * (i + 1)
+        # for
+    finally:
+        aReader.Close()
+    # try
+# test_bundle_line_names